@@ -1,63 +1,558 @@
-from androguard.core.analysis.analysis import Analysis, ClassAnalysis
-from androguard.core.bytecodes.dvm import Instruction, Instruction3rc, Instruction35c
-from tools import APKInfos, MethodInfos, exitError, ExitCode, MethodKeys, SMALI_OBJECT_TYPE, SMALI_BOOLEAN_TYPE, \
-    SMALI_INT_TYPE, SMALI_ARRAY_MARKER, Colors, SMALI_OBJECT_MARKER
+from array import array
+from typing import Callable, Iterable
+
+from androguard.core.bytecodes.dvm import Instruction12x, Instruction10x, Instruction35c, Instruction31i, \
+    Instruction11x, Instruction22x, Instruction32x, Instruction10t, Instruction11n, Instruction20bc, Instruction20t, \
+    Instruction21c, Instruction21h, Instruction21s, Instruction21t, Instruction22b, Instruction22c, Instruction22cs, \
+    Instruction22s, Instruction22t, Instruction23x, Instruction30t, Instruction31c, Instruction31t, Instruction35mi, \
+    Instruction35ms, Instruction3rc, Instruction3rmi, Instruction3rms, Instruction40sc, Instruction41c, Instruction51l, \
+    Instruction52c, Instruction5rc
+from analyser.budget import Budget
+from analyser.flow import FlowGraph
+from analyser.hierarchy import ClassHierarchy
+from analyser.ir import DecodedInstruction
+from analyser.pool import MethodCallInfosType
+from analyser.lattice import Lattice
+from analyser.liveness import RegisterSetType, iterateRegisters, toRegisterSet
+from analyser.opcodes import buildDispatchTable, InstructionHandlerType, OPCODE_COUNT, OPCODE_INVOKE_KINDS, \
+    OPCODE_TRAITS, TRAIT_DIVIDE, TRAIT_GET, TRAIT_OBJECT, TRAIT_PUT, TRAIT_WIDE
+from analyser.registers import RegisterFile, FlaggedRegisterFile
+from analyser.report import ReportSink
+from analyser.ssa import SSAForm, RenamedRegisterFile
+from analyser.typetable import TypeTable, getTypeTable, TYPE_BOOLEAN, TYPE_INT
+from tools import APKInfos, MethodInfos, exitError, ExitCode, SMALI_OBJECT_TYPE, Colors, \
+    SMALI_THROWABLE_TYPE, REPORT_FULL, REPORT_FINAL, REPORT_VERDICT, SMALI_STRING_TYPE, SMALI_INT_TYPE, SMALI_VOID_TYPE, \
+    SMALI_BOOLEAN_TYPE, humanTypeToSmaliType
 
 # Type aliases for analysis
 Analyse1MemoryContentType: type = str or None
-Analyse1SubmemoryType: type = list[Analyse1MemoryContentType]
-Analyse1MemoryType: type = dict[Instruction, Analyse1SubmemoryType]
+Analyse1SubmemoryType: type = RegisterFile
+Analyse1MemoryType: type = dict[int, Analyse1SubmemoryType]
 Analyse1StackContentType: type = str
 Analyse1SubstackType: type = list[Analyse1StackContentType]
-Analyse1StackType: type = dict[Instruction, Analyse1SubstackType]
+Analyse1StackType: type = dict[int, Analyse1SubstackType]
 
 
 Analyse2MemoryContentType: type = tuple[str or None, bool]
-Analyse2SubmemoryType: type = list[Analyse2MemoryContentType]
-Analyse2MemoryType: type = dict[Instruction, Analyse2SubmemoryType]
+Analyse2SubmemoryType: type = FlaggedRegisterFile
+Analyse2MemoryType: type = dict[int, Analyse2SubmemoryType]
 Analyse2StackContentType: type = str
 Analyse2SubstackType: type = list[Analyse2StackContentType]
-Analyse2StackType: type = dict[Instruction, Analyse2SubstackType]
+Analyse2StackType: type = dict[int, Analyse2SubstackType]
 
 # Type union
 AnalyseMemoryContentType: type = Analyse1MemoryContentType or Analyse2MemoryContentType
 AnalyseStackContentType: type = Analyse1StackContentType or Analyse2StackContentType
 AnalyseMemoryType: type = Analyse1MemoryType or Analyse2MemoryType
 AnalyseStackType: type = Analyse1StackType or Analyse2StackType
+AnalyseSubmemoryType: type = Analyse1SubmemoryType or Analyse2SubmemoryType
+AnalyseSubstackType: type = Analyse1SubstackType or Analyse2SubstackType
+# Merge of two values of a register, by the lattice of the analysis
+MergeOperatorType: type = Callable[[int, int], int]
+
+# Predecessor standing for the entry of the method, for the handlers of the first instruction
+METHOD_ENTRY: int = -1
 
-# Type aliases for utility methods
-InvokeType: type = Instruction35c or Instruction3rc
-MethodCallInfosType: type = tuple[str, str, list[str], str]
+# Typecode of the register arrays, the lattices encode the content of the registers as integers
+REGISTER_TYPECODE: str = 'q'
 
 
 class Analyser:
+    __slots__ = ('_mem', '_stack', '_exitMem', '_exitStack', '_dirtyRegisters', '_entryChanges', '_writtenRegisters',
+                 '_currentMemory', '_currentStack', '_caughtTypes', '_apkInfos', '_methodInfos', '_hierarchy', '_types',
+                 '_verbose', '_lastWasInvokeKindOrFillNewArray', '_current', '_report', '_reportMode', '_recording',
+                 '_lattice')
+    # Memory and stack when entering each basic block (keyed by block index)
     _mem: AnalyseMemoryType
     _stack: AnalyseStackType
+    # Memory and stack when leaving each basic block (keyed by block index)
+    _exitMem: AnalyseMemoryType
+    _exitStack: AnalyseStackType
     _apkInfos: APKInfos
     _methodInfos: MethodInfos
-    _analysis: Analysis
     _verbose: bool
+    # Domain of the analysis, plugged by the subclasses
+    _lattice: Lattice
+    # Interned types of the run, with the subtype tests and joins already computed
+    _types: TypeTable
+    _hierarchy: ClassHierarchy
+    # Report of the method, streamed to the report of the class or kept in memory
+    _report: ReportSink
+    # What the report holds (REPORT_FULL, REPORT_FINAL or REPORT_VERDICT), and if the instructions analysed are reported
+    _reportMode: str
+    _recording: bool
 
-    def __init__(self, memory: AnalyseMemoryType, stack: AnalyseStackType, apkInfos: APKInfos, methodInfos: MethodInfos, analysis: Analysis, verbose: bool):
+    def __init__(self, memory: AnalyseMemoryType, stack: AnalyseStackType, apkInfos: APKInfos, methodInfos: MethodInfos, hierarchy: ClassHierarchy, verbose: bool, reportMode: str = REPORT_FULL, report: ReportSink | None = None):
         self._mem = memory
         self._stack = stack
+        self._exitMem = {}
+        self._exitStack = {}
+        # Registers changed in the exit memory of a predecessor since the last merge, for each block
+        self._dirtyRegisters: dict[int, set[int]] = {}
+        # Registers changed by the merge at the entry of the block being analysed, and registers written in it
+        self._entryChanges: set[int] = set()
+        self._writtenRegisters: set[int] = set()
+        # Memory and stack of the instruction being analysed
+        self._currentMemory: AnalyseSubmemoryType = RegisterFile([])
+        self._currentStack: AnalyseSubstackType = []
+        # Types caught by the block being analysed if it is an exception handler (None for catch-all)
+        self._caughtTypes: list[str | None] = []
         self._apkInfos = apkInfos
         self._methodInfos = methodInfos
-        self._analysis = analysis
+        self._hierarchy = hierarchy
+        self._types = getTypeTable(hierarchy)
         self._verbose = verbose
         self._lastWasInvokeKindOrFillNewArray: bool = False
-        self._current: Instruction or None = None
-        self._report = ''
+        self._current: DecodedInstruction or None = None
+        self._report = report if report is not None else ReportSink()
+        self._reportMode = reportMode
+        # In the final mode, the instructions are only reported once the analysis converged
+        self._recording = reportMode == REPORT_FULL
+        self._lattice = Lattice()
+
+    def collect(self) -> str:
+        return self._report.getvalue()
+
+    def getCurrentOffset(self) -> int | None:
+        """
+        :return: The offset of the instruction being analysed, in bytes, None if the analysis didn't start
+        """
+        return self._current.offset if self._current is not None else None
+
+    # SOLVER
+
+    def _newMemory(self, _values: array) -> AnalyseSubmemoryType:
+        """
+        :param _values: The values of the registers, encoded by the lattice of the analysis
+        :return: The register file holding them
+        """
+        return RegisterFile(_values)
+
+    def _initMemoryFirst(self, _block: int) -> None:
+        assert self._current is not None, f'Current instruction is None'
+        # Initialyse memory
+        memory: AnalyseSubmemoryType = self._newMemory(array(REGISTER_TYPECODE, [self._lattice.bottom()] * self._methodInfos.registerCount))
+        # Smali: Last local register is the "this" (ie: current classname)
+        if self._methodInfos.thisRegister is not None:
+            memory[self._methodInfos.thisRegister] = self._lattice.fromType(self._methodInfos.className + ';', True)
+        # Add parameters type after the local registers
+        for index, value in self._methodInfos.parameters:
+            memory[index] = self._lattice.fromType(value, False)
+        stack: AnalyseSubstackType = []
+        self._mem[_block] = memory
+        self._stack[_block] = stack
+
+    def _setMemory(self, _flow: FlowGraph, _block: int, _widen: bool = False) -> bool:
+        """
+        Merge the exit memories of the predecessors of a block into its entry memory.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :param _widen: Widen the registers merged again instead of joining them
+        :return: True if the entry memory of the block changed (the block must be analysed)
+        """
+        # Memory doesn't matter in case of return-void
+        if self._current.name == 'return-void':
+            return True
+
+        # First time we enter the method
+        if len(self._mem.keys()) == 0:
+            self._initMemoryFirst(_block)
+            return True
+        # First time we analyse this block
+        elif _block not in self._mem.keys():
+            # An exception discards the pending results, so exception handlers start with an empty stack
+            handler: bool = _flow.isHandler(_block)
+            merge: MergeOperatorType = self._getMergeOperator(_flow, _block)
+            # Union des predecesseurs
+            memory: AnalyseSubmemoryType or None = None
+            stack: AnalyseSubstackType or None = None
+            for predecessor, predecessorMemory in self._getPredecessorMemories(_flow, _block):
+                if memory is None:
+                    memory = predecessorMemory.copy()
+                    stack = [] if handler else self._exitStack[predecessor].copy()
+                else:
+                    self._mergePredecessor(_flow, predecessor, predecessorMemory, self._getMergedRegisters(_flow, _block, len(memory)), memory, None if handler else stack, merge)
+            if memory is None or stack is None:
+                exitError(f'No predecessor memory or stack for instruction \'{self._current.name}\'', ExitCode.NO_MEMORY)
+            self._clearDeadRegisters(_flow, _block, memory)
+            self._mem[_block] = memory
+            self._stack[_block] = stack
+            # Every register is merged, so the pending changes of the predecessors are already taken into account
+            self._dirtyRegisters.pop(_block, None)
+            return True
+        # We already analysed this block
+        else:
+            memory: AnalyseSubmemoryType = self._mem[_block]
+            stack: AnalyseSubstackType | None = None if _flow.isHandler(_block) else self._stack[_block]
+            # Only the registers changed in the predecessors since the last visit need to be merged again
+            dirtyRegisters: Iterable[int] = self._dirtyRegisters.pop(_block, ())
+            registers: Iterable[int] = self._getMergedRegisters(_flow, _block, len(memory), dirtyRegisters)
+            merge: MergeOperatorType = self._getMergeOperator(_flow, _block, _widen)
+            stackChanged: bool = False
+            for predecessor, predecessorMemory in self._getPredecessorMemories(_flow, _block):
+                stackChanged |= self._mergePredecessor(_flow, predecessor, predecessorMemory, registers, memory, stack, merge)
+            return len(self._entryChanges) > 0 or stackChanged
+
+    def _getPredecessorMemories(self, _flow: FlowGraph, _block: int) -> list[tuple[int, AnalyseSubmemoryType]]:
+        """
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :return: The exit memory of each analysed predecessor of the block, with the index of the predecessor. A handler
+        of the first instruction also receives the memory at the entry of the method (predecessor METHOD_ENTRY)
+        """
+        memories: list[tuple[int, AnalyseSubmemoryType]] = [
+            (predecessor, self._exitMem[predecessor]) for predecessor in _flow.blockPredecessors.get(_block)
+            if predecessor in self._exitMem.keys() and not _flow.isEntryOnlyEdge(predecessor, _block)]
+        if _flow.isEntryHandler(_block) and 0 in self._mem.keys():
+            # The predecessors of the first instruction are predecessors of the handler too, so the entry memory of the
+            # entry block only adds the memory at the entry of the method
+            memories.append((METHOD_ENTRY, self._mem[0]))
+        return memories
+
+    def _mergePredecessor(self, _flow: FlowGraph, _predecessor: int, _predecessorMemory: AnalyseSubmemoryType, _registers: Iterable[int], memory: AnalyseSubmemoryType, stack: AnalyseSubstackType | None, _merge: MergeOperatorType) -> bool:
+        """
+        Merge the exit memory and stack of a predecessor block into the given memory and stack (in place).
+        The registers whose content changed are added to the entry changes of the block.
+        :param _flow: The control flow graph of the method
+        :param _predecessor: The index of the predecessor block, METHOD_ENTRY for the entry of the method
+        :param _predecessorMemory: The exit memory of the predecessor
+        :param _registers: The indexes of the registers to merge
+        :param memory: The memory to merge into
+        :param stack: The stack to merge into, None to leave it (exception handlers start with an empty stack)
+        :param _merge: The merge of the registers
+        :return: True if the stack changed
+        """
+        if len(_predecessorMemory) != len(memory):
+            exitError(f'Memory size mismatch between \'{_flow.getBlockLast(_predecessor).name}\' and \'{self._current.name}\'', ExitCode.MEMORY_ERROR)
+        self._mergeRegisters(_predecessorMemory, _registers, memory, _merge)
+        stackChanged: bool = False
+        if stack is None:
+            return stackChanged
+        predecessorStack: AnalyseSubstackType = self._exitStack[_predecessor]
+        if len(stack) != len(predecessorStack):
+            exitError(f'Stack size mismatch between \'{_flow.getBlockLast(_predecessor).name}\' and \'{self._current.name}\'', ExitCode.MEMORY_ERROR)
+        for index, value in enumerate(predecessorStack):
+            merged: AnalyseStackContentType = self._compatibleType(stack[index], value)
+            if merged != stack[index]:
+                stack[index] = merged
+                stackChanged = True
+        return stackChanged
+
+    def _getMergeOperator(self, _flow: FlowGraph, _block: int, _widen: bool = False) -> MergeOperatorType:
+        """
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :param _widen: Widen the registers instead of joining them
+        :return: The merge of the registers at the entry of the block
+        """
+        # An exception may be thrown before a register is written, so the handlers accept empty registers
+        if _flow.isHandler(_block):
+            return self._lattice.joinAtHandler
+        return self._lattice.widen if _widen else self._lattice.join
+
+    def _mergeRegisters(self, _predecessorMemory: AnalyseSubmemoryType, _registers: Iterable[int], memory: AnalyseSubmemoryType, _merge: MergeOperatorType) -> None:
+        """
+        Merge registers of the exit memory of a predecessor into the given memory (in place), adding the registers whose
+        content changed to the entry changes of the block.
+        :param _predecessorMemory: The exit memory of the predecessor
+        :param _registers: The indexes of the registers to merge
+        :param memory: The memory to merge into
+        :param _merge: The merge of the registers
+        """
+        for index in _registers:
+            merged: AnalyseMemoryContentType = _merge(memory[index], _predecessorMemory[index])
+            if merged != memory[index]:
+                memory[index] = merged
+                self._entryChanges.add(index)
+
+    @staticmethod
+    def _getMergedRegisters(_flow: FlowGraph, _block: int, _count: int, _registers: Iterable[int] | None = None) -> Iterable[int]:
+        """
+        Select the registers to merge at the entry of a block: the candidates, or only the live ones if the liveness
+        analysis was run. The live registers are walked from the bits of their set.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :param _count: The number of registers of the method
+        :param _registers: The indexes of the candidate registers, None for all of them
+        :return: The indexes of the registers to merge
+        """
+        if _flow.liveRegisters is None:
+            return range(_count) if _registers is None else _registers
+        # The invalid register operands are reported when their instruction is analysed
+        live: RegisterSetType = _flow.liveRegisters[_block] & ((1 << _count) - 1)
+        if _registers is not None:
+            live &= toRegisterSet(_registers)
+        # Merged once for each predecessor
+        return list(iterateRegisters(live))
+
+    def _clearDeadRegisters(self, _flow: FlowGraph, _block: int, memory: AnalyseSubmemoryType) -> None:
+        """
+        Empty the dead registers of the entry memory of a block, so only the live registers are stored and merged.
+        A dead register is written before being read in the block, so a type conflict on it between the predecessors
+        isn't reported. Nothing is done if the liveness analysis wasn't run.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :param memory: The entry memory of the block (emptied in place)
+        """
+        if _flow.liveRegisters is None:
+            return
+        bottom: AnalyseMemoryContentType = self._lattice.bottom()
+        for index in iterateRegisters(~_flow.liveRegisters[_block] & ((1 << len(memory)) - 1)):
+            memory[index] = bottom
+
+    def _analyseBlock(self, _flow: FlowGraph, _block: int, _widen: bool = False) -> bool:
+        """
+        Analyse a basic block: the predecessors are merged once at the entry of the block, then every instruction is
+        analysed on a working copy of the memory, which becomes the exit memory of the block.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block to analyse
+        :param _widen: Widen the entry memory of the block (loop head visited too many times)
+        :return: True if the entry memory of the block changed (the successors must be analysed again)
+        """
+        leader: DecodedInstruction = _flow.getBlockLeader(_block)
+        self._current = leader
+        self._entryChanges = set()
+        self._writtenRegisters = set()
+        self._caughtTypes = _flow.getCaughtTypes(_block)
+
+        if self._verbose:
+            self._printInstruction(leader)
+        self._instructionReport(leader)
+
+        if not self._setMemory(_flow, _block, _widen):
+            return False
+
+        # Memory doesn't matter in case of return-void, so the block may have no entry memory
+        self._currentMemory = self._mem[_block].copy() if _block in self._mem else RegisterFile([])
+        self._currentStack = self._stack[_block].copy() if _block in self._stack else []
+
+        self._analyseInstructions(_flow.getBlockInstructions(_block))
 
-    def analyse(self, instruction: Instruction, **kwargs) -> bool:
-        exitError('Method `analyse()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
-        # Placeholder return to please the linter
+        self._propagateExitChanges(_flow, _block)
+        self._exitMem[_block] = self._currentMemory
+        self._exitStack[_block] = self._currentStack
         return True
 
-    def collect(self) -> str:
-        exitError('Method `collect()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
-        # Placeholder return to please the linter
-        return ''
+    def reportFinalStates(self, _flow: FlowGraph) -> None:
+        """
+        In the final report mode, report the converged state of each instruction once the fixpoint is reached: every
+        analysed block is analysed again from its entry memory, in the order of the method, with the report enabled.
+        :param _flow: The control flow graph of the method
+        """
+        if self._reportMode != REPORT_FINAL:
+            return
+        self._recording = True
+        for block in range(_flow.blockCount()):
+            if block not in self._exitMem:
+                continue
+            leader: DecodedInstruction = _flow.getBlockLeader(block)
+            self._current = leader
+            self._caughtTypes = _flow.getCaughtTypes(block)
+            if self._verbose:
+                self._printInstruction(leader)
+            self._instructionReport(leader)
+            # Memory doesn't matter in case of return-void, so the block may have no entry memory
+            self._currentMemory = self._mem[block].copy() if block in self._mem else RegisterFile([])
+            self._currentStack = self._stack[block].copy() if block in self._stack else []
+            self._analyseInstructions(_flow.getBlockInstructions(block))
+        self._recording = False
+
+    def _propagateExitChanges(self, _flow: FlowGraph, _block: int) -> None:
+        """
+        Mark the registers whose exit content changed as dirty in the successors of a block.
+        Only the registers changed at the entry of the block or written in it can differ from the previous exit memory.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        """
+        previousMemory: AnalyseSubmemoryType | None = self._exitMem.get(_block)
+        if previousMemory is None or len(previousMemory) != len(self._currentMemory):
+            changes: set[int] = set(range(len(self._currentMemory)))
+        else:
+            changes: set[int] = {index for index in self._entryChanges | self._writtenRegisters
+                                 if previousMemory[index] != self._currentMemory[index]}
+        if len(changes) == 0:
+            return
+        for successor in _flow.blockSuccessors.get(_block):
+            self._dirtyRegisters.setdefault(successor, set()).update(changes)
+
+    def analyseStraightLine(self, _instructions: list[DecodedInstruction], _budget: Budget | None = None) -> None:
+        """
+        Analyse a method without any branch in a single forward pass: there is no predecessor to merge, so the
+        memory of the method entry is updated in place.
+        :param _instructions: The instructions of the method, up to its first return or throw
+        :param _budget: The limits of the analysis, the pass counting as the single visit of the only block
+        """
+        if _budget is not None:
+            _budget.start()
+            _budget.check(1)
+        leader: DecodedInstruction = _instructions[0]
+        self._current = leader
+        # Each instruction is analysed once, already in its final state
+        self._recording = self._reportMode != REPORT_VERDICT
+
+        if self._verbose:
+            self._printInstruction(leader)
+        self._instructionReport(leader)
+
+        # Memory doesn't matter in case of return-void
+        if leader.name != 'return-void':
+            self._initMemoryFirst(0)
+            self._currentMemory = self._mem[0]
+            self._currentStack = self._stack[0]
+
+        self._analyseInstructions(_instructions)
+
+    def _analyseInstructions(self, _instructions: list[DecodedInstruction], _registers: RenamedRegisterFile | None = None) -> None:
+        """
+        Analyse instructions in order on the working memory, the first one being already reported.
+        :param _instructions: The instructions to analyse
+        :param _registers: The renamed registers in sparse mode: the definitions of each instruction are reported
+        instead of the whole memory
+        """
+        for index, instruction in enumerate(_instructions):
+            if index > 0:
+                self._current = instruction
+                if self._verbose:
+                    self._printInstruction(instruction)
+                self._instructionReport(instruction)
+
+            if _registers is None and instruction.op != 0x0e:
+                if self._verbose:
+                    self._printMemory()
+                if self._recording:
+                    self._memoryReport()
+
+            self._analyseInstruction(instruction)
+
+            if _registers is not None:
+                self._definitionsReport('Definitions', _registers.popDefinitions())
+
+    def analyseSparse(self, _ssa: SSAForm, _budget: Budget | None = None) -> int:
+        """
+        Analyse a method in SSA form: the instructions are analysed along the dominator tree, each register holding the
+        content of its last definition, and the predecessors are only merged in the phis.
+        The tree is walked again as long as a back edge changes a phi.
+        :param _ssa: The SSA form of the method
+        :param _budget: The limits of the analysis, each walk counting as a visit of every block
+        :return: The number of walks of the dominator tree
+        """
+        flow: FlowGraph = _ssa.flow
+        if flow.blockCount() == 0:
+            return 0
+        if _budget is not None:
+            _budget.start()
+        self._current = flow.getBlockLeader(0)
+        self._initMemoryFirst(0)
+        initial: list[AnalyseMemoryContentType] = list(self._mem[0])
+        # Content of the phis (keyed by block and register), the method entry being a predecessor of the entry block and
+        # of the handlers of its first instruction
+        phis: dict[tuple[int, int], AnalyseMemoryContentType] = {
+            (block, register): initial[register] for block in range(flow.blockCount()) if block == 0 or flow.isEntryHandler(block)
+            for register in _ssa.phis[block]}
+        walks: int = 1
+        while self._walkDominatorTree(_ssa, initial, phis, walks, _budget):
+            walks += 1
+        # The last walk changed nothing: walking the tree again reports the converged state of each instruction
+        if self._reportMode == REPORT_FINAL:
+            self._recording = True
+            self._walkDominatorTree(_ssa, initial, phis, walks + 1, None)
+            self._recording = False
+        return walks
+
+    def _walkDominatorTree(self, _ssa: SSAForm, _initial: list[AnalyseMemoryContentType], _phis: dict[tuple[int, int], AnalyseMemoryContentType], _walk: int, _budget: Budget | None) -> bool:
+        """
+        Analyse every reachable block once, in dominator tree preorder, so the definitions reaching a block without
+        phi are the ones of its dominators.
+        :param _ssa: The SSA form of the method
+        :param _initial: The memory at the entry of the method
+        :param _phis: The content of the phis, updated in place
+        :param _walk: The number of the walk, starting at 1
+        :param _budget: The limits of the analysis
+        :return: True if a phi or a stack of an already analysed block changed (the tree must be walked again)
+        """
+        flow: FlowGraph = _ssa.flow
+        registers: RenamedRegisterFile = RenamedRegisterFile(_initial)
+        self._currentMemory = registers
+        visited: bytearray = bytearray(flow.blockCount())
+        changed: bool = False
+        widen: bool = _budget is not None and _budget.widens(_walk)
+        # Each entry holds a block and, once the block is analysed, the mark to restore when leaving its subtree
+        todo: list[tuple[int, int]] = [(0, -1)]
+        while len(todo) > 0:
+            block, mark = todo.pop()
+            if mark >= 0:
+                registers.restore(mark)
+                continue
+            if _budget is not None:
+                _budget.check(_walk)
+            visited[block] = 1
+            todo.append((block, registers.mark()))
+
+            leader: DecodedInstruction = flow.getBlockLeader(block)
+            self._current = leader
+            self._caughtTypes = flow.getCaughtTypes(block)
+            if self._verbose:
+                self._printInstruction(leader)
+            self._instructionReport(leader)
+
+            self._currentStack = self._mergeSparseStacks(flow, block)
+            for register in _ssa.phis[block]:
+                if (block, register) in _phis:
+                    registers[register] = _phis[(block, register)]
+            self._definitionsReport('Phis', registers.popDefinitions())
+
+            self._analyseInstructions(flow.getBlockInstructions(block), registers)
+
+            if self._exitStack.get(block, []) != self._currentStack:
+                changed |= any(visited[successor] for successor in flow.blockSuccessors.get(block))
+            self._exitStack[block] = self._currentStack
+            for successor in flow.blockSuccessors.get(block):
+                # Memory doesn't matter in case of return-void, and the handlers of the first instruction receive the
+                # memory at the entry of the method, already in their phis
+                if flow.getBlockLeader(successor).name == 'return-void' or flow.isEntryOnlyEdge(block, successor):
+                    continue
+                for register in _ssa.phis[successor]:
+                    value: AnalyseMemoryContentType = registers[register]
+                    if (successor, register) in _phis:
+                        # An exception may be thrown before a register is written, so the handlers accept empty registers
+                        if flow.isHandler(successor):
+                            value = self._lattice.joinAtHandler(_phis[(successor, register)], value)
+                        elif widen:
+                            value = self._lattice.widen(_phis[(successor, register)], value)
+                        else:
+                            value = self._lattice.join(_phis[(successor, register)], value)
+                        if value == _phis[(successor, register)]:
+                            continue
+                    _phis[(successor, register)] = value
+                    changed |= visited[successor] == 1
+            for child in reversed(_ssa.children[block]):
+                todo.append((child, -1))
+        return changed
+
+    def _mergeSparseStacks(self, _flow: FlowGraph, _block: int) -> AnalyseSubstackType:
+        """
+        Merge the exit stacks of the analysed predecessors of a block, as the dense analysis does.
+        :param _flow: The control flow graph of the method
+        :param _block: The index of the block
+        :return: The entry stack of the block
+        """
+        # Memory doesn't matter in case of return-void, and an exception discards the pending results
+        if _flow.getBlockLeader(_block).name == 'return-void' or _flow.isHandler(_block):
+            return []
+        # The stack is empty at the start of the method
+        stack: AnalyseSubstackType | None = [] if _block == 0 else None
+        for predecessor in _flow.blockPredecessors.get(_block):
+            predecessorStack: AnalyseSubstackType | None = self._exitStack.get(predecessor)
+            if predecessorStack is None:
+                continue
+            elif stack is None:
+                stack = predecessorStack.copy()
+            else:
+                if len(stack) != len(predecessorStack):
+                    exitError(f'Stack size mismatch between \'{_flow.getBlockLast(predecessor).name}\' and \'{self._current.name}\'', ExitCode.MEMORY_ERROR)
+                for index, value in enumerate(predecessorStack):
+                    stack[index] = self._compatibleType(stack[index], value)
+        return stack if stack is not None else []
 
     # CHECKERS
 
@@ -67,7 +562,7 @@ class Analyser:
         :param _registerIndex: The register number
         :return: Boolean
         """
-        return _registerIndex < self._methodInfos[MethodKeys.LOCALREGISTERCOUNT] + self._methodInfos[MethodKeys.PARAMETERCOUNT]
+        return _registerIndex < self._methodInfos.registerCount
 
     def _isValidLocalRegisterNumber(self, _registerIndex: int) -> bool:
         """
@@ -75,19 +570,24 @@ class Analyser:
         :param _registerIndex: The register number
         :return: Boolean
         """
-        return _registerIndex < self._methodInfos[MethodKeys.LOCALREGISTERCOUNT]
+        return _registerIndex < self._methodInfos.localRegisterCount
 
-    @staticmethod
-    def _isArray(_type: str) -> bool:
-        return _type.startswith(SMALI_ARRAY_MARKER)
+    def _isArray(self, _type: str) -> bool:
+        return self._types.dimensions[self._types.intern(_type)] > 0
+
+    def _isPrimitive(self, _type: str | None) -> bool:
+        return self._types.primitives[self._types.intern(_type)] == 1
+
+    def _isObject(self, _type: str | None) -> bool:
+        return self._types.objects[self._types.intern(_type)] == 1
 
     @staticmethod
-    def _isValidPrimitiveType(_first: str, _second: str) -> bool:
+    def _isValidPrimitiveType(_first: int, _second: int) -> bool:
         # Special case for boolean, because int can be interpreted as booleans
-        if _first == SMALI_BOOLEAN_TYPE:
-            return _second in (SMALI_BOOLEAN_TYPE, SMALI_INT_TYPE)
-        elif _second == SMALI_BOOLEAN_TYPE:
-            return _first in (SMALI_BOOLEAN_TYPE, SMALI_INT_TYPE)
+        if _first == TYPE_BOOLEAN:
+            return _second == TYPE_BOOLEAN or _second == TYPE_INT
+        elif _second == TYPE_BOOLEAN:
+            return _first == TYPE_BOOLEAN or _first == TYPE_INT
         else:
             return _first == _second
 
@@ -98,6 +598,27 @@ class Analyser:
         :param _superclassName: The superclass name
         :return: boolean
         """
+        return self._isSubtype(self._types.intern(_className), self._types.intern(_superclassName))
+
+    def _isSubtype(self, _type: int, _supertype: int) -> bool:
+        """
+        Method to find if a type is a subtype of another one, the result being kept in the type table
+        :param _type: The identifier of the subtype
+        :param _supertype: The identifier of the supertype
+        :return: boolean
+        """
+        subtype: bool | None = self._types.subtypes.get((_type, _supertype))
+        if subtype is None:
+            subtype = self._types.subtypes[(_type, _supertype)] = self._searchSuperclass(self._types.descriptors[_type], self._types.descriptors[_supertype])
+        return subtype
+
+    def _searchSuperclass(self, _className: str, _superclassName: str) -> bool:
+        """
+        Look up the class hierarchy to find if a class is a subclass of another one
+        :param _className: The subclass name
+        :param _superclassName: The superclass name
+        :return: boolean
+        """
 
         # If the superclass is Object, return True (all classes implement Object)
         if _superclassName == SMALI_OBJECT_TYPE:
@@ -109,116 +630,1070 @@ class Analyser:
         if _className == _superclassName:
             return True
 
-        # TODO Comment
-        todo: set[str] = set()
-        todo.add(_className)
-        done: set[str] = set()
-        while len(todo) > 0:
-            curr = todo.pop()
-            if curr not in done and curr != SMALI_OBJECT_TYPE:
-                _a: ClassAnalysis = self._analysis.get_class_analysis(curr)
-                done.add(curr)
-                if _a is not None:
-                    todo.add(_a.extends)
-                    [todo.add(x) for x in _a.implements]
-                else:
-                    # TODO Better analysis
-                    if self._verbose:
-                        print(f'{Colors.WARNING}Couldn\'t find analysis for \'{curr}\', defaulting return to True{Colors.ENDC}')
-                    return True
-        return _superclassName in done
+        missing: str | None = self._hierarchy.getMissingAncestor(_className)
+        if missing is not None:
+            # TODO Better analysis
+            if self._verbose:
+                print(f'{Colors.WARNING}Couldn\'t find class \'{missing}\' in the APK or the framework, defaulting return to True{Colors.ENDC}')
+            return True
+        return _superclassName in self._hierarchy.getAncestors(_className)
 
     # GETTERS
 
-    def _putRegisterContent(self, _registerIndex: int, _value: AnalyseMemoryContentType) -> None:
-        exitError('Method `_putRegisterContent()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+    def _putRegisterType(self, _registerIndex: int, _type: str | None, _initialised: bool) -> None:
+        """
+        Write a value of a given type in a register
+        :param _registerIndex: The index of the register
+        :param _type: The type of the value
+        :param _initialised: If the value is an initialised object (ignored by the analyses which don't track it)
+        """
+        assert self._current is not None, f'Current instruction is None'
+        self._currentMemory[_registerIndex] = self._lattice.fromType(_type, _initialised)
+        self._writtenRegisters.add(_registerIndex)
 
-    def _getRegisterContent(self, _registerIndex: int) -> Analyse1MemoryContentType:
-        exitError('Method `_getRegisterContent()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
-        # Placeholder return to please linter
-        return ''
+    def _getRegisterType(self, _registerIndex: int) -> str | None:
+        """
+        Return the type of the content of a register given its index
+        :param _registerIndex: The index of the register
+        :return: The type of the content of the register, None if empty
+        """
+        return self._lattice.toType(self._getRegisterValue(_registerIndex))
+
+    def _getRegisterValue(self, _registerIndex: int) -> int:
+        """
+        Return the value of a register given its index, as encoded by the lattice of the analysis
+        :param _registerIndex: The index of the register
+        :return: The value of the register
+        """
+        assert self._current is not None, f'Current instruction is None'
+        if not self._isValidRegisterNumber(_registerIndex):
+            exitError(f'Invalid register index \'{_registerIndex}\'', ExitCode.INVALID_REGISTER_INDEX)
+        return self._currentMemory[_registerIndex]
 
     def _putStack(self, _value: AnalyseStackContentType) -> None:
-        exitError('Method `_putStack()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        assert self._current is not None, f'Current instruction is None'
+        self._currentStack.append(_value)
 
     def _popStack(self) -> AnalyseStackContentType:
-        exitError('Method `_popStack()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
-        # Placeholder return to please linter
-        return ''
+        assert self._current is not None, f'Current instruction is None'
+        return self._currentStack.pop()
 
     # ANALYSIS
 
-    @staticmethod
-    def _unhandled(_instruction: Instruction) -> None:
+    def _unhandled(self, _instruction: DecodedInstruction) -> None:
         """
         Method called when an instruction is not handled
         :param _instruction: The instruction that isn't handled
         """
-        exitError(f'Unhandled instruction type \'{type(_instruction).__name__}\'', ExitCode.UNHANDLED_INSTRUCTION)
+        exitError(f'Unhandled instruction type \'{_instruction.format}\'', ExitCode.UNHANDLED_INSTRUCTION)
 
-    def _useless(self, _instruction: Instruction) -> None:
+    def _useless(self, _instruction: DecodedInstruction) -> None:
         """
         Method called when an instruction shouldn't be analysed
         :param _instruction: The instruction
         """
         if self._verbose:
-            print(f'Instruction \'{_instruction.get_name()}\' (OP: {hex(_instruction.get_op_value())}) shouldn\'t be analysed')
+            print(f'Instruction \'{_instruction.name}\' (OP: {hex(_instruction.op)}) shouldn\'t be analysed')
+
+    # INITIALISATION
+
+    def _checkInitialised(self, _registerIndex: int) -> None:
+        """
+        Check that the object of a register is initialised before it is used. Only analysis 2 tracks the initialisation
+        of the objects, the other analyses accept every object.
+        :param _registerIndex: The index of the register
+        """
+
+    def _initialiseObject(self, _registerIndex: int) -> None:
+        """
+        Mark the object of a register as initialised, after a call to its constructor
+        :param _registerIndex: The index of the register
+        """
+
+    # TRANSFER FUNCTIONS
+
+    # DONE
+    def _analyse10x(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        match _instruction.name:
+            case 'return-void':
+                if self._methodInfos.returnType != SMALI_VOID_TYPE:
+                    exitError(f'Instruction \'{_instruction.format}\' (return-void) is not in a void method',
+                              ExitCode.RETURN_VOID_INSIDE_NON_VOID_METHOD)
+            case 'nop' as _nop:
+                self._useless(_nop)
+            case _error:
+                exitError(f'Instruction \'{_instruction.format}\' is not a valid instruction10x',
+                          ExitCode.INVALID_INSTRUCTION)
+
+    # Done
+    # TODO Comment
+    def _analyse11n(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        registerIndex: int = _instruction.A
+        if not self._isValidLocalRegisterNumber(registerIndex):
+            self._Error_invalidRegisterNumber(_instruction, registerIndex)
+        # self._mem[registerIndex] = SMALI_INT_TYPE
+        self._putRegisterType(registerIndex, SMALI_INT_TYPE, False)
+
+    # TODO
+    def _analyse35c(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = True
+        op: int = _instruction.op
+        match OPCODE_INVOKE_KINDS[op]:
+            case 'direct' | 'virtual' | 'super' | 'interface':
+                # Retrieved the parameters
+                providedParameters: list[int] = self._getVariadicProvidedParameters(_instruction)
+                # Extract the 'this' register (first one)
+                thisRegisterIndex: int = providedParameters.pop(0)
+                thisRegisterContent: str = self._getRegisterType(thisRegisterIndex)
+                # Decompose the called method
+                calledMethodClass, calledMethodName, calledMethodParameters, calledMethodReturn = _instruction.method
+
+                # Check if the class is a subclass of the class containing the called method
+                if not self._isSubclass(thisRegisterContent, calledMethodClass):
+                    exitError(f'Class {thisRegisterContent} is not a subclass of {calledMethodClass}',
+                              ExitCode.INVALID_SUBCLASS)
+
+                # Check if the called method is a constructor
+                if calledMethodName == '<init>':
+                    self._initialiseObject(thisRegisterIndex)
+                else:
+                    self._checkInitialised(thisRegisterIndex)
+
+                # Check if the number of paramters is correct
+                if len(providedParameters) != len(calledMethodParameters):
+                    exitError(
+                        f'Method {calledMethodName} requires {len(calledMethodParameters)}, but {len(providedParameters)} given',
+                        ExitCode.PARAMETER_COUNT_MISMATCH)
+
+                # Check parameters consistency
+                for parameterIndex, parameterRegisterIndex in enumerate(providedParameters):
+                    # Check if the register number is valid
+                    if not self._isValidRegisterNumber(parameterRegisterIndex):
+                        self._Error_invalidRegisterNumber(_instruction, parameterRegisterIndex)
+                    # Check if the content of the given register match the parameter type
+                    parameterRegisterContent = self._getRegisterType(parameterRegisterIndex)
+                    # Check if the content of the register is a valid subtype of the parameter type
+                    self._validateParameterType(parameterRegisterIndex, parameterRegisterContent,
+                                                calledMethodParameters[parameterIndex])
+
+                # If the method doesn't return void, push the return value to the stack
+                if calledMethodReturn != SMALI_VOID_TYPE:
+                    # self._stack.append(calledMethodReturn)
+                    self._putStack(calledMethodReturn)
+            case 'static':
+                # Retrieved the parameters
+                providedParameters: list[int] = self._getVariadicProvidedParameters(_instruction)
+                # Decompose the called method
+                calledMethodClass, calledMethodName, calledMethodParameters, calledMethodReturn = _instruction.method
+
+                # Check if the number of paramters is correct
+                if len(providedParameters) != len(calledMethodParameters):
+                    exitError(
+                        f'Method {calledMethodName} requires {len(calledMethodParameters)}, but {len(providedParameters)} given',
+                        ExitCode.PARAMETER_COUNT_MISMATCH)
+
+                # Check parameters consistency
+                for parameterIndex, parameterRegisterIndex in enumerate(providedParameters):
+                    # Check if the register number is valid
+                    if not self._isValidRegisterNumber(parameterRegisterIndex):
+                        self._Error_invalidRegisterNumber(_instruction, parameterRegisterIndex)
+                    # Check if the content of the given register match the parameter type
+                    parameterRegisterContent = self._getRegisterType(parameterRegisterIndex)
+                    # Check if the content of the register is a valid subtype of the parameter type
+                    self._validateParameterType(parameterRegisterIndex, parameterRegisterContent,
+                                                calledMethodParameters[parameterIndex])
+
+                # If the method doesn't return void, push the return value to the stack
+                if calledMethodReturn != SMALI_VOID_TYPE:
+                    # self._stack.append(calledMethodReturn)
+                    self._putStack(calledMethodReturn)
+            # filled-new-array
+            case None if op == 0x24:
+                # Retrieved the parameters
+                providedParameters: list[int] = self._getVariadicProvidedParameters(_instruction)
+                # Get the array type
+                arrayType: str = _instruction.type
+                arrayContentType: str = arrayType[1:]
+
+                for registerIndex in providedParameters:
+                    # Check if the register number is valid
+                    if not self._isValidRegisterNumber(registerIndex):
+                        self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                    # Get the content of the current register
+                    registerContent: str = self._getRegisterType(registerIndex)
+                    # Check if the content of the register is a valid subtype of the array type
+                    self._validateParameterType(registerIndex, registerContent, arrayContentType)
+                # Put the result object onto the stack
+                # self._stack.append(arrayType)
+                self._putStack(arrayType)
+            # TODO
+            case _:
+                exitError(f'Unhandled instruction35c subtype \'{_instruction.name}\'', ExitCode.UNHANDLED_CASE)
+
+    # TODO
+    def _analyse21c(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        # Get the destination register index
+        registerIndex: int = _instruction.AA
+        op: int = _instruction.op
+        match op:
+            # check-cast
+            case 0x1f:
+                # Check that the register is a valid register
+                if not self._isValidLocalRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                # Check if the content of the register is not a primitive type or is initialized
+                if self._isPrimitive(self._getRegisterType(registerIndex)) or self._getRegisterType(registerIndex) is None:
+                    exitError(f'Instruction \'{_instruction.format}\' (check-cast) is a primitive value, not reference-bearing', ExitCode.CHECKCAST_AGAINST_PRIMITIVE_OR_NONE)
+                # Cast the argument to the given type (raise an error otherwise)
+                # self._mem[registerIndex] = _instruction.cm.get_type(_instruction.BBBB)
+                self._putRegisterType(registerIndex, _instruction.type, True)
+            # const-string
+            case 0x1a:
+                # Check that the register is a valid register
+                if not self._isValidLocalRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                # Put string into the corresponding register
+                # self._mem[registerIndex] = SMALI_STRING_TYPE
+                self._putRegisterType(registerIndex, SMALI_STRING_TYPE, True)
+            # new-instance, const-class
+            case 0x22 | 0x1c:
+                # Get the register index
+                registerIndex: int = _instruction.AA
+                # Check that the register is a valid register
+                if not self._isValidLocalRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                itemType: str = _instruction.type
+                if op == 0x22 and self._isArray(itemType):
+                    exitError(f'Type provided tp \'new-instance\' instruction is {itemType}, which is an array type',
+                              ExitCode.NEW_INSTANCE_AGAINST_ARRAY)
+                # self._mem[registerIndex] = itemType
+                self._putRegisterType(registerIndex, itemType, False)
+            # sget
+            case _ if OPCODE_TRAITS[op] & TRAIT_GET:
+                # Get the register index
+                registerIndex: int = _instruction.AA
+                # Check that the register is a valid register
+                if OPCODE_TRAITS[op] & TRAIT_WIDE:
+                    if not self._isValidLocalRegisterNumber(registerIndex + 1):
+                        self._Error_invalidRegisterNumber(_instruction, registerIndex + 1)
+                else:
+                    if not self._isValidLocalRegisterNumber(registerIndex):
+                        self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                _, fieldType, _ = _instruction.field
+                self._putRegisterType(registerIndex, fieldType, True)
+                if OPCODE_TRAITS[op] & TRAIT_WIDE:
+                    self._putRegisterType(registerIndex + 1, fieldType, True)
+            # sput
+            case _ if OPCODE_TRAITS[op] & TRAIT_PUT:
+                registerIndex = _instruction.AA
+                if OPCODE_TRAITS[op] & TRAIT_WIDE:
+                    if not self._isValidRegisterNumber(registerIndex + 1):
+                        self._Error_invalidRegisterNumber(_instruction, registerIndex + 1)
+                    if self._getRegisterType(registerIndex) != self._getRegisterType(registerIndex + 1):
+                        exitError(f'Type provided to \'put-wide\' instruction is {self._getRegisterType(registerIndex)} and {self._getRegisterType(registerIndex + 1)}, which are different', ExitCode.INVALID_REGISTER_TYPE)
+                else:
+                    if not self._isValidRegisterNumber(registerIndex):
+                        self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                if self._isObject(self._getRegisterType(registerIndex)):
+                    self._checkInitialised(registerIndex)
+                _, fieldType, _ = _instruction.field
+                if self._getRegisterType(registerIndex) != fieldType:
+                    exitError(f'Type provided to \'put\' instruction is {self._getRegisterType(registerIndex)}, which is not the same as the field type {fieldType}', ExitCode.INVALID_REGISTER_TYPE)
+            # TODO
+            case _:
+                exitError(f'Unhandled instruction21c subtype \'{_instruction.name}\'', ExitCode.UNHANDLED_CASE)
+
+    # Done
+    # TODO Comment
+    def _analyse31i(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        registerIndex: int = _instruction.AA
+        # const-wide/32 write on a pair of registers
+        if _instruction.op == 0x17:
+            if not self._isValidLocalRegisterNumber(registerIndex + 1):
+                exitError(
+                    f'Instruction \'{_instruction.format}\' uses invalid register number pair ({registerIndex}, {registerIndex + 1})',
+                    ExitCode.INVALID_REGISTER_INDEX)
+            # self._mem[registerIndex] = SMALI_INT_TYPE
+            # self._mem[registerIndex + 1] = SMALI_INT_TYPE
+            self._putRegisterType(registerIndex, SMALI_INT_TYPE, False)
+            self._putRegisterType(registerIndex + 1, SMALI_INT_TYPE, False)
+        else:
+            if not self._isValidLocalRegisterNumber(registerIndex):
+                self._Error_invalidRegisterNumber(_instruction, registerIndex)
+            # self._mem[registerIndex] = SMALI_INT_TYPE
+            self._putRegisterType(registerIndex, SMALI_INT_TYPE, False)
+
+    def _analyse21s(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        registerIndex: int = _instruction.AA
+        # const-wide/16 write on a pair of registers
+        if _instruction.op == 0x16:
+            if not self._isValidLocalRegisterNumber(registerIndex + 1):
+                exitError(
+                    f'Instruction \'{_instruction.format}\' uses invalid register number pair ({registerIndex}, {registerIndex + 1})',
+                    ExitCode.INVALID_REGISTER_INDEX)
+            # self._mem[registerIndex] = SMALI_INT_TYPE
+            # self._mem[registerIndex + 1] = SMALI_INT_TYPE
+            self._putRegisterType(registerIndex, SMALI_INT_TYPE, False)
+            self._putRegisterType(registerIndex + 1, SMALI_INT_TYPE, False)
+        else:
+            if not self._isValidLocalRegisterNumber(registerIndex):
+                self._Error_invalidRegisterNumber(_instruction, registerIndex)
+            # self._mem[registerIndex] = SMALI_INT_TYPE
+            self._putRegisterType(registerIndex, SMALI_INT_TYPE, False)
+
+    # TODO
+    def _analyse11x(self, _instruction: DecodedInstruction) -> None:
+        # Get the register index
+        registerIndex: int = _instruction.AA
+        op: int = _instruction.op
+        match op:
+            # move-result-object, move-result
+            case 0x0c | 0x0a:
+                # Check if the last instruction was an invoke-kind or fill-new-array
+                if not self._lastWasInvokeKindOrFillNewArray:
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' is not preceded by an invoke-kind or fill-new-array instruction',
+                        ExitCode.MISSING_INVOKE_KIND_OR_FILL_NEW_ARRAY)
+                self._lastWasInvokeKindOrFillNewArray = False
+                # Check if the register is a valid register (only in local because we write in them)
+                if not self._isValidLocalRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                # If the stack is empty, nothing to move
+                if len(self._currentStack) == 0:
+                    exitError(f'The stack is empty', ExitCode.MOVE_RESULT_ON_EMPTY_STACK)
+                # TODO Comment
+                # itemType: str = self._stack.pop()
+                itemType: str = self._popStack()
+                match op:
+                    # move-result
+                    case 0x0a:
+                        if not self._isPrimitive(itemType):
+                            exitError(f'Move result expects a primitive type on the stack, but \'{itemType}\' provided',
+                                      ExitCode.MOVE_RESULT_ON_OBJECT_TYPE)
+                    # move-result-object
+                    case 0x0c:
+                        if self._isPrimitive(itemType):
+                            exitError(
+                                f'Move result object expects an object type on the stack, but \'{itemType}\' provided',
+                                ExitCode.MOVE_RESULT_OBJECT_ON_PRIMITIVE_TYPE)
+
+                # Move the type of the last element on the stack to the given register
+                # self._mem[registerIndex] = itemType
+                self._putRegisterType(registerIndex, itemType, True)
+            # move-exception
+            case 0x0d:
+                self._lastWasInvokeKindOrFillNewArray = False
+                # Check if the register is a valid register (only in local because we write in them)
+                if not self._isValidLocalRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                # The exception object is always initialised
+                self._putRegisterType(registerIndex, self._getCaughtType(), True)
+            # return-object, return
+            case 0x11 | 0x0f:
+                self._lastWasInvokeKindOrFillNewArray = False
+                # Check if the register is a valid register (only in local because we write in them)
+                if not self._isValidRegisterNumber(registerIndex):
+                    self._Error_invalidRegisterNumber(_instruction, registerIndex)
+                # returnedItemType: str = self._mem[registerIndex]
+                returnedItemType: str = self._getRegisterType(registerIndex)
+                # return-object can't return a primitive type
+                if self._isPrimitive(returnedItemType) and op == 0x11:
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' (return-object) can\'t return a primitive type \'{returnedItemType}\'',
+                        ExitCode.RETURN_OBJECT_ON_PRIMITIVE_TYPE)
+                # return can't return an object type
+                elif not self._isPrimitive(returnedItemType) and op == 0x0f:
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' (return) can\'t return a non-primitive type \'{returnedItemType}\'',
+                        ExitCode.RETURN_ON_OBJECT_TYPE)
+                # Check if the returned type is compatible with the method return type
+                if not self._isSubclass(returnedItemType, self._methodInfos.returnType):
+                    exitError(
+                        f'Method \'{self._methodInfos.name}\' is supposed to return \'{self._methodInfos.returnType}\', but \'{returnedItemType}\' given',
+                        ExitCode.RETURN_TYPE_MISMATCH)
+
+                if self._isObject(returnedItemType):
+                    self._checkInitialised(registerIndex)
+            # TODO
+            case _:
+                exitError(f'Unhandled instruction11x subtype {_instruction.name}', ExitCode.UNHANDLED_CASE)
+
+    # Done
+    def _analyse21t(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        # Get the register index
+        registerIndex: int = _instruction.AA
+        # Check if the register is a valid register
+        if not self._isValidRegisterNumber(registerIndex):
+            self._Error_invalidRegisterNumber(_instruction, registerIndex)
+
+        if not self._isPrimitive(self._getRegisterType(registerIndex)):
+            exitError(f'Instruction \'{_instruction.format}\' can\'t be used on an object type', ExitCode.INVALID_REGISTER_TYPE)
+
+        # Get the offset
+        offset: int = _instruction.BBBB
+        if offset == 0:
+            exitError(f'Instruction \'{_instruction.format}\' can\'t have a 0 offset', ExitCode.INVALID_OFFSET)
+
+    # TODO Comment
+    # Done
+    def _analyse22t(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        firstRegisterIndex: int = _instruction.A
+        secondRegisterIndex: int = _instruction.B
+        if not self._isValidRegisterNumber(firstRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, firstRegisterIndex)
+        if not self._isValidRegisterNumber(secondRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, secondRegisterIndex)
+        if self._getRegisterType(firstRegisterIndex) != self._getRegisterType(secondRegisterIndex):
+            exitError(f'Instruction \'{_instruction.format}\' can\'t compare different values types',
+                      ExitCode.INVALID_REGISTER_TYPE)
+
+        if not self._isPrimitive(self._getRegisterType(firstRegisterIndex)):
+            exitError(f'Instruction \'{_instruction.format}\' can\'t be used on an object type', ExitCode.INVALID_REGISTER_TYPE)
+        offset: int = _instruction.CCCC
+        if offset == 0:
+            exitError(f'Instruction \'{_instruction.format}\' can\'t have a 0 offset', ExitCode.INVALID_OFFSET)
+
+    # TODO Comment
+    def _analyse12x(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        _toRegisterIndex: int = _instruction.A
+        _fromRegisterIndex: int = _instruction.B
+        _fromRegisterContent: str = self._getRegisterType(_fromRegisterIndex)
+        if not self._isValidRegisterNumber(_fromRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _fromRegisterIndex)
+        if not self._isValidLocalRegisterNumber(_toRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _toRegisterIndex)
+
+        match _instruction.op:
+            # Move
+            case 0x1:
+                if not self._isPrimitive(_fromRegisterContent):
+                    exitError(f'Instruction \'{_instruction.format}\' can\'t copy a non-primitive type',
+                              ExitCode.INVALID_REGISTER_TYPE)
+                # self._mem[_toRegisterIndex] = _fromRegisterContent
+                self._putRegisterType(_toRegisterIndex, _fromRegisterContent, False)
+            # Move-wide
+            case 0x4:
+                if not self._isPrimitive(_fromRegisterContent):
+                    exitError(f'Instruction \'{_instruction.format}\' can\'t copy a non-primitive type',
+                              ExitCode.INVALID_REGISTER_TYPE)
+                if not self._isValidRegisterNumber(_fromRegisterIndex + 1):
+                    self._Error_invalidRegisterNumber(_instruction, _fromRegisterIndex + 1)
+                if not self._isValidLocalRegisterNumber(_toRegisterIndex + 1):
+                    self._Error_invalidRegisterNumber(_instruction, _toRegisterIndex + 1)
+                if _fromRegisterContent != self._getRegisterType(_fromRegisterIndex + 1):
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' source pair types dosen\'t match(\'{_fromRegisterContent}\', {self._getRegisterType(_fromRegisterIndex + 1)}\')',
+                        ExitCode.INVALID_REGISTER_TYPE)
+                # self._mem[_toRegisterIndex] = _fromRegisterContent
+                # self._mem[_toRegisterIndex + 1] = self._getRegisterType(_fromRegisterIndex + 1)
+                self._putRegisterType(_toRegisterIndex, _fromRegisterContent, False)
+                self._putRegisterType(_toRegisterIndex + 1, self._getRegisterType(_fromRegisterIndex + 1), False)
+            # Move-object
+            case 0x7:
+                if self._isPrimitive(_fromRegisterContent):
+                    exitError(f'Instruction \'{_instruction.format}\' can\'t copy a primitive type',
+                              ExitCode.INVALID_REGISTER_TYPE)
+                # self._mem[_toRegisterIndex] = _fromRegisterContent
+                self._putRegisterType(_toRegisterIndex, _fromRegisterContent, True)
+            # Unop neg or not
+            case op if 0x7b <= op <= 0x80:
+                _splittedOp: list[str] = _instruction.name.split('-')
+                assert len(
+                    _splittedOp) == 2, f'Instruction \'{_instruction.format}\' has an invalid name \'{_instruction.name}\''
+                _op, _type = _splittedOp[0], humanTypeToSmaliType(_splittedOp[1])
+                # if self._mem[_fromRegisterIndex] != _type:
+                if self._getRegisterType(_fromRegisterIndex) != _type:
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' can\'t negate a \'{self._getRegisterType(_fromRegisterIndex)}\'',
+                        ExitCode.INVALID_REGISTER_TYPE)
+                match _op:
+                    case 'neg':
+                        # self._mem[_toRegisterIndex] = _type
+                        self._putRegisterType(_toRegisterIndex, _type, False)
+                    case 'not':
+                        # self._mem[_toRegisterIndex] = SMALI_BOOLEAN_TYPE
+                        self._putRegisterType(_toRegisterIndex, SMALI_BOOLEAN_TYPE, False)
+                    case _error:
+                        exitError(f'Unhandled instruction12x subtype \'{_instruction.name}\' (Op: \'{_error}\')',
+                                  ExitCode.UNHANDLED_CASE)
+            # Unop cast
+            case op if 0x81 <= op <= 0x8f:
+                _splittedOp: list[str] = _instruction.name.split('-to-')
+                assert len(
+                    _splittedOp) == 2, f'Instruction \'{_instruction.format}\' has an invalid name \'{_instruction.name}\''
+                _fromType, _toType = [humanTypeToSmaliType(x) for x in _splittedOp]
+                # if self._mem[_fromRegisterIndex] != _fromType:
+                if self._getRegisterType(_fromRegisterIndex) != _fromType:
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' expects a \'{_fromType}\' on register \'{_fromRegisterIndex}\', but \'{self._getRegisterType(_fromRegisterIndex)}\' provided',
+                        ExitCode.INVALID_REGISTER_TYPE)
+                # self._mem[_toRegisterIndex] = _toType
+                self._putRegisterType(_toRegisterIndex, _toType, False)
+            # Binop 2addr
+            case op if 0xb0 <= op <= 0xcf:
+                opName: str = _instruction.name.rstrip('/2addr')
+                _splittedOp: list[str] = opName.split('-')
+                assert len(
+                    _splittedOp) == 2, f'Instruction \'{_instruction.format}\' has an invalid name \'{_instruction.name}\''
+                _op, _type = _splittedOp[0], humanTypeToSmaliType(_splittedOp[1])
+                if not self._isValidRegisterNumber(_toRegisterIndex + 1):
+                    self._Error_invalidRegisterNumber(_instruction, _toRegisterIndex)
+                if not self._isValidRegisterNumber(_fromRegisterIndex + 1):
+                    self._Error_invalidRegisterNumber(_instruction, _fromRegisterIndex)
+                if _fromRegisterContent != self._getRegisterType(_fromRegisterIndex + 1):
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' expects a couple of {_type}, but (\'{_fromRegisterContent}\', \'{self._getRegisterType(_fromRegisterIndex + 1)}\') provided', ExitCode.INVALID_REGISTER_TYPE)
+                if self._getRegisterType(_toRegisterIndex) != self._getRegisterType(_toRegisterIndex + 1):
+                    exitError(
+                        f'Instruction \'{_instruction.format}\' expects a couple of {_type}, but (\'{self._getRegisterType(_toRegisterIndex)}\', \'{self._getRegisterType(_toRegisterIndex + 1)}\') provided', ExitCode.INVALID_REGISTER_TYPE)
+                # self._mem[_toRegisterIndex] = _type
+                self._putRegisterType(_toRegisterIndex, _type, False)
+            case _error:
+                exitError(f'Unhandled instruction12x subtype \'{_error}\'', ExitCode.UNHANDLED_CASE)
+
+    # TODO Comment
+    # Done
+    def _analyse22b(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        _toRegisterIndex: int = _instruction.AA
+        _fromRegisterIndex: int = _instruction.BB
+        if not self._isValidLocalRegisterNumber(_toRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _toRegisterIndex)
+        if not self._isValidRegisterNumber(_fromRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _fromRegisterIndex)
+        # if self._mem[_fromRegisterIndex] != SMALI_INT_TYPE:
+        if self._getRegisterType(_fromRegisterIndex) != SMALI_INT_TYPE:
+            exitError(
+                f'Instruction \'{_instruction.format}\' expects a \'{SMALI_INT_TYPE}\' on register \'{_fromRegisterIndex}\', but \'{self._getRegisterType(_fromRegisterIndex)}\' provided',
+                ExitCode.INVALID_REGISTER_TYPE)
+        if OPCODE_TRAITS[_instruction.op] & TRAIT_DIVIDE and _instruction.CC == 0:
+            exitError(f'Instruction \'{_instruction.format}\' can\'t divide by 0', ExitCode.DIVIDE_BY_ZERO)
+        # self._mem[_toRegisterIndex] = SMALI_INT_TYPE
+        self._putRegisterType(_toRegisterIndex, SMALI_INT_TYPE, False)
+
+    # TODO Comment
+    def _analyse22s(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        _toRegisterIndex: int = _instruction.A
+        _fromRegisterIndex: int = _instruction.B
+        if not self._isValidLocalRegisterNumber(_toRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _toRegisterIndex)
+        if not self._isValidRegisterNumber(_fromRegisterIndex):
+            self._Error_invalidRegisterNumber(_instruction, _fromRegisterIndex)
+        # if self._mem[_fromRegisterIndex] != SMALI_INT_TYPE:
+        if self._getRegisterType(_fromRegisterIndex) != SMALI_INT_TYPE:
+            exitError(
+                f'Instruction \'{_instruction.format}\' expects a \'{SMALI_INT_TYPE}\' on register \'{_fromRegisterIndex}\', but \'{self._getRegisterType(_fromRegisterIndex)}\' provided',
+                ExitCode.INVALID_REGISTER_TYPE)
+        if OPCODE_TRAITS[_instruction.op] & TRAIT_DIVIDE and _instruction.CCCC == 0:
+            exitError(f'Instruction \'{_instruction.format}\' can\'t divide by 0', ExitCode.DIVIDE_BY_ZERO)
+        # self._mem[_toRegisterIndex] = SMALI_INT_TYPE
+        self._putRegisterType(_toRegisterIndex, SMALI_INT_TYPE, False)
+
+    def _analyse22c(self, _instruction: DecodedInstruction) -> None:
+        self._lastWasInvokeKindOrFillNewArray = False
+        traits: int = OPCODE_TRAITS[_instruction.op]
+        match _instruction.op:
+            # Case IGet
+            case _iinstance if 0x52 <= _iinstance <= 0x58:
+                toRegisterIndex: int = _instruction.A
+                fromRegisterIndex: int = _instruction.B
+                classType, fieldType, _ = _instruction.field
+                if not self._isValidLocalRegisterNumber(toRegisterIndex):
+                    self._Error_invalidRegisterNumber(_instruction, toRegisterIndex)
+                if traits & TRAIT_WIDE:
+                    if not self._isValidLocalRegisterNumber(toRegisterIndex + 1):
+                        self._Error_invalidRegisterNumber(_instruction, toRegisterIndex + 1)
+                if not self._isValidRegisterNumber(fromRegisterIndex):
+                    self._Error_invalidRegisterNumber(_instruction, fromRegisterIndex)
+                if not self._isSubclass(self._getRegisterType(fromRegisterIndex), classType):
+                    exitError(f'Instruction \'{_instruction.format}\' expects a \'{classType}\' on register \'{fromRegisterIndex}\', but \'{self._getRegisterType(fromRegisterIndex)}\' provided', ExitCode.INVALID_REGISTER_TYPE)
+                self._checkInitialised(fromRegisterIndex)
+                self._putRegisterType(toRegisterIndex, fieldType, traits & TRAIT_OBJECT != 0)
+                if traits & TRAIT_WIDE:
+                    self._putRegisterType(toRegisterIndex + 1, fieldType, False)
+            # Case IPut
+            case _iinstance if 0x59 <= _iinstance <= 0x5f:
+                fromRegisterIndex: int = _instruction.A
+                toRegisterIndex: int = _instruction.B
+                classType, fieldType, _ = _instruction.field
+
+                if not self._isValidRegisterNumber(fromRegisterIndex):
+                    self._Error_invalidRegisterNumber(_instruction, fromRegisterIndex)
+                if traits & TRAIT_WIDE:
+                    if not self._isValidRegisterNumber(fromRegisterIndex + 1):
+                        self._Error_invalidRegisterNumber(_instruction, fromRegisterIndex + 1)
+                    if self._getRegisterType(fromRegisterIndex) != self._getRegisterType(fromRegisterIndex + 1):
+                        exitError(f'Instruction \'{_instruction.format}\' expects a couple of {fieldType}, but (\'{self._getRegisterType(fromRegisterIndex)}\', \'{self._getRegisterType(fromRegisterIndex + 1)}\') provided', ExitCode.INVALID_REGISTER_TYPE)
+                if not self._isSubclass(self._getRegisterType(toRegisterIndex), classType):
+                    exitError(f'Instruction \'{_instruction.format}\' expects a \'{classType}\' on register \'{toRegisterIndex}\', but \'{self._getRegisterType(toRegisterIndex)}\' provided', ExitCode.INVALID_REGISTER_TYPE)
+                if self._getRegisterType(fromRegisterIndex) != fieldType:
+                    exitError(f'Instruction \'{_instruction.format}\' expects a \'{fieldType}\' on register \'{fromRegisterIndex}\', but \'{self._getRegisterType(fromRegisterIndex)}\' provided', ExitCode.INVALID_REGISTER_TYPE)
+                if self._isObject(fieldType):
+                    self._checkInitialised(fromRegisterIndex)
+                    if not traits & TRAIT_OBJECT:
+                        exitError(f'Instruction \'{_instruction.format}\' expects a primitive type on register \'{fromRegisterIndex}\', but \'{self._getRegisterType(fromRegisterIndex)}\' provided', ExitCode.INVALID_REGISTER_TYPE)
+            case _error:
+                exitError(f'Unhandled instruction22c subtype \'{_error}\'', ExitCode.UNHANDLED_CASE)
+
+
+    def analyse(self, _block: int, **kwargs) -> bool:
+        """
+        Main method that analyse the given basic block, instruction by instruction.
+        :param _block: The index of the basic block to analyse
+        :return: True if the successors of the block must be analysed
+        """
+        assert 'flow' in kwargs
+        flow: FlowGraph = kwargs.get('flow')
+        return self._analyseBlock(flow, _block, kwargs.get('widen', False))
+
+    # Handler of each opcode, indexed by its value
+    _dispatch: list[InstructionHandlerType] = buildDispatchTable({
+        # Instruction 10t:
+        # 28 -> `goto +AA`
+        Instruction10t: _useless,
+
+        # Instruction 10x:
+        # 0 -> `nop`
+        # 0e -> `return-void`
+        # 3e..43 -> X
+        # 73 -> X
+        # 79..7a -> X
+        # e3..f9 -> X
+        Instruction10x: _analyse10x,
+
+        # Instruction 11n:
+        # 12 -> `const/4 vA, #+B`
+        Instruction11n: _analyse11n,
+
+        # Instruction 11x:
+        # 0a -> `move-result vAA`
+        # 0b -> `move-result-wide vAA`
+        # 0c -> `move-result-object vAA`
+        # 0d -> `move-exception vAA`
+        # 0f -> `return vAA`
+        # 10 -> `return-wide vAA`
+        # 11 -> `return-object vAA`
+        # 1d -> `monitor-enter vAA`
+        # 1e -> `monitor-exit vAA`
+        # 27 -> `throw vAA`
+        Instruction11x: _analyse11x,
+
+        # Instruction 12x:
+        # 01 -> `move vA, vB`
+        # 04 -> `move-wide vA, vB`
+        # 07 -> `move-object vA, vB`
+        # unop vA, vB
+        #   7b -> `neg-int`
+        #   7c -> `not-int`
+        #   7d -> `neg-long`
+        #   7e -> `not-long`
+        #   7f -> `neg-float`
+        #   80 -> `neg-double`
+        #   81 -> `int-to-long`
+        #   82 -> `int-to-float`
+        #   83 -> `int-to-double`
+        #   84 -> `long-to-int`
+        #   85 -> `long-to-float`
+        #   86 -> `long-to-double`
+        #   87 -> `float-to-int`
+        #   88 -> `float-to-long`
+        #   89 -> `float-to-double`
+        #   8a -> `double-to-int`
+        #   8b -> `double-to-long`
+        #   8c -> `double-to-float`
+        #   8d -> `int-to-byte`
+        #   8e -> `int-to-char`
+        #   8f -> `int-to-short`
+        # binop/2addr vA, vB
+        #   b0 -> `add-int/2addr`
+        #   b1 -> `sub-int/2addr`
+        #   b2 -> `mul-int/2addr`
+        #   b3 -> `div-int/2addr`
+        #   b4 -> `rem-int/2addr`
+        #   b5 -> `and-int/2addr`
+        #   b6 -> `or-int/2addr`
+        #   b7 -> `xor-int/2addr`
+        #   b8 -> `shl-int/2addr`
+        #   b9 -> `shr-int/2addr`
+        #   ba -> `ushr-int/2addr`
+        #   bb -> `add-long/2addr`
+        #   bc -> `sub-long/2addr`
+        #   bd -> `mul-long/2addr`
+        #   be -> `div-long/2addr`
+        #   bf -> `rem-long/2addr`
+        #   c0 -> `and-long/2addr`
+        #   c1 -> `or-long/2addr`
+        #   c2 -> `xor-long/2addr`
+        #   c3 -> `shl-long/2addr`
+        #   c4 -> `shr-long/2addr`
+        #   c5 -> `ushr-long/2addr`
+        #   c6 -> `add-float/2addr`
+        #   c7 -> `sub-float/2addr`
+        #   c8 -> `mul-float/2addr`
+        #   c9 -> `div-float/2addr`
+        #   ca -> `rem-float/2addr`
+        #   cb -> `add-double/2addr`
+        #   cc -> `sub-double/2addr`
+        #   cd -> `mul-double/2addr`
+        #   ce -> `div-double/2addr`
+        #   cf -> `rem-double/2addr`
+        Instruction12x: _analyse12x,
+
+        # Instruction 20bc:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction20bc: _unhandled,
+
+        # Instruction 20t:
+        # 29 -> `goto/16 +AAAA`
+        Instruction20t: _useless,
+
+        # Instruction 21c:
+        # 1a -> `const-string vAA, string@BBBB`
+        # 1c -> `const-class vAA, type@BBBB`
+        # 1f -> `check-cast vAA, type@BBBB`
+        # 22 -> `new-instance vAA, type@BBBB`
+        # sstaticop vAA, field@BBBB
+        #   60 -> `sget`
+        #   61 -> `sget-wide`
+        #   62 -> `sget-object`
+        #   63 -> `sget-boolean`
+        #   64 -> `sget-bytet`
+        #   65 -> `sget-char`
+        #   66 -> `sget-short`
+        #   67 -> `sput`
+        #   68 -> `sput-wide`
+        #   69 -> `sput-object`
+        #   6a -> `sput-boolean`
+        #   6b -> `sput-byte`
+        #   6c -> `sput-char`
+        #   6d -> `sput-short`
+        # fe -> `const-method-handle vAA, method_handle@BBBB`
+        # ff -> `const-method-type vAA, proto@BBBB`
+        Instruction21c: _analyse21c,
+
+        # Instruction 21h:
+        # 19 -> `const-wide/high16 vAA, #+BBBB000000000000
+        # 15 -> `const/high16 vAA, #+BBBB0000
+        Instruction21h: _unhandled,
+
+        # Instruction 21s:
+        # 13 -> `const/16 vAA, #+BBBB
+        # 16 -> `const-wide/16 vAA, #+BBBB
+        Instruction21s: _analyse21s,
+
+        # Instruction 21t:
+        # if-testz vAA, +BBBB
+        #   38 -> `if-eqz`
+        #   39 -> `if-nez`
+        #   3a -> `if-ltz`
+        #   3b -> `if-gez`
+        #   3c -> `if-gtz`
+        #   3d -> `if-lez`
+        Instruction21t: _analyse21t,
+
+        # Instruction 22b:
+        # binop/lit8 vAA, vBB, #+CC
+        #   d8 -> `add-int/lit8`
+        #   d9 -> `rsub-int/lit8`
+        #   da -> `mul-int/lit8`
+        #   db -> `div-int/lit8`
+        #   dc -> `rem-int/lit8`
+        #   dd -> `and-int/lit8`
+        #   de -> `or-int/lit8`
+        #   df -> `xor-int/lit8`
+        #   e0 -> `shl-int/lit8`
+        #   e1 -> `shr-int/lit8`
+        #   e2 -> `ushr-int/lit8`
+        Instruction22b: _analyse22b,
+
+        # Instruction 22c:
+        # 20 -> `instance-of vA, vB, type@CCCC`
+        # 23 -> `new-array vA, vB, type@CCCC`
+        # iinstanceop vA, vB, field@CCCC
+        #   52 -> `iget`
+        #   53 -> `iget-wide`
+        #   54 -> `iget-object`
+        #   55 -> `iget-boolean`
+        #   56 -> `iget-byte`
+        #   57 -> `iget-char`
+        #   58 -> `iget-short`
+        #   59 -> `iput`
+        #   5a -> `iput-wide`
+        #   5b -> `iput-object`
+        #   5c -> `iput-boolean`
+        #   5d -> `iput-byte`
+        #   5e -> `iput-char`
+        #   5f -> `iput-short`
+        Instruction22c: _analyse22c,
+
+        # Instruction 22cs:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction22cs: _unhandled,
+
+        # Instruction 22s:
+        # binop/lit16 vA, vB, #+CCCC
+        #   d0 -> `add-int/lit16`
+        #   d1 -> `rsub-int (reverse subtract)`
+        #   d2 -> `mul-int/lit16`
+        #   d3 -> `div-int/lit16`
+        #   d4 -> `rem-int/lit16`
+        #   d5 -> `and-int/lit16`
+        #   d6 -> `or-int/lit16`
+        #   d7 -> `xor-int/lit16`
+        Instruction22s: _analyse22s,
+
+        # Instruction22t:
+        # if-test vA, vB, +CCCC
+        #   32 -> `if-eq`
+        #   33 -> `if-ne`
+        #   34 -> `if-lt`
+        #   35 -> `if-ge`
+        #   36 -> `if-gt`
+        #   37 -> `if-le`
+        Instruction22t: _analyse22t,
+
+        # Instruction 22x:
+        # 02  -> `move/from16 vAA, vBBBB`
+        # 05  -> `move-wide/from16 vAA, vBBBB`
+        # 08  -> `move-object/from16 vAA, vBBBB`
+        Instruction22x: _unhandled,
+
+        # Instruction 23x:
+        # cmpkind vAA, vBB, vCC
+        #   2d -> `cmpl-float (lt bias)`
+        #   2e -> `cmpg-float (gt bias)`
+        #   2f -> `cmpl-double (lt bias)`
+        #   30 -> `cmpg-double (gt bias)`
+        #   31 -> `cmp-long`
+        # arrayop vAA, vBB, vCC
+        #   44 -> `aget`
+        #   45 -> `aget-wide`
+        #   46 -> `aget-object`
+        #   47 -> `aget-boolean`
+        #   48 -> `aget-byte`
+        #   49 -> `aget-char`
+        #   4a -> `aget-short`
+        #   4b -> `aput`
+        #   4c -> `aput-wide`
+        #   4d -> `aput-object`
+        #   4e -> `aput-boolean`
+        #   4f -> `aput-byte`
+        #   50 -> `aput-char`
+        #   51 -> `aput-short`
+        # binop vAA, vBB, vCC
+        #   90 -> `add-int`
+        #   91 -> `sub-int`
+        #   92 -> `mul-int`
+        #   93 -> `div-int`
+        #   94 -> `rem-int`
+        #   95 -> `and-int`
+        #   96 -> `or-int`
+        #   97 -> `xor-int`
+        #   98 -> `shl-int`
+        #   99 -> `shr-int`
+        #   9a -> `ushr-int`
+        #   9b -> `add-long`
+        #   9c -> `sub-long`
+        #   9d -> `mul-long`
+        #   9e -> `div-long`
+        #   9f -> `rem-long`
+        #   a0 -> `and-long`
+        #   a1 -> `or-long`
+        #   a2 -> `xor-long`
+        #   a3 -> `shl-long`
+        #   a4 -> `shr-long`
+        #   a5 -> `ushr-long`
+        #   a6 -> `add-float`
+        #   a7 -> `sub-float`
+        #   a8 -> `mul-float`
+        #   a9 -> `div-float`
+        #   aa -> `rem-float`
+        #   ab -> `add-double`
+        #   ac -> `sub-double`
+        #   ad -> `mul-double`
+        #   ae -> `div-double`
+        #   af -> `rem-double`
+        Instruction23x: _unhandled,
+
+        # Instruction 30t
+        # 2a  -> `goto/32 +AAAAAAAA`
+        Instruction30t: _useless,
+
+        # Instruction 31c:
+        # 1b -> `const-string/jumbo vAA, string@BBBBBBBB`
+        Instruction31c: _unhandled,
+
+        # Instruction31i:
+        # 14 -> `const vAA, #+BBBBBBBB`
+        # 17 -> `const-wide/32 vAA, #+BBBBBBBB`
+        Instruction31i: _analyse31i,
+
+        # Instruction31t:
+        # 26 -> `fill-array-data vAA, +BBBBBBBB (with supplemental data as specified below in "fill-array-data-payload Format")`
+        # 2b -> `packed-switch vAA, +BBBBBBBB (with supplemental data as specified below in "packed-switch-payload Format")`
+        # 2c -> `sparse-switch vAA, +BBBBBBBB (with supplemental data as specified below in "sparse-switch-payload Format")`
+        Instruction31t: _unhandled,
+
+        # Instruction32x:
+        # 03 -> `move/16 vAAAA, vBBBB`
+        # 06 -> `move-wide/16 vAAAA, vBBBB`
+        # 09 -> `move-object/16 vAAAA, vBBBB`
+        Instruction32x: _unhandled,
+
+        # Instruction35c:
+        # 24 -> `filled-new-array {vC, vD, vE, vF, vG}, type@BBBB`
+        # invoke-kind {vC, vD, vE, vF, vG}, meth@BBBB
+        #   6e -> `invoke-virtual`
+        #   6f -> `invoke-super`
+        #   70 -> `invoke-direct`
+        #   71 -> `invoke-static`
+        #   72 -> `invoke-interface`
+        # fc -> `invoke-custom {vC, vD, vE, vF, vG}, call_site@BBBB`
+        Instruction35c: _analyse35c,
+
+        # Instruction35mi:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction35mi: _unhandled,
+
+        # Instruction35ms:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction35ms: _unhandled,
+
+        # Instruction3rc:
+        # 25 -> `filled-new-array/range {vCCCC .. vNNNN}, type@BBBB`
+        # invoke-kind/range {vCCCC .. vNNNN}, meth@BBBB
+        #   74 -> invoke-virtual/range
+        #   75 -> invoke-super/range
+        #   76 -> invoke-direct/range
+        #   77 -> invoke-static/range
+        #   78 -> invoke-interface/range
+        # fd -> `invoke-custom/range {vCCCC .. vNNNN}, call_site@BBBB`
+        Instruction3rc: _unhandled,
+
+        # Instruction3rmi:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction3rmi: _unhandled,
+
+        # Instruction3rms:
+        # TODO https://source.android.com/devices/tech/dalvik/instruction-formats?hl=en#format-ids
+        Instruction3rms: _unhandled,
+
+        # Instruction40sc:
+        # TODO http://www.dre.vanderbilt.edu/~schmidt/android/android-4.0/dalvik/docs/instruction-formats.html
+        Instruction40sc: _unhandled,
+
+        # Instruction41c:
+        # TODO http://www.dre.vanderbilt.edu/~schmidt/android/android-4.0/dalvik/docs/instruction-formats.html
+        Instruction41c: _unhandled,
+
+        # FIXME Can't find import
+        # Instruction45cc:
+        # fa -> `invoke-polymorphic {vC, vD, vE, vF, vG}, meth@BBBB, proto@HHHH`
+        # Instruction45cc: _unhandled,
+        #     self._unhandled(_inst45cc)
+
+        # FIXME Can't find import
+        # Instruction4rcc:
+        # fb -> `invoke-polymorphic/range {vCCCC .. vNNNN}, meth@BBBB, proto@HHHH`
+        # Instruction4rcc: _unhandled,
+        #     self._unhandled(_inst4rcc)
+
+        # Instruction51l:
+        # 18 -> `const-wide vAA, #+BBBBBBBBBBBBBBBB`
+        Instruction51l: _unhandled,
+
+        # Instruction52c:
+        # TODO http://www.dre.vanderbilt.edu/~schmidt/android/android-4.0/dalvik/docs/instruction-formats.html
+        Instruction52c: _unhandled,
+
+        # Instruction5rc:
+        # TODO http://www.dre.vanderbilt.edu/~schmidt/android/android-4.0/dalvik/docs/instruction-formats.html
+        Instruction5rc: _unhandled,
+    }, _unhandled)
+
+    def _analyseInstruction(self, _instruction: DecodedInstruction) -> None:
+        """
+        Analyse the given instruction by redirecting it to the handler of its opcode.
+        :param _instruction: The instruction to analyse
+        """
+        op: int = _instruction.op
+        # Payloads and optimized instructions are out of the table
+        if op >= OPCODE_COUNT:
+            self._unhandled(_instruction)
+        else:
+            self._dispatch[op](self, _instruction)
 
     # DEBUG
 
     @staticmethod
-    def _printInstruction(_instruction: Instruction) -> None:
+    def _printInstruction(_instruction: DecodedInstruction) -> None:
         """
         Method to print an instruction.
         :param _instruction: The instruction to print
         """
         print(
             'Instruction: \n'
-            f'\tName: \'{_instruction.get_name()}\'\n'
-            f'\tOP: \'{hex(_instruction.get_op_value())}\'\n'
-            f'\tOutput: \'{_instruction.get_output()}\'\n'
-            f'\tSize: \'{_instruction.get_length()}\''
+            f'\tName: \'{_instruction.name}\'\n'
+            f'\tOP: \'{hex(_instruction.op)}\'\n'
+            f'\tOutput: \'{_instruction.output}\'\n'
+            f'\tSize: \'{_instruction.length}\''
         )
 
-    def _instructionReport(self, _instruction: Instruction) -> None:
-        self._report += '\tInstruction: \n' \
-                       f'\t\tName: \'{_instruction.get_name()}\'\n' \
-                       f'\t\tOP: \'{hex(_instruction.get_op_value())}\'\n' \
-                       f'\t\tOutput: \'{_instruction.get_output()}\'\n' \
-                       f'\t\tSize: \'{_instruction.get_length()}\'\n'
+    def _instructionReport(self, _instruction: DecodedInstruction) -> None:
+        if not self._recording:
+            return
+        self._report.write('\tInstruction: \n'
+                           f'\t\tName: \'{_instruction.name}\'\n'
+                           f'\t\tOP: \'{hex(_instruction.op)}\'\n'
+                           f'\t\tOutput: \'{_instruction.output}\'\n'
+                           f'\t\tSize: \'{_instruction.length}\'\n')
+
+    def _definitionsReport(self, _title: str, _registers: list[int]) -> None:
+        """
+        Report the content of the registers defined by an instruction (or by the phis of a block) in sparse mode.
+        :param _title: The title of the definitions
+        :param _registers: The registers defined
+        """
+        if len(_registers) == 0:
+            return
+        if self._verbose:
+            print(f'\t{_title}:')
+            [print(f'\t\tv{x}: \'{self._lattice.toContent(self._currentMemory[x])}\'') for x in _registers]
+        if not self._recording:
+            return
+        self._report.write(f'\t\t{_title}:\n')
+        for x in _registers:
+            self._report.write(f'\t\t\t\tv{x}: \'{self._lattice.toContent(self._currentMemory[x])}\'\n')
 
     def _memoryReport(self):
-        exitError('Method `_memoryReport()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        self._report.write('\t\tMemory before:\n')
+        for x in range(len(self._currentMemory)):
+            self._report.write(f'\t\t\t\tv{x}: {self._lattice.toReport(self._getRegisterValue(x))}\n')
+        self._report.write('\t\tStack before [\n')
+        for x in range(len(self._currentStack)):
+            self._report.write(f'\t\t\t\'{self._currentStack[x]}\'\n')
+        self._report.write('\t\t]\n')
 
     def _printMemory(self):
-        exitError('Method `_printMemory()` from base class Analyser shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        print('\tMemory:')
+        [print(f'\t\tv{x}: {self._lattice.toReport(self._getRegisterValue(x))}') for x in range(len(self._currentMemory))]
+        print('\tStack [')
+        [print(f'\t\t\'{self._currentStack[x]}\'') for x in range(len(self._currentStack))]
+        print('\t]')
 
     # UTILS
 
     @staticmethod
-    def _getParametersTypeFromString(string: str) -> list[str]:
-        """
-        Decompose a method call into its parameters types.
-        :param string: The string representing the parameters type
-        :return: list[str] containing types
-        """
-        # Remove parenthesis
-        parametersString = string[1:-1]
-        # Split by ' '
-        return [parameter.strip() for parameter in parametersString.split(' ') if parameter]
-
-    def _decomposeInvokedMethod(self, _instruction: InvokeType) -> MethodCallInfosType:
-        """
-        Method that decompose a call methode (ex: Lcom/example/ex2test/MainActivity;->findViewById(I)Landroid/view/View;)
-        into 4 separated components: (Class, Method name, list of parameters type, return type)
-        :param _instruction: The instruction to decompose
-        :return: A tuple containing the 4 components (Class: str, Method name: str, parameters type: list[str], return type: str)
-        """
-        calledMethodInformations = _instruction.cm.get_method(_instruction.BBBB)
-        return calledMethodInformations[0], calledMethodInformations[1], self._getParametersTypeFromString(calledMethodInformations[2][0]), calledMethodInformations[2][1]
-
-    @staticmethod
-    def _getVariadicProvidedParameters(_instruction: InvokeType) -> list[int]:
+    def _getVariadicProvidedParameters(_instruction: DecodedInstruction) -> list[int]:
         candidate: list[int] = []
         # _instruction.A contains the parameter count
         argumentsLength: int = _instruction.A
@@ -237,19 +1712,6 @@ class Analyser:
 
         return candidate
 
-    # TODO Comment
-    @staticmethod
-    def _decomposeArrays(_first: str, _second: str) -> ((int, str), (int, str)):
-        _firstCounter = 0
-        while _first.startswith(SMALI_ARRAY_MARKER):
-            _first = _first[1:]
-            _firstCounter += 1
-        _secondCounter = 0
-        while _second.startswith(SMALI_ARRAY_MARKER):
-            _second = _second[1:]
-            _secondCounter += 1
-        return (_firstCounter, _first), (_secondCounter, _second)
-
     def _findClosestParent(self, _first: str, _seccond: str) -> str:
         if _first is SMALI_OBJECT_TYPE or _seccond is SMALI_OBJECT_TYPE:
             return SMALI_OBJECT_TYPE
@@ -257,63 +1719,73 @@ class Analyser:
         if _first == _seccond:
             return _first
 
-        todoFirst: set[str] = set()
-        todoFirst.add(_first)
-        todoSecond: list[str] = [_seccond]
-        doneFirst: set[str] = set()
-        while len(todoFirst) > 0:
-            curr = todoFirst.pop()
-            if curr not in doneFirst and curr != SMALI_OBJECT_TYPE:
-                _a: ClassAnalysis = self._analysis.get_class_analysis(curr)
-                doneFirst.add(curr)
-                if _a is not None:
-                    todoFirst.add(_a.extends)
-                    [todoFirst.add(x) for x in _a.implements]
-        while len(todoSecond) > 0:
-            curr = todoSecond.pop(0)
-            if curr in doneFirst:
-                return curr
-            _a: ClassAnalysis = self._analysis.get_class_analysis(curr)
-            if _a is not None:
-                todoSecond.append(_a.extends)
-                todoSecond.extend(_a.implements)
-
-        return SMALI_OBJECT_TYPE
+        return self._hierarchy.getClosestParent(_first, _seccond)
+
+    def _getCaughtType(self) -> str:
+        """
+        Retrieve the type of the exception caught by the handler being analysed: the closest common parent of the
+        types it catches, Throwable for a catch-all.
+        :return: The type of the caught exception
+        """
+        caughtType: str | None = None
+        for candidate in self._caughtTypes:
+            if candidate is None:
+                return SMALI_THROWABLE_TYPE
+            caughtType = candidate if caughtType is None else self._findClosestParent(caughtType, candidate)
+        # Every exception is a Throwable, even when its hierarchy is unknown
+        if caughtType is None or caughtType == SMALI_OBJECT_TYPE:
+            return SMALI_THROWABLE_TYPE
+        return caughtType
 
     def _compatibleType(self, _first: str, _second: str) -> str:
-        if _first.startswith(SMALI_ARRAY_MARKER) or _second.startswith(SMALI_ARRAY_MARKER):
-            (_firstCount, _firstValue), (_secondCounter, _secondValue) = self._decomposeArrays(_first, _second)
-            if _firstCount != _secondCounter:
-                exitError(f'Array dimensions differs ({_firstCount} != {_secondCounter})', ExitCode.MEMORY_ERROR)
-
-        if _second.startswith(SMALI_OBJECT_MARKER):
-            if not _first.startswith(SMALI_OBJECT_MARKER):
-                exitError(f'Memory type mismatch between \'{_second}\' and \'{_first}\'', ExitCode.MEMORY_ERROR)
+        return self._types.descriptors[self._joinTypes(self._types.intern(_first), self._types.intern(_second))]
+
+    def _joinTypes(self, _first: int, _second: int) -> int:
+        """
+        Find the closest type compatible with two types, the result being kept in the type table
+        :param _first: The identifier of the first type
+        :param _second: The identifier of the second type
+        :return: The identifier of the compatible type
+        """
+        joined: int | None = self._types.joins.get((_first, _second))
+        if joined is not None:
+            return joined
+        if self._types.dimensions[_first] != self._types.dimensions[_second]:
+            exitError(f'Array dimensions differs ({self._types.dimensions[_first]} != {self._types.dimensions[_second]})', ExitCode.MEMORY_ERROR)
+
+        if self._types.objects[_second]:
+            if not self._types.objects[_first]:
+                exitError(f'Memory type mismatch between \'{self._types.descriptors[_second]}\' and \'{self._types.descriptors[_first]}\'', ExitCode.MEMORY_ERROR)
             # Check if the provided object is a subtype of the parameter
-            return self._findClosestParent(_first, _second)
+            joined = self._types.intern(self._findClosestParent(self._types.descriptors[_first], self._types.descriptors[_second]))
         # Else check if the primitive types match
-        if not self._isValidPrimitiveType(_first, _second):
-            exitError(f'Memory type mismatch between \'{_second}\' and \'{_first}\'', ExitCode.MEMORY_ERROR)
-        return _first
+        elif not self._isValidPrimitiveType(_first, _second):
+            exitError(f'Memory type mismatch between \'{self._types.descriptors[_second]}\' and \'{self._types.descriptors[_first]}\'', ExitCode.MEMORY_ERROR)
+        else:
+            joined = _first
+        self._types.joins[(_first, _second)] = joined
+        return joined
 
     def _validateParameterType(self, _firstIndex: int, _firstValue: str, _secondValue: str) -> None:
-        if _firstValue.startswith(SMALI_ARRAY_MARKER) or _secondValue.startswith(SMALI_ARRAY_MARKER):
-            (_firstCount, _firstValue), (_secondCounter, _secondValue) = self._decomposeArrays(_firstValue, _secondValue)
-            if _firstCount != _secondCounter:
-                exitError(f'Array dimensions differs ({_firstCount} != {_secondCounter})', ExitCode.MISCMATCH_PARAMETER_TYPE)
-
-        if _secondValue.startswith(SMALI_OBJECT_MARKER):
-            if not _firstValue.startswith(SMALI_OBJECT_MARKER):
-                exitError(f'Parameter expect type \'{_secondValue}\', but primitive type \'{_firstValue}\' given', ExitCode.MISCMATCH_PARAMETER_TYPE)
+        first: int = self._types.intern(_firstValue)
+        second: int = self._types.intern(_secondValue)
+        if self._types.dimensions[first] > 0 or self._types.dimensions[second] > 0:
+            if self._types.dimensions[first] != self._types.dimensions[second]:
+                exitError(f'Array dimensions differs ({self._types.dimensions[first]} != {self._types.dimensions[second]})', ExitCode.MISCMATCH_PARAMETER_TYPE)
+            first, second = self._types.elements[first], self._types.elements[second]
+
+        if self._types.objects[second]:
+            if not self._types.objects[first]:
+                exitError(f'Parameter expect type \'{self._types.descriptors[second]}\', but primitive type \'{self._types.descriptors[first]}\' given', ExitCode.MISCMATCH_PARAMETER_TYPE)
             # Check if the provided object is a subtype of the parameter
-            if not self._isSubclass(_firstValue, _secondValue):
-                exitError(f'Parameter \'v{_firstIndex}\' has type \'{_firstValue}\' which is not a subtype of \'{_secondValue}\'', ExitCode.MISCMATCH_PARAMETER_TYPE)
+            if not self._isSubtype(first, second):
+                exitError(f'Parameter \'v{_firstIndex}\' has type \'{self._types.descriptors[first]}\' which is not a subtype of \'{self._types.descriptors[second]}\'', ExitCode.MISCMATCH_PARAMETER_TYPE)
         # Else check if the primitive types match
-        elif not self._isValidPrimitiveType(_firstValue, _secondValue):
-            exitError(f'Parameter \'v{_firstIndex}\' has type \'{_firstValue}\'instead of \'{_secondValue}\'', ExitCode.MISCMATCH_PARAMETER_TYPE)
+        elif not self._isValidPrimitiveType(first, second):
+            exitError(f'Parameter \'v{_firstIndex}\' has type \'{self._types.descriptors[first]}\'instead of \'{self._types.descriptors[second]}\'', ExitCode.MISCMATCH_PARAMETER_TYPE)
 
     # ERRORS
 
     @staticmethod
-    def _Error_invalidRegisterNumber(_instruction: Instruction, _register: int):
-        exitError(f'Instruction \'{_instruction.get_name()}\' uses invalid register number \'{_register}\'', ExitCode.INVALID_REGISTER_INDEX)
+    def _Error_invalidRegisterNumber(_instruction: DecodedInstruction, _register: int):
+        exitError(f'Instruction \'{_instruction.name}\' uses invalid register number \'{_register}\'', ExitCode.INVALID_REGISTER_INDEX)
@@ -0,0 +1,53 @@
+from time import monotonic
+
+from tools import BudgetExceededException
+
+
+class Budget:
+    """
+    Limits of the analysis of a method, None meaning unlimited.
+    The visits are counted per block by the dataflow solver (per walk of the dominator tree in sparse mode), and the
+    deadline is a wall clock duration starting with the analysis of each method.
+    """
+    maxBlockVisits: int | None
+    maxTotalVisits: int | None
+    deadline: float | None
+    # Number of visits of a loop head after which its entry memory is widened
+    wideningDelay: int | None
+    _totalVisits: int
+    _end: float | None
+
+    def __init__(self, maxBlockVisits: int | None = None, maxTotalVisits: int | None = None, deadline: float | None = None, wideningDelay: int | None = None):
+        self.maxBlockVisits = maxBlockVisits
+        self.maxTotalVisits = maxTotalVisits
+        self.deadline = deadline
+        self.wideningDelay = wideningDelay
+        self._totalVisits = 0
+        self._end = None
+
+    def start(self) -> None:
+        """
+        Reset the counters at the start of the analysis of a method
+        """
+        self._totalVisits = 0
+        self._end = monotonic() + self.deadline if self.deadline is not None else None
+
+    def check(self, _blockVisits: int) -> None:
+        """
+        Count a visit of a block, and stop the analysis of the method if a limit is exceeded
+        :param _blockVisits: The number of visits of the block, this one included
+        """
+        self._totalVisits += 1
+        if self.maxBlockVisits is not None and _blockVisits > self.maxBlockVisits:
+            raise BudgetExceededException(f'a block was visited more than {self.maxBlockVisits} times')
+        if self.maxTotalVisits is not None and self._totalVisits > self.maxTotalVisits:
+            raise BudgetExceededException(f'more than {self.maxTotalVisits} block visits')
+        if self._end is not None and monotonic() > self._end:
+            raise BudgetExceededException(f'deadline of {self.deadline}s reached')
+
+    def widens(self, _blockVisits: int) -> bool:
+        """
+        :param _blockVisits: The number of visits of a loop head, this one included
+        :return: True if the entry memory of the loop head must be widened
+        """
+        return self.wideningDelay is not None and _blockVisits > self.wideningDelay
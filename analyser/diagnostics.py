@@ -0,0 +1,41 @@
+from tools import ExitCode
+
+
+class Diagnostic:
+    """
+    Error found by an analysis in a method, recorded instead of stopping the program so the other methods are analysed
+    """
+    __slots__ = ('method', 'offset', 'code', 'message')
+    # Signature of the method (ex: 'Lcom/example/A;->f(I)V')
+    method: str
+    # Offset of the instruction in the method, in bytes, None if the error was found before the first instruction
+    offset: int | None
+    code: ExitCode
+    message: str
+
+    def __init__(self, method: str, offset: int | None, code: ExitCode, message: str):
+        self.method = method
+        self.offset = offset
+        self.code = code
+        self.message = message
+
+    def __str__(self) -> str:
+        return f'{self.method} at {self.getLocation()}: {self.code.name}: {self.message}'
+
+    def getLocation(self) -> str:
+        """
+        :return: The offset of the instruction, as printed in the reports
+        """
+        return f'0x{self.offset:04x}' if self.offset is not None else 'entry'
+
+
+def getSummaryExitCode(_diagnostics: list[Diagnostic]) -> ExitCode:
+    """
+    :param _diagnostics: The errors found by the analysis of a class
+    :return: The exit code summarising them: success if there is none, the code of the errors if they all have the same,
+    else MULTIPLE_ERRORS
+    """
+    codes: set[ExitCode] = {diagnostic.code for diagnostic in _diagnostics}
+    if len(codes) == 0:
+        return ExitCode.EXIT_SUCCESS
+    return codes.pop() if len(codes) == 1 else ExitCode.MULTIPLE_ERRORS
@@ -1,160 +1,257 @@
-import sys
-
-from androguard.core.analysis.analysis import Analysis
-from androguard.core.bytecodes.dvm import ClassDefItem, EncodedMethod, Instruction21t, Instruction22t, Instruction30t, \
-    Instruction20t, Instruction10t, Instruction, Instruction10x, Instruction11x
+from androguard.core.bytecodes.dvm import ClassDefItem, EncodedMethod
 from analyser.analyse1 import Analyse1
 from analyser.analyse2 import Analyse2
 from analyser.analyse3 import Analyse3
-from tools import APKInfos, extractInfosFromMethod, MethodInfos, exitError, ExitCode, getOffsetFromGoto, \
-    getOffsetFromIf, printAPKInfos, APKKeys, printMethodInfos, MethodKeys, REPORT_DELIMITER
-
-FlowType: type = dict[Instruction, list[Instruction]]
-StackType: type = list[Instruction]
-
-
-def _buildFlowFromMethod(_method: EncodedMethod) -> (StackType, FlowType):
-    candidate: FlowType = {}
-    offset: int = 0
-    stack: StackType = []
-    for inst in _method.get_instructions():
-        match inst:
-            # Case 'GOTO'
-            case Instruction10t() | Instruction20t() | Instruction30t() as _currentInstruction:
-                # Add the instruction of the method
-                if len(stack) == 0:
-                    stack.append(_currentInstruction)
-                nextInstructionOffset: int = offset + (getOffsetFromGoto(_currentInstruction) * 2)
-                successorGoto: Instruction = _method.get_instruction(0, off=nextInstructionOffset)
-                candidate[_currentInstruction] = [successorGoto]
-            # Case 'IF'
-            case Instruction21t() | Instruction22t() as _currentInstruction:
-                # Add the instruction of the method
-                if len(stack) == 0:
-                    stack.append(_currentInstruction)
-                nextInstructionOffset: int = offset + _currentInstruction.get_length()
-                successorFallthrough: Instruction = _method.get_instruction(0, off=nextInstructionOffset)
-                ifInstructionOffset: int = offset + (getOffsetFromIf(_currentInstruction) * 2)
-                successorIf: Instruction = _method.get_instruction(0, off=ifInstructionOffset)
-                candidate[_currentInstruction] = [successorFallthrough, successorIf]
-            # Case 'RETURN-VOID'
-            case Instruction10x() as _currentInstruction if _currentInstruction.get_op_value() == 0xe:
-                # Add the instruction of the method
-                if len(stack) == 0:
-                    stack.append(inst)
-                candidate[_currentInstruction] = []
-            # CASE 'RETURN-kind' or 'THROW'
-            case Instruction11x() as _currentInstruction if _currentInstruction.get_op_value() in [0xf, 0x10, 0x11,
-                                                                                                   0x27]:
-                # Add the instruction of the method
-                if len(stack) == 0:
-                    stack.append(_currentInstruction)
-                candidate[_currentInstruction] = []
-            # Else
-            case _ as _currentInstruction:
-                # Add the instruction of the method
-                if len(stack) == 0:
-                    stack.append(_currentInstruction)
-                nextInstructionOffset: int = offset + _currentInstruction.get_length()
-                successor: Instruction = _method.get_instruction(0, off=nextInstructionOffset)
-                candidate[_currentInstruction] = [successor]
-        offset += inst.get_length()
-
-    return stack, candidate
+from analyser.budget import Budget
+from analyser.diagnostics import Diagnostic, getSummaryExitCode
+from analyser.flow import buildFlowFromMethod, FlowGraph, getStraightLineInstructions
+from analyser.hierarchy import ClassHierarchy
+from analyser.ir import DecodedInstruction, decodeInstructions
+from analyser.liveness import computeLiveRegisters
+from analyser.pool import getConstantPools
+from analyser.report import ReportSink
+from analyser.solver import solveFixpoint
+from analyser.ssa import SSAForm
+from analyser.worklist import Worklist
+from tools import APKInfos, extractInfosFromMethod, MethodInfos, exitError, ExitCode, printAPKInfos, \
+    printMethodInfos, REPORT_DELIMITER, BudgetExceededException, AnalysisErrorException, REPORT_FULL, REPORT_VERDICT
 
 
 def _genMethodReport(_methodInfos: MethodInfos) -> str:
     return f'{REPORT_DELIMITER}\n' \
-           f'Classname: {_methodInfos[MethodKeys.CLASSNAME]}\n' \
-           f'Methodname: {_methodInfos[MethodKeys.NAME]}\n' \
-           f'Constructor ? {_methodInfos[MethodKeys.CONSTRUCTOR]}\n' \
-           f'Static ? {_methodInfos[MethodKeys.STATIC]}\n' \
-           f'Final ? {_methodInfos[MethodKeys.FINAL]}\n' \
-           f'Synchronized ? {_methodInfos[MethodKeys.SYNCHRONIZED]}\n' \
-           f'Access flag: {_methodInfos[MethodKeys.ACCESS]}\n' \
-           f'Local registers: v{_methodInfos[MethodKeys.LOCALREGISTER][0]}...v{_methodInfos[MethodKeys.LOCALREGISTER][1]} (Count: {_methodInfos[MethodKeys.LOCALREGISTERCOUNT]})\n' \
-           f'Parameters: [ {"  ".join([x[1] for x in _methodInfos[MethodKeys.PARAMS]])} ] (Count: {_methodInfos[MethodKeys.PARAMETERCOUNT]})\n' \
-           f'Return type: {_methodInfos[MethodKeys.RETURNTYPE]}\n'
-
-
-def analyse(_classDefItem: ClassDefItem, _classNameToAnalyse: str, _flag: int, _apkInfos: APKInfos, _analysis: Analysis, _inputFile: str | None, _verbose: bool):
+           f'Classname: {_methodInfos.className}\n' \
+           f'Methodname: {_methodInfos.name}\n' \
+           f'Constructor ? {_methodInfos.constructor}\n' \
+           f'Static ? {_methodInfos.static}\n' \
+           f'Final ? {_methodInfos.final}\n' \
+           f'Synchronized ? {_methodInfos.synchronized}\n' \
+           f'Access flag: {_methodInfos.access}\n' \
+           f'Local registers: v{_methodInfos.localRegisters[0]}...v{_methodInfos.localRegisters[1]} (Count: {_methodInfos.localRegisterCount})\n' \
+           f'Parameters: [ {"  ".join([x[1] for x in _methodInfos.parameters])} ] (Count: {_methodInfos.parameterCount})\n' \
+           f'Return type: {_methodInfos.returnType}\n'
+
+
+def _genMethodSignature(_methodInfos: MethodInfos) -> str:
+    """
+    :param _methodInfos: The infos of the method
+    :return: The signature of the method (ex: 'Lcom/example/A;->f(I)V')
+    """
+    return f'{_methodInfos.className};->{_methodInfos.name}({"".join(x[1] for x in _methodInfos.parameters)}){_methodInfos.returnType}'
+
+
+def _genMethodVerdict(_methodInfos: MethodInfos, _exceeded: str | None, _diagnostic: Diagnostic | None = None) -> str:
+    """
+    :param _methodInfos: The infos of the method
+    :param _exceeded: The limit exceeded by the analysis of the method, None if it completed
+    :param _diagnostic: The error that stopped the analysis of the method, None if there was none
+    :return: The line of the method in a verdict-only report
+    """
+    if _diagnostic is not None:
+        verdict: str = _genErrorLine(_diagnostic)
+    else:
+        verdict: str = 'OK' if _exceeded is None else f'Budget exceeded: {_exceeded}'
+    return f'{_genMethodSignature(_methodInfos)}: {verdict}\n'
+
+
+def _genErrorLine(_diagnostic: Diagnostic) -> str:
+    """
+    :param _diagnostic: The error that stopped the analysis of a method
+    :return: The error, as written after the report of the method
+    """
+    return f'Error at {_diagnostic.getLocation()}: {_diagnostic.code.name}: {_diagnostic.message}'
+
+
+def _genDiagnosticsReport(_diagnostics: list[Diagnostic], _methodCount: int) -> str:
+    """
+    :param _diagnostics: The errors found in the methods of the class
+    :param _methodCount: The number of methods of the class
+    :return: The summary of the errors, written at the end of the report
+    """
+    return f'Diagnostics: {len(_diagnostics)} of {_methodCount} methods stopped on an error\n' + \
+        ''.join(f'\t{diagnostic}\n' for diagnostic in _diagnostics)
+
+
+def _analyseMethodFlow(_analyser: Analyse1 | Analyse2, _method: EncodedMethod, _verbose: bool, _liveness: bool, _budget: Budget | None) -> Worklist:
+    """
+    Analyse the blocks of a method until their memory doesn't change anymore.
+    :param _analyser: The analyser of the method
+    :param _method: The method to analyse
+    :param _verbose: Verbose mode
+    :param _liveness: Only merge the live registers at the entry of the blocks
+    :param _budget: The limits of the analysis, None for unlimited
+    :return: The worklist used, holding the number of visits of each block
+    """
+    flow: FlowGraph = buildFlowFromMethod(_method)
+    if _liveness:
+        flow.liveRegisters = computeLiveRegisters(flow)
+    worklist: Worklist = solveFixpoint(_analyser, flow, _budget=_budget)
+    _analyser.reportFinalStates(flow)
+    if _verbose:
+        print(f'{worklist.visitedBlocks()} blocks analysed in {worklist.totalVisits()} visits')
+    return worklist
+
+
+def _analyseMethodSparse(_analyser: Analyse1 | Analyse2, _method: EncodedMethod, _methodInfos: MethodInfos, _verbose: bool, _budget: Budget | None) -> None:
+    """
+    Analyse a method on its SSA form.
+    :param _analyser: The analyser of the method
+    :param _method: The method to analyse
+    :param _methodInfos: The infos of the method
+    :param _verbose: Verbose mode
+    :param _budget: The limits of the analysis, None for unlimited
+    """
+    ssa: SSAForm = SSAForm(buildFlowFromMethod(_method), _methodInfos.registerCount)
+    walks: int = _analyser.analyseSparse(ssa, _budget)
+    if _verbose:
+        print(f'{sum(len(registers) for registers in ssa.phis)} phis, dominator tree walked {walks} times')
+
+
+def _analyseMethod(_analyser: Analyse1 | Analyse2, _method: EncodedMethod, _verbose: bool, _straightLine: bool, _liveness: bool, _budget: Budget | None) -> None:
+    """
+    Analyse a method, in a single pass if it has no branch, else on its control flow graph.
+    :param _analyser: The analyser of the method
+    :param _method: The method to analyse
+    :param _verbose: Verbose mode
+    :param _straightLine: Use the single pass analysis for methods without branches
+    :param _liveness: Only merge the live registers at the entry of the blocks
+    :param _budget: The limits of the analysis, None for unlimited
+    """
+    instructions: list[DecodedInstruction] | None = getStraightLineInstructions(_method) if _straightLine else None
+    if instructions is None:
+        _analyseMethodFlow(_analyser, _method, _verbose, _liveness, _budget)
+        return
+    _analyser.analyseStraightLine(instructions, _budget)
+    if _verbose:
+        print(f'Branchless method analysed in a single pass ({len(instructions)} instructions)')
+
+
+def _analyseMethodWithinBudget(_analyser: Analyse1 | Analyse2, _method: EncodedMethod, _methodInfos: MethodInfos, _verbose: bool, _straightLine: bool, _liveness: bool, _sparse: bool, _budget: Budget | None) -> str | None:
+    """
+    Analyse a method with the selected mode, stopping it if it exceeds its budget.
+    :param _analyser: The analyser of the method
+    :param _method: The method to analyse
+    :param _methodInfos: The infos of the method
+    :param _verbose: Verbose mode
+    :param _straightLine: Use the single pass analysis for methods without branches
+    :param _liveness: Only merge the live registers at the entry of the blocks
+    :param _sparse: Analyse the method on its SSA form
+    :param _budget: The limits of the analysis, None for unlimited
+    :return: The limit exceeded, None if the analysis completed
+    """
+    try:
+        if _sparse:
+            _analyseMethodSparse(_analyser, _method, _methodInfos, _verbose, _budget)
+        else:
+            _analyseMethod(_analyser, _method, _verbose, _straightLine, _liveness, _budget)
+    except BudgetExceededException as e:
+        if _verbose:
+            print(f'Budget exceeded: {e}')
+        return str(e)
+    return None
+
+
+def _analyseMethodKeepingGoing(_analyser: Analyse1 | Analyse2, _method: EncodedMethod, _methodInfos: MethodInfos, _verbose: bool, _straightLine: bool, _liveness: bool, _sparse: bool, _budget: Budget | None, _diagnostics: list[Diagnostic] | None) -> tuple[str | None, Diagnostic | None]:
+    """
+    Analyse a method within its budget, recording the error that stops it instead of exiting if the errors are collected.
+    The rest of the method isn't analysed: the states following the error are meaningless.
+    :param _diagnostics: The errors found in the previous methods, the new one being added to them, None to exit on the
+    first error
+    :return: The limit exceeded, None if the analysis completed, and the error that stopped it, None if there was none
+    """
+    try:
+        return _analyseMethodWithinBudget(_analyser, _method, _methodInfos, _verbose, _straightLine, _liveness, _sparse, _budget), None
+    except AnalysisErrorException as e:
+        if _diagnostics is None:
+            raise
+        diagnostic: Diagnostic = Diagnostic(_genMethodSignature(_methodInfos), _analyser.getCurrentOffset(), e.code, e.message)
+        _diagnostics.append(diagnostic)
+        return None, diagnostic
+
+
+def _printCacheStatistics(_hierarchy: ClassHierarchy) -> None:
+    """
+    Print the hits and misses of the constant pool cache of each dex file, and of the class hierarchy index
+    :param _hierarchy: The class hierarchy of the APK
+    """
+    for pool in getConstantPools():
+        print(f'Constant pool: {pool}')
+    print(f'Class hierarchy: {_hierarchy}')
+
+
+def _analyseTypes(_analyserType: type[Analyse1] | type[Analyse2], _flag: int, _classDefItem: ClassDefItem, _classNameToAnalyse: str, _apkInfos: APKInfos, _hierarchy: ClassHierarchy, _verbose: bool, _straightLine: bool, _liveness: bool, _sparse: bool, _budget: Budget | None, _reportMode: str, _diagnostics: list[Diagnostic] | None) -> None:
+    """
+    Run the analysis 1 or 2 on every method of a class, the report of each method being written as soon as it is analysed.
+    :param _analyserType: The analyser of the methods (Analyse1 or Analyse2)
+    :param _flag: The number of the analysis
+    :param _diagnostics: The errors of the methods, collected instead of exiting on the first one, None to exit
+    """
+    # Extract all the methods from the class
+    methods: list[EncodedMethod] = _classDefItem.get_methods()
+    with open(f'{_classNameToAnalyse}.report', 'w') as f, ReportSink(f) as report:
+        report.write(f'Analysis {_flag} on class \'{_classNameToAnalyse}\'\n\n')
+        for currentMethod in methods:
+            # Load the method infos if not already loaded
+            currentMethod.load()
+
+            # Extract the method infos for the instruction analysis
+            methodInfos: MethodInfos = extractInfosFromMethod(currentMethod)
+
+            analyser: Analyse1 | Analyse2 = _analyserType(_apkInfos, methodInfos, _hierarchy, _verbose, _reportMode, report)
+            if _verbose:
+                currentMethod.show()
+            if _reportMode != REPORT_VERDICT:
+                report.write(_genMethodReport(methodInfos))
+            exceeded, diagnostic = _analyseMethodKeepingGoing(analyser, currentMethod, methodInfos, _verbose, _straightLine, _liveness, _sparse, _budget, _diagnostics)
+            if _reportMode == REPORT_VERDICT:
+                report.write(_genMethodVerdict(methodInfos, exceeded, diagnostic))
+            else:
+                if exceeded is not None:
+                    report.write(f'Budget exceeded: {exceeded}\n')
+                if diagnostic is not None:
+                    report.write(f'{_genErrorLine(diagnostic)}\n')
+                report.write(f'{REPORT_DELIMITER}\n\n')
+            report.flush()
+        if _diagnostics:
+            report.write(_genDiagnosticsReport(_diagnostics, len(methods)))
+    if _verbose:
+        _printCacheStatistics(_hierarchy)
+
+
+def analyse(_classDefItem: ClassDefItem, _classNameToAnalyse: str, _flag: int, _apkInfos: APKInfos, _hierarchy: ClassHierarchy, _inputFile: str | None, _verbose: bool, _straightLine: bool = True, _liveness: bool = False, _sparse: bool = False, _budget: Budget | None = None, _reportMode: str = REPORT_FULL, _keepGoing: bool = False):
+    # Errors of the analyses 1 and 2, collected when they don't stop the program
+    diagnostics: list[Diagnostic] | None = [] if _keepGoing else None
     match _flag:
         case 1:
-            # Extract all the methods from the class
-            methods: list[EncodedMethod] = _classDefItem.get_methods()
-            report: str = f'Analysis 1 on class \'{_classNameToAnalyse}\'\n\n'
-            for currentMethod in methods:
-                # Load the method infos if not already loaded
-                currentMethod.load()
-
-                # Extract the method infos for the instruction analysis
-                methodInfos: MethodInfos = extractInfosFromMethod(currentMethod)
-                report += _genMethodReport(methodInfos)
-
-                analyser: Analyse1 = Analyse1(_apkInfos, methodInfos, _analysis, _verbose)
-                if _verbose:
-                    currentMethod.show()
-                stack, flow = _buildFlowFromMethod(currentMethod)
-
-                while len(stack) != 0:
-                    currentInstruction: Instruction = stack.pop(0)
-                    predecessors: list[Instruction] = [key for key, values in flow.items() if
-                                                       currentInstruction in values]
-                    if analyser.analyse(currentInstruction, predecessors=predecessors):
-                        stack.extend(flow[currentInstruction])
-                report += analyser.collect()
-                report += f'{REPORT_DELIMITER}\n\n'
-            with open(f'{_classNameToAnalyse}.report', 'w') as f:
-                f.write(report)
+            _analyseTypes(Analyse1, _flag, _classDefItem, _classNameToAnalyse, _apkInfos, _hierarchy, _verbose, _straightLine, _liveness, _sparse, _budget, _reportMode, diagnostics)
         case 2:
-            # Extract all the methods from the class
-            methods: list[EncodedMethod] = _classDefItem.get_methods()
-            report: str = f'Analysis 2 on class \'{_classNameToAnalyse}\'\n\n'
-            for currentMethod in methods:
-                # Load the method infos if not already loaded
-                currentMethod.load()
-
-                # Extract the method infos for the instruction analysis
-                methodInfos: MethodInfos = extractInfosFromMethod(currentMethod)
-                report += _genMethodReport(methodInfos)
-
-                analyser: Analyse2 = Analyse2(_apkInfos, methodInfos, _analysis, _verbose)
-                if _verbose:
-                    currentMethod.show()
-                stack, flow = _buildFlowFromMethod(currentMethod)
-
-                while len(stack) != 0:
-                    currentInstruction: Instruction = stack.pop(0)
-                    predecessors: list[Instruction] = [key for key, values in flow.items() if
-                                                       currentInstruction in values]
-                    if analyser.analyse(currentInstruction, predecessors=predecessors):
-                        stack.extend(flow[currentInstruction])
-                report += analyser.collect()
-                report += f'{REPORT_DELIMITER}\n\n'
-            with open(f'{_classNameToAnalyse}.report', 'w') as f:
-                f.write(report)
+            _analyseTypes(Analyse2, _flag, _classDefItem, _classNameToAnalyse, _apkInfos, _hierarchy, _verbose, _straightLine, _liveness, _sparse, _budget, _reportMode, diagnostics)
         case 3:
             # Extract all the methods from the class
             methods: list[EncodedMethod] = _classDefItem.get_methods()
-            _collectedIntents: list[str] = []
-            for currentMethod in methods:
-                # Load the method infos if not already loaded
-                currentMethod.load()
-
-                # Extract the method infos for the instruction analysis
-                methodInfos: MethodInfos = extractInfosFromMethod(currentMethod)
-                analyser: Analyse3 = Analyse3(_apkInfos, methodInfos, _analysis, _verbose)
-                if _verbose:
-                    currentMethod.show()
-
-                for instruction in currentMethod.get_instructions():
-                    analyser.analyse(instruction)
-                _collectedIntents.extend(analyser.collect())
-            with open(f'{_classNameToAnalyse}.report', 'w') as f:
-                sys.stdout = f
-                print(f'Analysis 3 on class \'{_classNameToAnalyse}\'\n')
-                printAPKInfos(_apkInfos)
-                print('\nIntents:')
-                [print(f'\t{intent}') for intent in _collectedIntents]
+            # The intents of each method are written as soon as it is analysed
+            with open(f'{_classNameToAnalyse}.report', 'w') as f, ReportSink(f) as report:
+                report.write(f'Analysis 3 on class \'{_classNameToAnalyse}\'\n\n')
+                printAPKInfos(_apkInfos, report)
+                report.write('\nIntents:\n')
+                report.flush()
+                for currentMethod in methods:
+                    # Load the method infos if not already loaded
+                    currentMethod.load()
+
+                    # Extract the method infos for the instruction analysis
+                    methodInfos: MethodInfos = extractInfosFromMethod(currentMethod)
+                    analyser: Analyse3 = Analyse3(_apkInfos, methodInfos, _hierarchy, _verbose)
+                    if _verbose:
+                        currentMethod.show()
+
+                    for instruction in decodeInstructions(currentMethod.get_instructions()):
+                        analyser.analyse(instruction)
+                    for intent in analyser.collect():
+                        report.write(f'\t{intent}\n')
+                    report.flush()
+            if _verbose:
+                _printCacheStatistics(_hierarchy)
         case _:
             exitError(f'Unknown flag {_flag} in engine.analyse()', ExitCode.UNHANDLED_CASE)
+    if diagnostics:
+        exitError(f'{len(diagnostics)} methods of class \'{_classNameToAnalyse}\' stopped on an error', getSummaryExitCode(diagnostics))
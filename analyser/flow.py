@@ -0,0 +1,434 @@
+from array import array
+from bisect import bisect_right
+from androguard.core.bytecodes.dvm import EncodedMethod, Instruction21t, Instruction22t, Instruction30t, \
+    Instruction20t, Instruction10t, Instruction, Instruction10x, Instruction11x, EncodedCatchHandler
+from analyser.ir import DecodedInstruction, decodeInstructions
+from analyser.pool import ConstantPool, getConstantPool
+from tools import getOffsetFromGoto, getOffsetFromIf
+
+# Typecode of the index arrays
+INDEX_TYPECODE: str = 'I'
+
+OffsetIndexType: type = dict[int, int]
+AdjacencyListType: type = list[list[int]]
+# Handlers of a try range, in the order they are tested: offset of the handler and caught type (None for catch-all)
+HandlerListType: type = list[tuple[int, str | None]]
+
+# Opcodes that never throw: nop, move*, return*, const* (but const-string and const-class), goto*, switches, cmp*,
+# if* and the arithmetic operations other than the integer divisions and remainders
+_NON_THROWING_OPCODES: frozenset[int] = frozenset(
+    list(range(0x00, 0x1a)) + list(range(0x28, 0x3e)) + list(range(0x7b, 0x90))
+    + [op for op in range(0x90, 0xe3) if op not in (0x93, 0x94, 0x9e, 0x9f, 0xb3, 0xb4, 0xbe, 0xbf, 0xd3, 0xd4, 0xdb, 0xdc)]
+)
+
+
+class AdjacencyArrays:
+    """
+    Adjacency lists stored in compressed sparse row form: the neighbours of node `i` are
+    `targets[offsets[i]:offsets[i + 1]]`.
+    """
+    offsets: array
+    targets: array
+
+    def __init__(self, adjacency: AdjacencyListType):
+        self.offsets = array(INDEX_TYPECODE, [0])
+        self.targets = array(INDEX_TYPECODE)
+        for neighbours in adjacency:
+            self.targets.extend(neighbours)
+            self.offsets.append(len(self.targets))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def get(self, _index: int) -> array:
+        """
+        :param _index: The index of the node
+        :return: The neighbours of the node
+        """
+        return self.targets[self.offsets[_index]:self.offsets[_index + 1]]
+
+    def count(self, _index: int) -> int:
+        """
+        :param _index: The index of the node
+        :return: The number of neighbours of the node
+        """
+        return self.offsets[_index + 1] - self.offsets[_index]
+
+    def reverse(self) -> 'AdjacencyArrays':
+        """
+        Reverse the edges.
+        Sources are listed in increasing order and only once, even if a node reaches the same neighbour through
+        several edges.
+        :return: The reversed adjacency arrays
+        """
+        reversedAdjacency: AdjacencyListType = [[] for _ in range(len(self))]
+        for source in range(len(self)):
+            for target in self.get(source):
+                sources: list[int] = reversedAdjacency[target]
+                if len(sources) == 0 or sources[-1] != source:
+                    sources.append(source)
+        return AdjacencyArrays(reversedAdjacency)
+
+
+class FlowGraph:
+    """
+    Control flow graph of a method.
+    Instructions are identified by their index in the method, and basic blocks by their index in `blockStarts`:
+    block `b` holds the instructions `blockStarts[b]` to `blockStarts[b + 1] - 1`, block 0 being the entry block.
+    """
+    instructions: list[DecodedInstruction]
+    successors: AdjacencyArrays
+    predecessors: AdjacencyArrays
+    blockStarts: array
+    blockSuccessors: AdjacencyArrays
+    blockPredecessors: AdjacencyArrays
+    # Registers live at the entry of each block (bitmasks), None if the liveness analysis wasn't run
+    liveRegisters: list[int] | None
+    # Types caught by each exception handler (keyed by the index of its first instruction), None for catch-all
+    handlerTypes: dict[int, list[str | None]]
+    # Handlers of the first instruction (keyed by the index of their first instruction), which receive the memory at the
+    # entry of the method. True if the edge from the entry block only stands for that exception, False if the exit
+    # memory of the first instruction reaches the handler too (its successor throws to the same handler)
+    entryHandlers: dict[int, bool]
+
+    def __init__(self, instructions: list[DecodedInstruction], successors: AdjacencyListType, handlerTypes: dict[int, list[str | None]] | None = None, entryHandlers: dict[int, bool] | None = None):
+        self.instructions = instructions
+        self.handlerTypes = handlerTypes if handlerTypes is not None else {}
+        self.entryHandlers = entryHandlers if entryHandlers is not None else {}
+        self.successors = AdjacencyArrays(successors)
+        self.predecessors = self.successors.reverse()
+
+        # Split the instructions into blocks
+        self.blockStarts = array(INDEX_TYPECODE)
+        blockOfInstruction: array = array(INDEX_TYPECODE)
+        for index in range(len(instructions)):
+            if self._isLeader(index):
+                self.blockStarts.append(index)
+            blockOfInstruction.append(len(self.blockStarts) - 1)
+        self.blockStarts.append(len(instructions))
+
+        # The successors of a block are the successors of its last instruction, which are all leaders
+        self.blockSuccessors = AdjacencyArrays([
+            [blockOfInstruction[successor] for successor in self.successors.get(self.blockStarts[block + 1] - 1)]
+            for block in range(self.blockCount())
+        ])
+        self.blockPredecessors = self.blockSuccessors.reverse()
+        self.liveRegisters = None
+
+    def _isLeader(self, _index: int) -> bool:
+        """
+        Check if an instruction starts a basic block: it is the entry, it can be reached from several places, or
+        it isn't the only successor of the previous instruction.
+        :param _index: The index of the instruction
+        :return: Boolean
+        """
+        if _index == 0 or self.predecessors.count(_index) != 1:
+            return True
+        return self.predecessors.get(_index)[0] != _index - 1 or self.successors.count(_index - 1) != 1
+
+    def blockCount(self) -> int:
+        return len(self.blockStarts) - 1
+
+    def getBlockInstructions(self, _block: int) -> list[DecodedInstruction]:
+        """
+        :param _block: The index of the block
+        :return: The instructions of the block, in order
+        """
+        return self.instructions[self.blockStarts[_block]:self.blockStarts[_block + 1]]
+
+    def getBlockLeader(self, _block: int) -> DecodedInstruction:
+        return self.instructions[self.blockStarts[_block]]
+
+    def getBlockLast(self, _block: int) -> DecodedInstruction:
+        return self.instructions[self.blockStarts[_block + 1] - 1]
+
+    def isHandler(self, _block: int) -> bool:
+        return self.blockStarts[_block] in self.handlerTypes
+
+    def isEntryHandler(self, _block: int) -> bool:
+        """
+        :param _block: The index of the block
+        :return: True if the block is a handler of the first instruction, which receives the memory at the entry of the
+        method
+        """
+        return self.blockStarts[_block] in self.entryHandlers
+
+    def isEntryOnlyEdge(self, _predecessor: int, _block: int) -> bool:
+        """
+        :param _predecessor: The index of the predecessor block
+        :param _block: The index of the block
+        :return: True if the edge only stands for an exception of the first instruction: the block receives the memory at
+        the entry of the method instead of the exit memory of the predecessor
+        """
+        return _predecessor == 0 and self.entryHandlers.get(self.blockStarts[_block], False)
+
+    def getCaughtTypes(self, _block: int) -> list[str | None]:
+        """
+        :param _block: The index of the block
+        :return: The types caught by the block if it is an exception handler (None for catch-all), else an empty list
+        """
+        return self.handlerTypes.get(self.blockStarts[_block], [])
+
+    def reversePostorder(self) -> array:
+        """
+        Number the blocks reachable from the entry in reverse postorder: apart from loop back edges, a block is
+        always numbered after all of its predecessors.
+        :return: The reverse postorder number of each block (-1 for unreachable blocks)
+        """
+        postorder: list[int] = []
+        if self.blockCount() > 0:
+            visited: bytearray = bytearray(self.blockCount())
+            visited[0] = 1
+            # Iterative depth first search, each entry holds a block and the index of its next successor to explore
+            todo: list[tuple[int, int]] = [(0, 0)]
+            while len(todo) > 0:
+                block, successorIndex = todo[-1]
+                if successorIndex < self.blockSuccessors.count(block):
+                    todo[-1] = (block, successorIndex + 1)
+                    successor: int = self.blockSuccessors.get(block)[successorIndex]
+                    if not visited[successor]:
+                        visited[successor] = 1
+                        todo.append((successor, 0))
+                else:
+                    todo.pop()
+                    postorder.append(block)
+        order: array = array('i', [-1] * self.blockCount())
+        for number, block in enumerate(reversed(postorder)):
+            order[block] = number
+        return order
+
+    def loopHeads(self, _order: array) -> bytearray:
+        """
+        Find the loop heads: the reachable blocks targeted by a back edge, ie. by a predecessor which doesn't come
+        before them in reverse postorder.
+        :param _order: The reverse postorder number of each block
+        :return: For each block, 1 if it is a loop head
+        """
+        heads: bytearray = bytearray(self.blockCount())
+        for block in range(self.blockCount()):
+            if _order[block] < 0:
+                continue
+            for predecessor in self.blockPredecessors.get(block):
+                if _order[predecessor] >= _order[block]:
+                    heads[block] = 1
+                    break
+        return heads
+
+
+class TryIndex:
+    """
+    Interval index over the try ranges of a method.
+    The dex format flattens nested try blocks into sorted and non-overlapping ranges, each one listing the handlers of
+    all its enclosing blocks, so the range holding an offset is found by a binary search on the starts of the ranges.
+    Offsets are in bytes, like the offsets of the instructions.
+    """
+    _starts: array
+    _ends: array
+    _handlers: list[HandlerListType]
+    # Types caught by each handler (keyed by handler offset), in the order they are first found
+    caughtTypes: dict[int, list[str | None]]
+
+    def __init__(self, starts: array, ends: array, handlers: list[HandlerListType]):
+        self._starts = starts
+        self._ends = ends
+        self._handlers = handlers
+        self.caughtTypes = {}
+        for rangeHandlers in handlers:
+            for handlerOffset, caughtType in rangeHandlers:
+                types: list[str | None] = self.caughtTypes.setdefault(handlerOffset, [])
+                if caughtType not in types:
+                    types.append(caughtType)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def getHandlers(self, _offset: int) -> HandlerListType:
+        """
+        :param _offset: The offset of an instruction
+        :return: The handlers of the try range holding the instruction, empty if it is outside of any try range
+        """
+        position: int = bisect_right(self._starts, _offset) - 1
+        if position < 0 or _offset >= self._ends[position]:
+            return []
+        return self._handlers[position]
+
+
+def buildTryIndex(_method: EncodedMethod) -> TryIndex:
+    """
+    Load the try ranges and the handlers of a method into an interval index.
+    :param _method: The method
+    :return: The index of the try ranges of the method
+    """
+    starts: array = array(INDEX_TYPECODE)
+    ends: array = array(INDEX_TYPECODE)
+    handlers: list[HandlerListType] = []
+    code = _method.get_code()
+    if code is None or code.get_tries_size() == 0:
+        return TryIndex(starts, ends, handlers)
+
+    # Try items reference their handlers by offset from the start of the encoded handler list
+    listOffset: int = code.get_handlers().get_off()
+    catchHandlers: dict[int, EncodedCatchHandler] = {catchHandler.get_off() - listOffset: catchHandler
+                                                     for catchHandler in code.get_handlers().get_list()}
+    decodedHandlers: dict[int, HandlerListType] = {}
+    pool: ConstantPool = getConstantPool(_method.CM)
+    for tryItem in sorted(code.get_tries(), key=lambda item: item.get_start_addr()):
+        # Addresses are counted in 16 bits code units
+        starts.append(tryItem.get_start_addr() * 2)
+        ends.append((tryItem.get_start_addr() + tryItem.get_insn_count()) * 2)
+        if tryItem.get_handler_off() not in decodedHandlers:
+            catchHandler: EncodedCatchHandler = catchHandlers[tryItem.get_handler_off()]
+            rangeHandlers: HandlerListType = [(pair.get_addr() * 2, pool.getType(pair.get_type_idx()))
+                                              for pair in catchHandler.get_handlers()]
+            if catchHandler.get_size() <= 0:
+                rangeHandlers.append((catchHandler.get_catch_all_addr() * 2, None))
+            decodedHandlers[tryItem.get_handler_off()] = rangeHandlers
+        handlers.append(decodedHandlers[tryItem.get_handler_off()])
+    return TryIndex(starts, ends, handlers)
+
+
+def _buildOffsetIndex(_instructions: list[Instruction]) -> (list[int], OffsetIndexType):
+    """
+    Compute the offset of every instruction of a method in a single pass.
+    :param _instructions: The instructions of the method, in order
+    :return: The offset of each instruction (same order), and the offset -> instruction index
+    """
+    offsets: list[int] = []
+    offsetIndex: OffsetIndexType = {}
+    offset: int = 0
+    for index, instruction in enumerate(_instructions):
+        offsets.append(offset)
+        offsetIndex[offset] = index
+        offset += instruction.get_length()
+    return offsets, offsetIndex
+
+
+def _getInstructionAt(_offsetIndex: OffsetIndexType, _offset: int, _last: int) -> int:
+    """
+    Retrieve the index of the instruction located at a given offset.
+    Androguard's `get_instruction(0, off=...)` falls back to the last instruction of the method when the offset
+    doesn't match any instruction, so the same fallback is kept here.
+    :param _offsetIndex: The offset -> instruction index of the method
+    :param _offset: The offset of the wanted instruction
+    :param _last: The index of the last instruction of the method
+    :return: The index of the instruction at the given offset
+    """
+    return _offsetIndex.get(_offset, _last)
+
+
+def _addHandlerEdges(_instructions: list[Instruction], _offsets: list[int], _offsetIndex: OffsetIndexType, _tryIndex: TryIndex, _successors: AdjacencyListType) -> (dict[int, list[str | None]], dict[int, bool]):
+    """
+    Add the exception edges to the successors of the instructions (in place).
+    A handler receives the memory before the throwing instruction, so it becomes a successor of the predecessors of
+    that instruction, which then starts a new block. The entry has no predecessor: the handlers of the first
+    instruction receive the memory at the entry of the method, and are made successors of the first instruction so they
+    are reached from the entry block.
+    :param _instructions: The instructions of the method, in order
+    :param _offsets: The offset of each instruction
+    :param _offsetIndex: The offset -> instruction index of the method
+    :param _tryIndex: The index of the try ranges of the method
+    :param _successors: The normal successors of each instruction
+    :return: The types caught by each handler, and the handlers of the first instruction (True if the exit memory of the
+    first instruction doesn't reach them), keyed by the index of their first instruction
+    """
+    last: int = len(_instructions) - 1
+    # Handlers of each instruction, through a single lookup in the interval index per instruction
+    throwsTo: list[list[int]] = []
+    for offset, inst in zip(_offsets, _instructions):
+        if inst.get_op_value() in _NON_THROWING_OPCODES:
+            throwsTo.append([])
+        else:
+            throwsTo.append([_getInstructionAt(_offsetIndex, handlerOffset, last)
+                             for handlerOffset, _ in _tryIndex.getHandlers(offset)])
+
+    for index in range(len(_successors)):
+        for source in _successors[index].copy():
+            for handler in throwsTo[source]:
+                if handler not in _successors[index]:
+                    _successors[index].append(handler)
+
+    entryHandlers: dict[int, bool] = {}
+    if len(_successors) > 0:
+        for handler in throwsTo[0]:
+            entryHandlers[handler] = handler not in _successors[0]
+            if entryHandlers[handler]:
+                _successors[0].append(handler)
+
+    return {_getInstructionAt(_offsetIndex, handlerOffset, last): types
+            for handlerOffset, types in _tryIndex.caughtTypes.items()}, entryHandlers
+
+
+def buildFlowFromMethod(_method: EncodedMethod) -> FlowGraph:
+    """
+    Build the control flow graph of a method, exception edges included. The instructions of the graph are decoded once
+    here, so the analyses don't go back to androguard when they visit them again.
+    Each branch target is resolved through an offset index and the handlers of each instruction through an interval
+    index over the try ranges, so the construction stays quasi-linear in the method size.
+    :param _method: The method to build the flow from
+    :return: The control flow graph of the method
+    """
+    instructions: list[Instruction] = list(_method.get_instructions())
+    offsets, offsetIndex = _buildOffsetIndex(instructions)
+    last: int = len(instructions) - 1
+    candidate: AdjacencyListType = []
+    for offset, inst in zip(offsets, instructions):
+        match inst:
+            # Case 'GOTO'
+            case Instruction10t() | Instruction20t() | Instruction30t() as _currentInstruction:
+                nextInstructionOffset: int = offset + (getOffsetFromGoto(_currentInstruction) * 2)
+                candidate.append([_getInstructionAt(offsetIndex, nextInstructionOffset, last)])
+            # Case 'IF'
+            case Instruction21t() | Instruction22t() as _currentInstruction:
+                nextInstructionOffset: int = offset + _currentInstruction.get_length()
+                successorFallthrough: int = _getInstructionAt(offsetIndex, nextInstructionOffset, last)
+                ifInstructionOffset: int = offset + (getOffsetFromIf(_currentInstruction) * 2)
+                successorIf: int = _getInstructionAt(offsetIndex, ifInstructionOffset, last)
+                candidate.append([successorFallthrough, successorIf])
+            # Case 'RETURN-VOID'
+            case Instruction10x() as _currentInstruction if _currentInstruction.get_op_value() == 0xe:
+                candidate.append([])
+            # CASE 'RETURN-kind' or 'THROW'
+            case Instruction11x() as _currentInstruction if _currentInstruction.get_op_value() in [0xf, 0x10, 0x11,
+                                                                                                   0x27]:
+                candidate.append([])
+            # Else
+            case _ as _currentInstruction:
+                nextInstructionOffset: int = offset + _currentInstruction.get_length()
+                candidate.append([_getInstructionAt(offsetIndex, nextInstructionOffset, last)])
+
+    tryIndex: TryIndex = buildTryIndex(_method)
+    if len(tryIndex) == 0:
+        return FlowGraph(decodeInstructions(instructions), candidate)
+    handlerTypes, entryHandlers = _addHandlerEdges(instructions, offsets, offsetIndex, tryIndex, candidate)
+    return FlowGraph(decodeInstructions(instructions), candidate, handlerTypes, entryHandlers)
+
+
+def getStraightLineInstructions(_method: EncodedMethod) -> list[DecodedInstruction] | None:
+    """
+    Retrieve the instructions of a method without any branch, up to its first return or throw.
+    Such a method is a single basic block, so it can be analysed in one forward pass instead of going through the
+    control flow graph.
+    :param _method: The method to check
+    :return: The decoded instructions executed by the method, or None if the method has a branch or doesn't end with an
+    exit
+    """
+    # The exception handlers are only reached through the control flow graph
+    code = _method.get_code()
+    if code is not None and code.get_tries_size() > 0:
+        return None
+    candidate: list[Instruction] = []
+    for inst in _method.get_instructions():
+        candidate.append(inst)
+        match inst:
+            # Case 'GOTO' or 'IF'
+            case Instruction10t() | Instruction20t() | Instruction30t() | Instruction21t() | Instruction22t():
+                return None
+            # Case 'RETURN-VOID'
+            case Instruction10x() as _currentInstruction if _currentInstruction.get_op_value() == 0xe:
+                return decodeInstructions(candidate)
+            # CASE 'RETURN-kind' or 'THROW'
+            case Instruction11x() as _currentInstruction if _currentInstruction.get_op_value() in [0xf, 0x10, 0x11,
+                                                                                                   0x27]:
+                return decodeInstructions(candidate)
+    # Falling off the end of the method loops on the last instruction (see `_getInstructionAt()`)
+    return None
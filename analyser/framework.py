@@ -0,0 +1,157 @@
+import mmap
+import re
+import struct
+from os import listdir
+from os.path import join, dirname, abspath, isdir
+
+# Folder of the snapshots of the framework hierarchy, one file per API level
+SNAPSHOT_FOLDER: str = join(dirname(dirname(abspath(__file__))), 'snapshots')
+SNAPSHOT_NAME: str = 'android-{}.hierarchy'
+_SNAPSHOT_NAME_PATTERN: re.Pattern = re.compile(r'^android-(\d+)\.hierarchy$')
+
+SNAPSHOT_MAGIC: bytes = b'AFHS'
+SNAPSHOT_FORMAT_VERSION: int = 1
+# Magic, format version, API level, number of classes, number of names, number of parents
+_HEADER: struct.Struct = struct.Struct('<4sHHIII')
+# Offset of the first parent of a class in the parents table, then its number of parents
+_CLASS: struct.Struct = struct.Struct('<IH')
+_OFFSET: struct.Struct = struct.Struct('<I')
+
+
+class FrameworkSnapshot:
+    """
+    Hierarchy of the classes of the Android framework for an API level, read from a snapshot generated offline
+    (`snapshots/generate.py`) and mapped in memory, so nothing is read from the file but the entries looked up.
+    Layout of a snapshot, little-endian, after the header:
+    - the offsets of the names in the names blob (one more than the number of names, the last one being its size)
+    - for each class, the offset of its parents in the parents table and its number of parents
+    - the parents table: indexes of names
+    - the names blob: the descriptors, encoded in UTF-8
+    The names are sorted by their UTF-8 bytes, the classes first, so a class is found with a binary search on the
+    names and its entry has the same index.
+    """
+    apiLevel: int
+    _buffer: mmap.mmap
+    _classCount: int
+    _nameCount: int
+    _offsetsStart: int
+    _classesStart: int
+    _parentsStart: int
+    _namesStart: int
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError(f'{path} is not a framework snapshot')
+        magic, formatVersion, self.apiLevel, self._classCount, self._nameCount, parentCount = _HEADER.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f'{path} is not a framework snapshot')
+        if formatVersion != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f'{path}: unsupported snapshot format version {formatVersion} (expected {SNAPSHOT_FORMAT_VERSION})')
+        self._offsetsStart = _HEADER.size
+        self._classesStart = self._offsetsStart + (self._nameCount + 1) * _OFFSET.size
+        self._parentsStart = self._classesStart + self._classCount * _CLASS.size
+        self._namesStart = self._parentsStart + parentCount * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._classCount
+
+    def _getName(self, _index: int) -> bytes:
+        """
+        :param _index: The index of the name
+        :return: The name, encoded in UTF-8
+        """
+        start, end = struct.unpack_from('<II', self._buffer, self._offsetsStart + _index * _OFFSET.size)
+        return self._buffer[self._namesStart + start:self._namesStart + end]
+
+    def _findClass(self, _className: bytes) -> int | None:
+        """
+        :param _className: The name of the class, encoded in UTF-8
+        :return: The index of the class, None if it isn't in the snapshot
+        """
+        low: int = 0
+        high: int = self._classCount
+        while low < high:
+            middle: int = (low + high) // 2
+            name: bytes = self._getName(middle)
+            if name < _className:
+                low = middle + 1
+            elif name > _className:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def getParents(self, _className: str) -> list[str] | None:
+        """
+        :param _className: The name of the class
+        :return: The superclass and the interfaces of the class, None if the class isn't in the snapshot
+        """
+        index: int | None = self._findClass(_className.encode())
+        if index is None:
+            return None
+        start, count = _CLASS.unpack_from(self._buffer, self._classesStart + index * _CLASS.size)
+        parents: tuple[int, ...] = struct.unpack_from(f'<{count}I', self._buffer, self._parentsStart + start * _OFFSET.size)
+        return [self._getName(parent).decode() for parent in parents]
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+def writeSnapshot(_path: str, _apiLevel: int, _parents: dict[str, list[str]]) -> None:
+    """
+    Write the snapshot of the framework hierarchy of an API level, in the layout read by FrameworkSnapshot.
+    :param _path: The path of the snapshot file
+    :param _apiLevel: The API level of the framework
+    :param _parents: The superclass and the interfaces of each class of the framework
+    """
+    classes: list[bytes] = sorted(name.encode() for name in _parents)
+    # Parents which aren't classes of the framework are only names, after the classes
+    classSet: set[bytes] = set(classes)
+    others: list[bytes] = sorted({parent.encode() for parents in _parents.values() for parent in parents} - classSet)
+    names: list[bytes] = classes + others
+    indexes: dict[bytes, int] = {name: index for index, name in enumerate(names)}
+
+    offsets: list[int] = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+    classEntries: list[bytes] = []
+    parentsTable: list[int] = []
+    for name in classes:
+        parents: list[str] = _parents[name.decode()]
+        classEntries.append(_CLASS.pack(len(parentsTable), len(parents)))
+        parentsTable.extend(indexes[parent.encode()] for parent in parents)
+
+    with open(_path, 'wb') as file:
+        file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, _apiLevel, len(classes), len(names), len(parentsTable)))
+        file.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        file.write(b''.join(classEntries))
+        file.write(struct.pack(f'<{len(parentsTable)}I', *parentsTable))
+        file.write(b''.join(names))
+
+
+def getSnapshotLevels(_folder: str = SNAPSHOT_FOLDER) -> list[int]:
+    """
+    :param _folder: The folder of the snapshots
+    :return: The API levels of the available snapshots, in increasing order
+    """
+    if not isdir(_folder):
+        return []
+    return sorted(int(match.group(1)) for match in map(_SNAPSHOT_NAME_PATTERN.match, listdir(_folder)) if match)
+
+
+def loadFrameworkSnapshot(_apiLevel: int | None, _folder: str = SNAPSHOT_FOLDER) -> FrameworkSnapshot | None:
+    """
+    Load the snapshot of the closest API level: the highest level not above the one asked, else the lowest level
+    available.
+    :param _apiLevel: The API level targeted by the APK, None if it isn't known (the highest level is loaded)
+    :param _folder: The folder of the snapshots
+    :return: The snapshot, None if there is no snapshot in the folder
+    """
+    levels: list[int] = getSnapshotLevels(_folder)
+    if len(levels) == 0:
+        return None
+    candidates: list[int] = [level for level in levels if _apiLevel is None or level <= _apiLevel]
+    level: int = candidates[-1] if len(candidates) > 0 else levels[0]
+    return FrameworkSnapshot(join(_folder, SNAPSHOT_NAME.format(level)))
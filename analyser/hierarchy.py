@@ -0,0 +1,130 @@
+from androguard.core.bytecodes.dvm import DalvikVMFormat
+from analyser.framework import FrameworkSnapshot
+from tools import SMALI_OBJECT_TYPE
+
+# Superclass and interfaces of each class
+ClassParentsType: type = dict[str, list[str]]
+
+
+class ClassHierarchy:
+    """
+    Index of the class hierarchy of an APK, filled lazily from the parents of its classes. The classes which aren't in
+    the APK are looked up in the snapshot of the framework hierarchy, if there is one.
+    The ancestors (superclasses and interfaces) of a class are collected once, so a subtype test is a set lookup, and
+    the closest common parent of two classes is kept once computed.
+    """
+    _parents: ClassParentsType
+    _framework: FrameworkSnapshot | None
+    # Ancestors of each class, the class itself included and Object excluded
+    _ancestors: dict[str, frozenset[str]]
+    # First ancestor missing from the APK, for the classes whose hierarchy isn't fully known
+    _missing: dict[str, str]
+    _closestParents: dict[tuple[str, str], str]
+    # Hits and misses of the ancestors and closest parents caches
+    hits: dict[str, int]
+    misses: dict[str, int]
+
+    def __init__(self, parents: ClassParentsType, framework: FrameworkSnapshot | None = None):
+        self._parents = parents
+        self._framework = framework
+        self._ancestors = {}
+        self._missing = {}
+        self._closestParents = {}
+        self.hits = {'ancestors': 0, 'closest parents': 0}
+        self.misses = {'ancestors': 0, 'closest parents': 0}
+
+    def _getParents(self, _className: str) -> list[str] | None:
+        """
+        :param _className: The name of the class
+        :return: The superclass and the interfaces of the class, None if the class is neither in the APK nor in the
+        framework
+        """
+        parents: list[str] | None = self._parents.get(_className)
+        if parents is None and self._framework is not None:
+            parents = self._framework.getParents(_className)
+            if parents is not None:
+                self._parents[_className] = parents
+        return parents
+
+    def getAncestors(self, _className: str) -> frozenset[str]:
+        """
+        :param _className: The name of the class
+        :return: The ancestors of the class, the class itself included and Object excluded
+        """
+        ancestors: frozenset[str] | None = self._ancestors.get(_className)
+        if ancestors is not None:
+            self.hits['ancestors'] += 1
+            return ancestors
+        self.misses['ancestors'] += 1
+        todo: list[str] = [_className]
+        done: set[str] = set()
+        while len(todo) > 0:
+            current: str = todo.pop()
+            if current in done or current == SMALI_OBJECT_TYPE:
+                continue
+            done.add(current)
+            parents: list[str] | None = self._getParents(current)
+            if parents is None:
+                self._missing.setdefault(_className, current)
+            else:
+                todo.extend(parents)
+        ancestors = self._ancestors[_className] = frozenset(done)
+        return ancestors
+
+    def getMissingAncestor(self, _className: str) -> str | None:
+        """
+        :param _className: The name of the class
+        :return: An ancestor of the class missing from the APK and the framework, None if the whole hierarchy of the class is known
+        """
+        self.getAncestors(_className)
+        return self._missing.get(_className)
+
+    def getClosestParent(self, _first: str, _second: str) -> str:
+        """
+        :param _first: The name of the first class
+        :param _second: The name of the second class
+        :return: The first ancestor of the second class, in breadth-first order, which is an ancestor of the first class,
+        Object if there is none
+        """
+        closestParent: str | None = self._closestParents.get((_first, _second))
+        if closestParent is not None:
+            self.hits['closest parents'] += 1
+            return closestParent
+        self.misses['closest parents'] += 1
+        firstAncestors: frozenset[str] = self.getAncestors(_first)
+        closestParent = SMALI_OBJECT_TYPE
+        todo: list[str] = [_second]
+        done: set[str] = set()
+        index: int = 0
+        while index < len(todo):
+            current: str = todo[index]
+            index += 1
+            if current in firstAncestors:
+                closestParent = current
+                break
+            if current in done:
+                continue
+            done.add(current)
+            parents: list[str] | None = self._getParents(current)
+            if parents is not None:
+                todo.extend(parents)
+        self._closestParents[(_first, _second)] = closestParent
+        return closestParent
+
+    def __str__(self) -> str:
+        return ', '.join(f'{name}: {self.hits[name]} hits / {self.misses[name]} misses' for name in self.hits)
+
+
+def buildClassHierarchy(_dalvikFormats: list[DalvikVMFormat], _framework: FrameworkSnapshot | None = None) -> ClassHierarchy:
+    """
+    Build the hierarchy of the classes of an APK from their class definitions: only the superclass and the interfaces of
+    each class are read.
+    :param _dalvikFormats: The dex files of the APK
+    :param _framework: The snapshot of the framework hierarchy, for the classes which aren't in the APK
+    :return: The hierarchy of the classes of the APK
+    """
+    parents: ClassParentsType = {}
+    for dalvikFormat in _dalvikFormats:
+        for classDefItem in dalvikFormat.get_classes():
+            parents[classDefItem.get_name()] = [classDefItem.get_superclassname()] + list(classDefItem.get_interfaces())
+    return ClassHierarchy(parents, _framework)
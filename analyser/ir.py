@@ -0,0 +1,114 @@
+from typing import Iterable
+
+from androguard.core.bytecodes.dvm import Instruction, DALVIK_OPCODES_FORMAT, KIND_METH, KIND_STRING, KIND_FIELD, \
+    KIND_TYPE, OPERAND_REGISTER
+from analyser.opcodes import OPCODE_COUNT
+from analyser.pool import MethodCallInfosType, FieldInfosType, getConstantPool
+
+# Operand fields of the androguard instruction formats read by the analyses
+_OPERAND_FIELDS: tuple[str, ...] = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'AA', 'BB', 'CC', 'BBBB', 'CCCC')
+_OPERAND_FIELD_SET: frozenset[str] = frozenset(_OPERAND_FIELDS)
+
+# Kind of the constant pool item referenced by each opcode (`KIND_` constants of androguard), None if it doesn't
+# reference one
+_OPCODE_REFERENCE_KINDS: list[int | None] = [
+    DALVIK_OPCODES_FORMAT[op][1][1] if op in DALVIK_OPCODES_FORMAT and len(DALVIK_OPCODES_FORMAT[op][1]) > 1 else None
+    for op in range(OPCODE_COUNT)]
+
+
+class DecodedInstruction:
+    """
+    Instruction decoded once from androguard, so the analyses don't go back to the androguard objects when they visit
+    it again: its opcode, name, operands, and the type, field or method it references, already resolved.
+    The operand fields keep the names of the androguard formats (`A`, `AA`, `BBBB`...), only the fields of the format of
+    the instruction are set.
+    The report output, the register operands and the referenced string are only needed by some analyses and cost as much
+    to compute as the rest of the instruction, so they are computed on first access, then kept.
+    """
+    __slots__ = ('op', 'name', 'format', 'length', 'offset', 'type', 'field', 'method', '_source', '_output', '_registers',
+                 '_string') + _OPERAND_FIELDS
+    op: int
+    name: str
+    # Name of the androguard format (ex: 'Instruction21c'), used in the error messages
+    format: str
+    length: int
+    # Offset of the instruction in the method, in bytes
+    offset: int
+    # Referenced item, None if the instruction doesn't reference one of this kind
+    type: str | None
+    field: FieldInfosType | None
+    method: MethodCallInfosType | None
+
+    def __init__(self, _instruction: Instruction, _offset: int = 0):
+        self._source = _instruction
+        self._output = None
+        self._registers = None
+        self._string = None
+        self.op = _instruction.get_op_value()
+        self.name = _instruction.get_name()
+        self.format = type(_instruction).__name__
+        self.length = _instruction.get_length()
+        self.offset = _offset
+        for operandField, value in _instruction.__dict__.items():
+            if operandField in _OPERAND_FIELD_SET:
+                setattr(self, operandField, value)
+        self.type = None
+        self.field = None
+        self.method = None
+        self._resolveReference(_instruction)
+
+    def _resolveReference(self, _instruction: Instruction) -> None:
+        """
+        Resolve the type, field or method referenced by the instruction through the constant pool of its dex file.
+        :param _instruction: The androguard instruction
+        """
+        # Payloads and optimized instructions don't reference the constant pool
+        if self.op >= OPCODE_COUNT:
+            return
+        match _OPCODE_REFERENCE_KINDS[self.op]:
+            case kind if kind == KIND_TYPE:
+                self.type = getConstantPool(_instruction.cm).getType(_instruction.get_ref_kind())
+            case kind if kind == KIND_FIELD:
+                self.field = getConstantPool(_instruction.cm).getField(_instruction.get_ref_kind())
+            case kind if kind == KIND_METH:
+                self.method = getConstantPool(_instruction.cm).getMethod(_instruction.get_ref_kind())
+
+    @property
+    def output(self) -> str:
+        """
+        :return: The operands of the instruction, as printed in the reports
+        """
+        if self._output is None:
+            self._output = self._source.get_output()
+        return self._output
+
+    @property
+    def registers(self) -> list[int]:
+        """
+        :return: The register operands of the instruction, in order
+        """
+        if self._registers is None:
+            self._registers = [operand[1] for operand in self._source.get_operands() if operand[0] == OPERAND_REGISTER]
+        return self._registers
+
+    @property
+    def string(self) -> str | None:
+        """
+        :return: The string referenced by the instruction, None if it doesn't reference one
+        """
+        if self._string is None and self.op < OPCODE_COUNT and _OPCODE_REFERENCE_KINDS[self.op] == KIND_STRING:
+            self._string = getConstantPool(self._source.cm).getString(self._source.get_ref_kind())
+        return self._string
+
+
+def decodeInstructions(_instructions: Iterable[Instruction]) -> list[DecodedInstruction]:
+    """
+    :param _instructions: The androguard instructions of a method, in order, from its first instruction
+    :return: The decoded instructions, in the same order
+    """
+    decoded: list[DecodedInstruction] = []
+    offset: int = 0
+    for instruction in _instructions:
+        decoded.append(DecodedInstruction(instruction, offset))
+        offset += decoded[-1].length
+    return decoded
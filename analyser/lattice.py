@@ -0,0 +1,103 @@
+from typing import Any
+
+from tools import exitError, ExitCode
+
+
+class Lattice:
+    """
+    Lattice of the content of a register, on which the dataflow solver works.
+    Analyses plug their own domain by implementing `bottom()`, `join()` and `fromType()`. The registers hold the values
+    of the lattice, which the analyses may encode differently from the contents they read and write (`toContent()` and
+    `fromContent()`).
+    """
+
+    def bottom(self) -> Any:
+        """
+        :return: The content of a register holding nothing yet
+        """
+        exitError('Method `bottom()` from base class Lattice shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        # Placeholder return to please the linter
+        return None
+
+    def join(self, _first: Any, _second: Any) -> Any:
+        """
+        Merge the contents of a register coming from two predecessors
+        :param _first: The content already merged
+        :param _second: The content to merge
+        :return: The merged content
+        """
+        exitError('Method `join()` from base class Lattice shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        # Placeholder return to please the linter
+        return None
+
+    def joinAtHandler(self, _first: Any, _second: Any) -> Any:
+        """
+        Merge the contents of a register at the entry of an exception handler. The exception may be thrown before the
+        register is written, so a register empty on one of the paths stays empty instead of failing the merge.
+        :param _first: The content already merged
+        :param _second: The content to merge
+        :return: The merged content
+        """
+        empty: Any = self.bottom()
+        if _first == empty or _second == empty:
+            return empty
+        return self.join(_first, _second)
+
+    def widen(self, _previous: Any, _next: Any) -> Any:
+        """
+        Merge the contents of a register at a loop head which was visited too many times, so the analysis converges.
+        Without a widening operator, this is the same as `join()`.
+        :param _previous: The content already merged
+        :param _next: The content to merge
+        :return: The merged content, at least as high as the join of both
+        """
+        return self.join(_previous, _next)
+
+    def leq(self, _first: Any, _second: Any) -> bool:
+        """
+        :param _first: The first content
+        :param _second: The second content
+        :return: True if the first content is below (more precise than) the second one
+        """
+        return self.join(_second, _first) == _second
+
+    def fromType(self, _type: str, _initialised: bool) -> Any:
+        """
+        Build the content of a register holding a value of a given type
+        :param _type: The type of the value
+        :param _initialised: If the value is an initialised object
+        :return: The content of the register
+        """
+        exitError('Method `fromType()` from base class Lattice shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        # Placeholder return to please the linter
+        return None
+
+    def toType(self, _value: Any) -> str | None:
+        """
+        :param _value: The value of a register
+        :return: The type of the value, None if the register is empty
+        """
+        exitError('Method `toType()` from base class Lattice shoudn\'t be called', ExitCode.BASE_CLASS_CALL)
+        # Placeholder return to please the linter
+        return None
+
+    def toReport(self, _value: Any) -> str:
+        """
+        :param _value: The value of a register
+        :return: The value, as written in the memory reports
+        """
+        return f'\'{self.toContent(_value)}\''
+
+    def toContent(self, _value: Any) -> Any:
+        """
+        :param _value: The value of a register
+        :return: The content of the register, as read by the analysis
+        """
+        return _value
+
+    def fromContent(self, _content: Any) -> Any:
+        """
+        :param _content: The content of a register, as written by the analysis
+        :return: The value of the register
+        """
+        return _content
@@ -0,0 +1,98 @@
+from typing import Iterable, Iterator
+
+from analyser.flow import FlowGraph
+from analyser.ir import DecodedInstruction
+from analyser.opcodes import OPCODE_COUNT, OPCODE_WIDE_OPERANDS
+
+# Sets of registers are stored as bitmasks: register `r` is in the set when bit `r` is set
+RegisterSetType: type = int
+
+# Opcodes that write their first register without reading it:
+# move-result(-wide/-object), move-exception, const*, const-string(/jumbo), const-class, new-instance, sget*
+_WRITE_ONLY_OPCODES: frozenset[int] = frozenset(
+    [0x0a, 0x0b, 0x0c, 0x0d] + list(range(0x12, 0x1d)) + [0x22] + list(range(0x60, 0x67))
+)
+
+# binop/2addr: the analysis checks the register after both operands, whatever their type
+_PAIR_CHECKED_OPCODES: frozenset[int] = frozenset(range(0xb0, 0xd0))
+
+
+def _getUsesAndKills(_instruction: DecodedInstruction) -> (RegisterSetType, RegisterSetType):
+    """
+    Compute the registers read and the registers overwritten by an instruction.
+    A register operand holding a long or a double also uses (or kills) the register after it, and so do both operands
+    of binop/2addr. Kills are under-approximated (only the destination of the write-only instructions), so the live
+    registers are never missed.
+    :param _instruction: The instruction
+    :return: The registers used and the registers killed by the instruction
+    """
+    registers: list[int] = _instruction.registers
+    wideOperands: int = OPCODE_WIDE_OPERANDS[_instruction.op] if _instruction.op < OPCODE_COUNT else 0
+    if _instruction.op in _PAIR_CHECKED_OPCODES:
+        wideOperands = 0b11
+    uses: RegisterSetType = 0
+    for position, register in enumerate(registers):
+        uses |= (0b11 if wideOperands >> position & 1 else 0b1) << register
+    if len(registers) > 0 and _instruction.op in _WRITE_ONLY_OPCODES:
+        kills: RegisterSetType = (0b11 if wideOperands & 1 else 0b1) << registers[0]
+        return uses & ~kills, kills
+    return uses, 0
+
+
+def iterateRegisters(_registers: RegisterSetType) -> Iterator[int]:
+    """
+    Walk the set bits of a set of registers, lowest first, without testing the registers missing from it.
+    :param _registers: The set of registers
+    :return: The indexes of the registers of the set
+    """
+    while _registers:
+        lowest: RegisterSetType = _registers & -_registers
+        yield lowest.bit_length() - 1
+        _registers ^= lowest
+
+
+def toRegisterSet(_registers: Iterable[int]) -> RegisterSetType:
+    """
+    :param _registers: The indexes of the registers
+    :return: The set of registers
+    """
+    candidate: RegisterSetType = 0
+    for register in _registers:
+        candidate |= 1 << register
+    return candidate
+
+
+def computeLiveRegisters(_flow: FlowGraph) -> list[RegisterSetType]:
+    """
+    Backward liveness analysis on the blocks of a method.
+    :param _flow: The control flow graph of the method
+    :return: The registers live at the entry of each block
+    """
+    blockCount: int = _flow.blockCount()
+    # Registers read before being overwritten in each block, and registers overwritten in each block
+    uses: list[RegisterSetType] = [0] * blockCount
+    kills: list[RegisterSetType] = [0] * blockCount
+    for block in range(blockCount):
+        for instruction in reversed(_flow.getBlockInstructions(block)):
+            instructionUses, instructionKills = _getUsesAndKills(instruction)
+            uses[block] = (uses[block] & ~instructionKills) | instructionUses
+            kills[block] |= instructionKills
+
+    liveIn: list[RegisterSetType] = uses.copy()
+    # Visit every block (the last ones first), then the predecessors of every block whose live registers grew
+    todo: list[int] = list(range(blockCount))
+    pending: bytearray = bytearray([1] * blockCount)
+    while len(todo) > 0:
+        block: int = todo.pop()
+        pending[block] = 0
+        liveOut: RegisterSetType = 0
+        for successor in _flow.blockSuccessors.get(block):
+            liveOut |= liveIn[successor]
+        live: RegisterSetType = uses[block] | (liveOut & ~kills[block])
+        if live != liveIn[block]:
+            liveIn[block] = live
+            for predecessor in _flow.blockPredecessors.get(block):
+                if not pending[predecessor]:
+                    pending[predecessor] = 1
+                    todo.append(predecessor)
+    return liveIn
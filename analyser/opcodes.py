@@ -0,0 +1,114 @@
+from typing import Callable
+
+from androguard.core.bytecodes.dvm import DALVIK_OPCODES_FORMAT, Instruction
+
+# Opcodes are stored on one byte, payloads and optimized instructions use larger values
+OPCODE_COUNT: int = 0x100
+
+# Handler of an instruction, called with the analyser as first argument
+InstructionHandlerType: type = Callable[[object, Instruction], None]
+
+
+# Properties of an opcode, precomputed from its name so the analyses don't compare strings for each instruction. They
+# are plain integers and not an IntFlag, whose operators are about 30 times slower.
+# Works on a pair of registers (`-wide` variants)
+TRAIT_WIDE: int = 1
+# Works on an object reference (`-object` variants)
+TRAIT_OBJECT: int = 2
+# Reads a field or an array item (`iget`, `sget`, `aget`)
+TRAIT_GET: int = 4
+# Writes a field or an array item (`iput`, `sput`, `aput`)
+TRAIT_PUT: int = 8
+# Calls a method (`invoke-kind`)
+TRAIT_INVOKE: int = 16
+# Takes its registers as a range (`/range` variants)
+TRAIT_RANGE: int = 32
+# Divides by its last operand (`div-`)
+TRAIT_DIVIDE: int = 64
+
+
+def _traitsFromName(_name: str) -> int:
+    """
+    :param _name: The name of the opcode
+    :return: The traits of the opcode, as a combination of `TRAIT_` flags
+    """
+    traits: int = 0
+    parts: list[str] = _name.split('/')[0].split('-')
+    if 'wide' in parts:
+        traits |= TRAIT_WIDE
+    if 'object' in parts:
+        traits |= TRAIT_OBJECT
+    if _name[1:4] == 'get':
+        traits |= TRAIT_GET
+    if _name[1:4] == 'put':
+        traits |= TRAIT_PUT
+    if _name.startswith('invoke-'):
+        traits |= TRAIT_INVOKE
+    if _name.endswith('/range'):
+        traits |= TRAIT_RANGE
+    if _name.startswith('div-'):
+        traits |= TRAIT_DIVIDE
+    return traits
+
+
+# Traits of each opcode, indexed by its value
+OPCODE_TRAITS: list[int] = [
+    _traitsFromName(DALVIK_OPCODES_FORMAT[op][1][0]) if op in DALVIK_OPCODES_FORMAT else 0
+    for op in range(OPCODE_COUNT)]
+
+_WIDE_TYPES: tuple[str, str] = ('long', 'double')
+
+
+def _wideOperandsFromName(_name: str) -> int:
+    """
+    :param _name: The name of the opcode
+    :return: The register operands of the opcode holding a pair of registers (bit `i` for the operand `i`)
+    """
+    parts: list[str] = _name.split('/')[0].split('-')
+    # `move-wide` copies a pair, the other `-wide` variants move a pair in or out of their first register
+    if 'wide' in parts:
+        return 0b11 if parts[0] == 'move' and parts[1] == 'wide' else 0b1
+    # Conversions: `<from>-to-<to> vA, vB`
+    if 'to' in parts:
+        return (parts[2] in _WIDE_TYPES) | (parts[0] in _WIDE_TYPES) << 1
+    if len(parts) != 2 or parts[1] not in _WIDE_TYPES:
+        return 0
+    # Comparisons write an int from two pairs
+    if parts[0] in ('cmp', 'cmpl', 'cmpg'):
+        return 0b110
+    # Shifts take their distance as an int, in their last operand
+    if parts[0] in ('shl', 'shr', 'ushr'):
+        return 0b1 if _name.endswith('/2addr') else 0b11
+    # Unary and binary operations on pairs
+    return 0b111
+
+
+# Register operands holding a pair of registers for each opcode, indexed by its value
+OPCODE_WIDE_OPERANDS: list[int] = [
+    _wideOperandsFromName(DALVIK_OPCODES_FORMAT[op][1][0]) if op in DALVIK_OPCODES_FORMAT else 0
+    for op in range(OPCODE_COUNT)]
+
+# Kind of the invoke opcodes (`virtual`, `super`, `direct`, `static`, `interface`...), None for the other ones
+OPCODE_INVOKE_KINDS: list[str | None] = [
+    DALVIK_OPCODES_FORMAT[op][1][0].split('/')[0].split('-')[1] if OPCODE_TRAITS[op] & TRAIT_INVOKE else None
+    for op in range(OPCODE_COUNT)]
+
+
+def buildDispatchTable(_handlers: dict[type, InstructionHandlerType], _default: InstructionHandlerType) -> list[InstructionHandlerType]:
+    """
+    Map each opcode to the handler of its instruction format, so an instruction is dispatched with a single lookup on
+    its opcode instead of testing its class against every format.
+    :param _handlers: The handler of each instruction format. As with a `match` statement, the first format the class of
+    the opcode derives from is used
+    :param _default: The handler of the opcodes without a format handler
+    :return: The handler of each opcode, indexed by its value
+    """
+    table: list[InstructionHandlerType] = [_default] * OPCODE_COUNT
+    for op, (instructionType, _) in DALVIK_OPCODES_FORMAT.items():
+        if op >= OPCODE_COUNT:
+            continue
+        for handledType, handler in _handlers.items():
+            if issubclass(instructionType, handledType):
+                table[op] = handler
+                break
+    return table
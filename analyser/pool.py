@@ -0,0 +1,123 @@
+from androguard.core.bytecodes.dvm import ClassManager, KIND_METH, KIND_STRING, KIND_FIELD, KIND_TYPE
+
+# Called method: (Class, Method name, list of parameters type, return type)
+MethodCallInfosType: type = tuple[str, str, list[str], str]
+# Accessed field: (Class, Field type, Field name)
+FieldInfosType: type = tuple[str, str, str]
+# Item of the constant pool, depending on its kind
+PoolItemType: type = MethodCallInfosType | FieldInfosType | str
+
+# Names of the kinds of items, indexed by their androguard `KIND_` constant, for the statistics
+_KIND_NAMES: dict[int, str] = {KIND_METH: 'methods', KIND_STRING: 'strings', KIND_FIELD: 'fields', KIND_TYPE: 'types'}
+
+
+def parseParameterTypes(_parameters: str) -> list[str]:
+    """
+    Decompose the parameters of a method prototype into their types.
+    :param _parameters: The parameters, as given by androguard (ex: '(Ljava/lang/String; I)')
+    :return: The types of the parameters
+    """
+    # Remove parenthesis, then split by ' '
+    return [parameter.strip() for parameter in _parameters[1:-1].split(' ') if parameter]
+
+
+class ConstantPool:
+    """
+    Items of the constant pool of a dex file, resolved once through its androguard ClassManager then kept, so the
+    methods, fields and types referenced by every class of the dex file are only resolved once for the whole run.
+    Items are resolved on demand, or all at once with `preload`.
+    """
+    _classManager: ClassManager
+    # Resolved items of each kind, indexed by kind then by their index in the dex file
+    _items: dict[int, dict[int, PoolItemType]]
+    hits: dict[int, int]
+    misses: dict[int, int]
+
+    def __init__(self, classManager: ClassManager):
+        self._classManager = classManager
+        self._items = {kind: {} for kind in _KIND_NAMES}
+        self.hits = dict.fromkeys(_KIND_NAMES, 0)
+        self.misses = dict.fromkeys(_KIND_NAMES, 0)
+
+    def _resolveItem(self, _kind: int, _index: int) -> PoolItemType:
+        """
+        :param _kind: The kind of the item (`KIND_` constant of androguard)
+        :param _index: The index of the item in the dex file
+        :return: The item, as given by the ClassManager
+        """
+        match _kind:
+            case kind if kind == KIND_METH:
+                className, methodName, (parameters, returnType) = self._classManager.get_method(_index)
+                return className, methodName, parseParameterTypes(parameters), returnType
+            case kind if kind == KIND_FIELD:
+                return tuple(self._classManager.get_field(_index))
+            case kind if kind == KIND_TYPE:
+                return self._classManager.get_type(_index)
+            case _:
+                return self._classManager.get_string(_index)
+
+    def resolve(self, _kind: int, _index: int) -> PoolItemType:
+        """
+        :param _kind: The kind of the item (`KIND_` constant of androguard)
+        :param _index: The index of the item in the dex file
+        :return: The resolved item
+        """
+        items: dict[int, PoolItemType] = self._items[_kind]
+        item: PoolItemType | None = items.get(_index)
+        if item is None:
+            self.misses[_kind] += 1
+            item = items[_index] = self._resolveItem(_kind, _index)
+        else:
+            self.hits[_kind] += 1
+        return item
+
+    def getMethod(self, _index: int) -> MethodCallInfosType:
+        return self.resolve(KIND_METH, _index)
+
+    def getField(self, _index: int) -> FieldInfosType:
+        return self.resolve(KIND_FIELD, _index)
+
+    def getType(self, _index: int) -> str:
+        return self.resolve(KIND_TYPE, _index)
+
+    def getString(self, _index: int) -> str:
+        return self.resolve(KIND_STRING, _index)
+
+    def preload(self) -> None:
+        """
+        Resolve every method, field and type of the dex file. Strings are left on demand, most of them are never
+        referenced by an instruction.
+        Preloaded items aren't counted in the statistics.
+        """
+        header = self._classManager.vm.header
+        for kind, count in ((KIND_METH, header.method_ids_size), (KIND_FIELD, header.field_ids_size), (KIND_TYPE, header.type_ids_size)):
+            items: dict[int, PoolItemType] = self._items[kind]
+            for index in range(count):
+                if index not in items:
+                    items[index] = self._resolveItem(kind, index)
+
+    def __str__(self) -> str:
+        return ', '.join(f'{name}: {self.hits[kind]} hits / {self.misses[kind]} misses ({len(self._items[kind])} resolved)'
+                         for kind, name in _KIND_NAMES.items())
+
+
+# Constant pool of each dex file, shared by all the analysers of the run
+_pools: dict[ClassManager, ConstantPool] = {}
+
+
+def getConstantPool(_classManager: ClassManager) -> ConstantPool:
+    """
+    :param _classManager: The ClassManager of a dex file
+    :return: The constant pool of the dex file, created on first use
+    """
+    pool: ConstantPool | None = _pools.get(_classManager)
+    if pool is None:
+        pool = _pools[_classManager] = ConstantPool(_classManager)
+    return pool
+
+
+def getConstantPools() -> list[ConstantPool]:
+    """
+    :return: The constant pools created during the run
+    """
+    return list(_pools.values())
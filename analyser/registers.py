@@ -0,0 +1,123 @@
+from typing import Any, Iterator, MutableSequence
+
+# Number of registers per chunk, a write only copies the chunk of the register if it is shared
+CHUNK_SIZE: int = 16
+
+
+class RegisterFile:
+    """
+    Copy-on-write register file.
+    Registers are stored in fixed size chunks shared between copies: copying a register file only copies the list of
+    chunks, and the first write in a shared chunk copies that chunk alone. The memories of consecutive program points,
+    which usually differ by a few registers, share most of their content.
+    The chunks are slices of the initial values, so registers given as an `array` are stored in arrays.
+    """
+    _chunks: list[MutableSequence[Any]]
+    # For each chunk, 1 if this register file is the only one using it
+    _owned: bytearray
+    _length: int
+
+    def __init__(self, values: MutableSequence[Any]):
+        self._chunks = [values[start:start + CHUNK_SIZE] for start in range(0, len(values), CHUNK_SIZE)]
+        self._owned = bytearray([1] * len(self._chunks))
+        self._length = len(values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, _index: int) -> Any:
+        if not 0 <= _index < self._length:
+            raise IndexError(f'Register index {_index} out of range')
+        return self._chunks[_index // CHUNK_SIZE][_index % CHUNK_SIZE]
+
+    def __setitem__(self, _index: int, _value: Any) -> None:
+        if not 0 <= _index < self._length:
+            raise IndexError(f'Register index {_index} out of range')
+        chunkIndex: int = _index // CHUNK_SIZE
+        if not self._owned[chunkIndex]:
+            self._chunks[chunkIndex] = self._chunks[chunkIndex][:]
+            self._owned[chunkIndex] = 1
+        self._chunks[chunkIndex][_index % CHUNK_SIZE] = _value
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __eq__(self, _other: object) -> bool:
+        if not isinstance(_other, RegisterFile):
+            return NotImplemented
+        if self._length != _other._length:
+            return False
+        # Shared chunks are equal without comparing their content
+        return all(first is second or first == second for first, second in zip(self._chunks, _other._chunks))
+
+    def copy(self) -> 'RegisterFile':
+        """
+        Copy the register file, sharing all of its chunks with the copy
+        :return: The copy
+        """
+        candidate: RegisterFile = type(self).__new__(type(self))
+        candidate._chunks = self._chunks.copy()
+        candidate._owned = bytearray(len(self._chunks))
+        candidate._length = self._length
+        # The chunks are now shared, the next write on either side copies them
+        self._owned = bytearray(len(self._chunks))
+        return candidate
+
+
+class FlaggedRegisterFile(RegisterFile):
+    """
+    Copy-on-write register file whose values carry a flag in their lowest bit (`content << 1 | flag`).
+    The contents are stored in chunks as in RegisterFile, the flags of all the registers in a single integer (bit `i`
+    for register `i`), so the flags of two register files are merged and compared with one integer operation.
+    """
+    flags: int
+
+    def __init__(self, values: MutableSequence[int]):
+        contents: MutableSequence[int] = values[:]
+        self.flags = 0
+        for index, value in enumerate(values):
+            contents[index] = value >> 1
+            self.flags |= (value & 1) << index
+        super().__init__(contents)
+
+    def __getitem__(self, _index: int) -> int:
+        if not 0 <= _index < self._length:
+            raise IndexError(f'Register index {_index} out of range')
+        return self._chunks[_index // CHUNK_SIZE][_index % CHUNK_SIZE] << 1 | (self.flags >> _index & 1)
+
+    def __setitem__(self, _index: int, _value: int) -> None:
+        RegisterFile.__setitem__(self, _index, _value >> 1)
+        if _value & 1:
+            self.flags |= 1 << _index
+        else:
+            self.flags &= ~(1 << _index)
+
+    def __iter__(self) -> Iterator[int]:
+        for index, content in enumerate(super().__iter__()):
+            yield content << 1 | (self.flags >> index & 1)
+
+    def __eq__(self, _other: object) -> bool:
+        if not isinstance(_other, FlaggedRegisterFile):
+            return NotImplemented
+        return self.flags == _other.flags and super().__eq__(_other)
+
+    def getContent(self, _index: int) -> int:
+        """
+        :param _index: The index of the register
+        :return: The content of the register, without its flag
+        """
+        return RegisterFile.__getitem__(self, _index)
+
+    def setContent(self, _index: int, _content: int) -> None:
+        """
+        Change the content of a register, keeping its flag
+        :param _index: The index of the register
+        :param _content: The content, without flag
+        """
+        RegisterFile.__setitem__(self, _index, _content)
+
+    def copy(self) -> 'FlaggedRegisterFile':
+        candidate: FlaggedRegisterFile = super().copy()
+        candidate.flags = self.flags
+        return candidate
@@ -0,0 +1,58 @@
+from io import StringIO
+from typing import TextIO
+
+# Number of characters buffered before they are written to the output
+REPORT_BUFFER_SIZE: int = 1 << 16
+
+
+class ReportSink:
+    """
+    Report streamed to a file-like object: the sections written are buffered, then written to the output at once when
+    the buffer is full or when the sink is flushed (at the end of each method), so the memory used by the report is
+    bounded by the buffer whatever the size of the class.
+    Used as a context manager, the sink is flushed when leaving the block, even when the analysis stops on an error, so
+    the output holds the report of the methods analysed until then.
+    """
+    __slots__ = ('_output', '_chunks', '_size', '_bufferSize')
+    _output: TextIO
+    _chunks: list[str]
+    # Number of characters in the buffer
+    _size: int
+    _bufferSize: int
+
+    def __init__(self, output: TextIO | None = None, bufferSize: int = REPORT_BUFFER_SIZE):
+        self._output = output if output is not None else StringIO()
+        self._chunks = []
+        self._size = 0
+        self._bufferSize = bufferSize
+
+    def __enter__(self) -> 'ReportSink':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.flush()
+
+    def write(self, _text: str) -> None:
+        """
+        :param _text: The text to add to the report
+        """
+        self._chunks.append(_text)
+        self._size += len(_text)
+        if self._size >= self._bufferSize:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered text to the output
+        """
+        if len(self._chunks) > 0:
+            self._output.write(''.join(self._chunks))
+            self._chunks = []
+            self._size = 0
+
+    def getvalue(self) -> str:
+        """
+        :return: The whole report, for a sink writing to memory (no output given)
+        """
+        self.flush()
+        return self._output.getvalue()
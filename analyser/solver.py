@@ -0,0 +1,38 @@
+from array import array
+
+from analyser.analyser import Analyser
+from analyser.budget import Budget
+from analyser.flow import FlowGraph
+from analyser.worklist import Worklist
+
+
+def solveFixpoint(_analyser: Analyser, _flow: FlowGraph, _worklistType: type = Worklist, _budget: Budget | None = None) -> Worklist:
+    """
+    Dataflow solver shared by the analyses: analyse the blocks of a method until their entry memory doesn't change
+    anymore. The domain of the analysis is given by the lattice of the analyser, and the transfer function of each
+    instruction by its `_analyseInstruction()` method.
+    With a budget, the loop heads visited too many times are widened, and `BudgetExceededException` is raised when a
+    limit is exceeded.
+    :param _analyser: The analyser of the method
+    :param _flow: The control flow graph of the method
+    :param _worklistType: The worklist to use, built from the reverse postorder of the blocks
+    :param _budget: The limits of the analysis, None for unlimited
+    :return: The worklist used, holding the number of visits of each block
+    """
+    order: array = _flow.reversePostorder()
+    worklist: Worklist = _worklistType(order)
+    loopHeads: bytearray | None = None
+    if _budget is not None:
+        _budget.start()
+        loopHeads = _flow.loopHeads(order)
+    if _flow.blockCount() > 0:
+        worklist.push(0)
+    while len(worklist) != 0:
+        currentBlock: int = worklist.pop()
+        widen: bool = False
+        if _budget is not None:
+            _budget.check(worklist.visits[currentBlock])
+            widen = loopHeads[currentBlock] == 1 and _budget.widens(worklist.visits[currentBlock])
+        if _analyser.analyse(currentBlock, flow=_flow, widen=widen):
+            worklist.extend(_flow.blockSuccessors.get(currentBlock))
+    return worklist
@@ -0,0 +1,201 @@
+from typing import Any
+
+from analyser.flow import FlowGraph
+from analyser.ir import DecodedInstruction
+
+# Opcodes that never write a register: nop, return*, monitor-*, throw, goto*, switches, if*, array and field puts,
+# invoke*, filled-new-array* and fill-array-data (their result goes through the stack)
+_NON_WRITING_OPCODES: frozenset[int] = frozenset(
+    [0x00, 0x0e, 0x0f, 0x10, 0x11, 0x1d, 0x1e, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c]
+    + list(range(0x32, 0x3e)) + list(range(0x4b, 0x52)) + list(range(0x59, 0x60)) + list(range(0x67, 0x6e))
+    + list(range(0x6e, 0x73)) + list(range(0x74, 0x79))
+)
+# invoke-direct and invoke-direct/range: a call to a constructor initialises its receiver register
+_INVOKE_DIRECT_OPCODES: frozenset[int] = frozenset([0x70, 0x76])
+
+
+def _getWrittenRegisters(_instruction: DecodedInstruction) -> list[int]:
+    """
+    Over-approximate the registers written by an instruction: its first register operand and the register after it
+    (for the wide instructions), or the receiver of a constructor call (its initialisation flag is rewritten).
+    :param _instruction: The instruction
+    :return: The registers that may be written
+    """
+    if _instruction.op in _INVOKE_DIRECT_OPCODES:
+        if _instruction.method is not None and _instruction.method[1] == '<init>' and len(_instruction.registers) > 0:
+            return [_instruction.registers[0]]
+        return []
+    if _instruction.op in _NON_WRITING_OPCODES:
+        return []
+    if len(_instruction.registers) > 0:
+        return [_instruction.registers[0], _instruction.registers[0] + 1]
+    return []
+
+
+class SSAForm:
+    """
+    Static single assignment form of a method: dominator tree of the blocks and registers merged by a phi at the entry
+    of each block.
+    Unreachable blocks have no immediate dominator (-1) and are never part of the dominator tree.
+    """
+    flow: FlowGraph
+    registerCount: int
+    order: Any
+    immediateDominators: list[int]
+    children: list[list[int]]
+    frontiers: list[set[int]]
+    phis: list[list[int]]
+
+    def __init__(self, flow: FlowGraph, registerCount: int):
+        self.flow = flow
+        self.registerCount = registerCount
+        self.order = flow.reversePostorder()
+        self._computeDominators()
+        self._computeFrontiers()
+        self._placePhis()
+
+    def _computeDominators(self) -> None:
+        """
+        Compute the immediate dominator of each block (Cooper, Harvey and Kennedy iterative algorithm), and the
+        children of each block in the dominator tree, in reverse postorder.
+        """
+        blockCount: int = self.flow.blockCount()
+        blocks: list[int] = sorted((block for block in range(blockCount) if self.order[block] >= 0),
+                                   key=lambda block: self.order[block])
+        self.immediateDominators = [-1] * blockCount
+        if blockCount > 0:
+            self.immediateDominators[0] = 0
+        changed: bool = True
+        while changed:
+            changed = False
+            for block in blocks[1:]:
+                candidate: int = -1
+                for predecessor in self.flow.blockPredecessors.get(block):
+                    if self.immediateDominators[predecessor] == -1:
+                        continue
+                    candidate = predecessor if candidate == -1 else self._intersect(predecessor, candidate)
+                if candidate != self.immediateDominators[block]:
+                    self.immediateDominators[block] = candidate
+                    changed = True
+
+        self.children = [[] for _ in range(blockCount)]
+        for block in blocks[1:]:
+            self.children[self.immediateDominators[block]].append(block)
+
+    def _intersect(self, _first: int, _second: int) -> int:
+        while _first != _second:
+            while self.order[_first] > self.order[_second]:
+                _first = self.immediateDominators[_first]
+            while self.order[_second] > self.order[_first]:
+                _second = self.immediateDominators[_second]
+        return _first
+
+    def _computeFrontiers(self) -> None:
+        """
+        Compute the dominance frontier of each block: the blocks where its dominance stops.
+        """
+        self.frontiers = [set() for _ in range(self.flow.blockCount())]
+        for block in range(self.flow.blockCount()):
+            if self.immediateDominators[block] == -1:
+                continue
+            predecessors: list[int] = [predecessor for predecessor in self.flow.blockPredecessors.get(block)
+                                       if self.immediateDominators[predecessor] != -1]
+            # The entry block is also reached from the start of the method
+            if len(predecessors) + (block == 0) < 2:
+                continue
+            for predecessor in predecessors:
+                runner: int = predecessor
+                while block == 0 or runner != self.immediateDominators[block]:
+                    self.frontiers[runner].add(block)
+                    if runner == 0:
+                        break
+                    runner = self.immediateDominators[runner]
+
+    def _placePhis(self) -> None:
+        """
+        Place a phi for a register at the iterated dominance frontier of the blocks writing it.
+        """
+        definitions: dict[int, set[int]] = {}
+        for block in range(self.flow.blockCount()):
+            if self.immediateDominators[block] == -1:
+                continue
+            for instruction in self.flow.getBlockInstructions(block):
+                for register in _getWrittenRegisters(instruction):
+                    if register < self.registerCount:
+                        definitions.setdefault(register, set()).add(block)
+
+        phis: list[set[int]] = [set() for _ in range(self.flow.blockCount())]
+        # The method entry is a predecessor of the handlers of the first instruction: the registers written by the entry
+        # block get a phi there, which is a definition too
+        for block in range(self.flow.blockCount()):
+            if self.immediateDominators[block] == -1 or not self.flow.isEntryHandler(block):
+                continue
+            for instruction in self.flow.getBlockInstructions(0):
+                for register in _getWrittenRegisters(instruction):
+                    if register < self.registerCount:
+                        phis[block].add(register)
+                        definitions.setdefault(register, set()).add(block)
+        for register, blocks in definitions.items():
+            todo: list[int] = list(blocks)
+            while len(todo) > 0:
+                block: int = todo.pop()
+                for frontier in self.frontiers[block]:
+                    if register not in phis[frontier]:
+                        phis[frontier].add(register)
+                        if frontier not in blocks:
+                            todo.append(frontier)
+        self.phis = [sorted(registers) for registers in phis]
+
+
+class RenamedRegisterFile:
+    """
+    Register file seen by the analysers in sparse mode: each register holds the version of its last definition, and
+    only the versions hold a content. Writing a register creates a new version, which is undone when the dominator
+    tree walk leaves the block.
+    """
+    versions: list[Any]
+    _names: list[int]
+    _undo: list[tuple[int, int]]
+    # Registers written since the last call to `popDefinitions()`
+    _defined: list[int]
+
+    def __init__(self, initial: list[Any]):
+        self.versions = list(initial)
+        self._names = list(range(len(initial)))
+        self._undo = []
+        self._defined = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, _index: int) -> Any:
+        return self.versions[self._names[_index]]
+
+    def __setitem__(self, _index: int, _value: Any) -> None:
+        self._undo.append((_index, self._names[_index]))
+        self.versions.append(_value)
+        self._names[_index] = len(self.versions) - 1
+        self._defined.append(_index)
+
+    def mark(self) -> int:
+        """
+        :return: A mark to restore the current versions with `restore()`
+        """
+        return len(self._undo)
+
+    def restore(self, _mark: int) -> None:
+        """
+        Restore the versions of the registers as they were when the mark was taken
+        :param _mark: The mark
+        """
+        while len(self._undo) > _mark:
+            index, version = self._undo.pop()
+            self._names[index] = version
+
+    def popDefinitions(self) -> list[int]:
+        """
+        :return: The registers written since the last call, in order
+        """
+        defined: list[int] = self._defined
+        self._defined = []
+        return defined
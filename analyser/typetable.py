@@ -0,0 +1,88 @@
+from analyser.hierarchy import ClassHierarchy
+from tools import PRIMITIVE_TYPES, SMALI_ARRAY_MARKER, SMALI_OBJECT_MARKER, SMALI_OBJECT_TYPE, SMALI_BOOLEAN_TYPE, \
+    SMALI_INT_TYPE
+
+# Identifiers of the types every table starts with. 0 stands for no type (empty register)
+NO_TYPE: int = 0
+TYPE_OBJECT: int = 1
+TYPE_BOOLEAN: int = 2
+TYPE_INT: int = 3
+
+
+class TypeTable:
+    """
+    Table interning each type descriptor to a small integer identifier, with the attributes checked by the analyses
+    precomputed, so a type check is a lookup in a list instead of string operations on the descriptor.
+    Subtype tests and joins of two types depend on the class hierarchy: they are computed by the analysers the first
+    time, then kept in `subtypes` and `joins` (keyed by the pair of identifiers) for the whole run.
+    """
+    descriptors: list[str | None]
+    # Number of array dimensions of each type
+    dimensions: list[int]
+    # Identifier of each type once its array dimensions are removed
+    elements: list[int]
+    # 1 if the type is a primitive type
+    primitives: bytearray
+    # 1 if the type is a class (`L...;`)
+    objects: bytearray
+    subtypes: dict[tuple[int, int], bool]
+    joins: dict[tuple[int, int], int]
+    _identifiers: dict[str | None, int]
+
+    def __init__(self):
+        self.descriptors = [None]
+        self.dimensions = [0]
+        self.elements = [NO_TYPE]
+        self.primitives = bytearray(1)
+        self.objects = bytearray(1)
+        self.subtypes = {}
+        self.joins = {}
+        self._identifiers = {None: NO_TYPE}
+        for descriptor in (SMALI_OBJECT_TYPE, SMALI_BOOLEAN_TYPE, SMALI_INT_TYPE):
+            self.intern(descriptor)
+
+    def __len__(self) -> int:
+        return len(self.descriptors)
+
+    def intern(self, _descriptor: str | None) -> int:
+        """
+        :param _descriptor: The descriptor of the type, None for no type
+        :return: The identifier of the type, added to the table on first use
+        """
+        identifier: int | None = self._identifiers.get(_descriptor)
+        if identifier is None:
+            identifier = self._add(_descriptor)
+        return identifier
+
+    def _add(self, _descriptor: str) -> int:
+        """
+        Add a type to the table
+        :param _descriptor: The descriptor of the type
+        :return: The identifier of the type
+        """
+        dimensions: int = len(_descriptor) - len(_descriptor.lstrip(SMALI_ARRAY_MARKER))
+        # The element type is added first, so its identifier is known
+        element: int = self.intern(_descriptor[dimensions:]) if dimensions > 0 else len(self.descriptors)
+        identifier: int = len(self.descriptors)
+        self.descriptors.append(_descriptor)
+        self.dimensions.append(dimensions)
+        self.elements.append(element)
+        self.primitives.append(_descriptor in PRIMITIVE_TYPES)
+        self.objects.append(_descriptor.startswith(SMALI_OBJECT_MARKER))
+        self._identifiers[_descriptor] = identifier
+        return identifier
+
+
+# Type table of each class hierarchy, shared by all the analysers of the run
+_tables: dict[ClassHierarchy, TypeTable] = {}
+
+
+def getTypeTable(_hierarchy: ClassHierarchy) -> TypeTable:
+    """
+    :param _hierarchy: The class hierarchy of the APK
+    :return: The type table of the hierarchy, created on first use
+    """
+    table: TypeTable | None = _tables.get(_hierarchy)
+    if table is None:
+        table = _tables[_hierarchy] = TypeTable()
+    return table
@@ -0,0 +1,62 @@
+from array import array
+from heapq import heappush, heappop
+
+
+class Worklist:
+    """
+    Worklist of the blocks left to analyse.
+    Blocks are popped in reverse postorder, so every predecessor of a block is merged before the block is analysed
+    again, and a pending block is only stored once.
+    """
+    _order: array
+    _heap: list[tuple[int, int]]
+    _pending: bytearray
+    visits: array
+
+    def __init__(self, order: array):
+        self._order = order
+        self._heap = []
+        self._pending = bytearray(len(order))
+        self.visits = array('I', [0] * len(order))
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, _block: int) -> None:
+        """
+        Schedule a block, unless it is already pending
+        :param _block: The index of the block to schedule
+        """
+        if not self._pending[_block]:
+            self._pending[_block] = 1
+            heappush(self._heap, (self._order[_block], _block))
+
+    def extend(self, _blocks) -> None:
+        """
+        Schedule several blocks
+        :param _blocks: The indexes of the blocks to schedule
+        """
+        for block in _blocks:
+            self.push(block)
+
+    def pop(self) -> int:
+        """
+        Retrieve the pending block that comes first in reverse postorder
+        :return: The index of the block to analyse
+        """
+        _, block = heappop(self._heap)
+        self._pending[block] = 0
+        self.visits[block] += 1
+        return block
+
+    def totalVisits(self) -> int:
+        """
+        :return: The number of blocks popped so far
+        """
+        return sum(self.visits)
+
+    def visitedBlocks(self) -> int:
+        """
+        :return: The number of blocks popped at least once
+        """
+        return len(self.visits) - self.visits.count(0)
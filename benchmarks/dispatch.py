@@ -0,0 +1,92 @@
+"""
+Microbenchmark of the instruction dispatch of the analyses: time needed to find the handler of each instruction of an
+APK and the properties of its opcode, with the former `match` over the instruction formats followed by name
+comparisons, and with the opcode-indexed table.
+
+Usage: python benchmarks/dispatch.py <APK> [repeat]
+"""
+import sys
+import time
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from androguard.core.bytecodes.dvm import Instruction, Instruction12x, Instruction10x, Instruction35c, Instruction31i, \
+    Instruction11x, Instruction22x, Instruction32x, Instruction10t, Instruction11n, Instruction20bc, Instruction20t, \
+    Instruction21c, Instruction21h, Instruction21s, Instruction21t, Instruction22b, Instruction22c, Instruction22cs, \
+    Instruction22s, Instruction22t, Instruction23x, Instruction30t, Instruction31c, Instruction31t, Instruction35mi, \
+    Instruction35ms, Instruction3rc, Instruction3rmi, Instruction3rms, Instruction40sc, Instruction41c, Instruction51l, \
+    Instruction52c, Instruction5rc
+from analyser.analyse1 import Analyse1
+from analyser.opcodes import OPCODE_COUNT, OPCODE_TRAITS, TRAIT_GET, TRAIT_WIDE
+from tools import extractInfosFromAPK
+
+# Formats in the order of the former `match` statement
+FORMATS: list[type] = [Instruction10t, Instruction10x, Instruction11n, Instruction11x, Instruction12x, Instruction20bc,
+                       Instruction20t, Instruction21c, Instruction21h, Instruction21s, Instruction21t, Instruction22b,
+                       Instruction22c, Instruction22cs, Instruction22s, Instruction22t, Instruction22x, Instruction23x,
+                       Instruction30t, Instruction31c, Instruction31i, Instruction31t, Instruction32x, Instruction35c,
+                       Instruction35mi, Instruction35ms, Instruction3rc, Instruction3rmi, Instruction3rms,
+                       Instruction40sc, Instruction41c, Instruction51l, Instruction52c, Instruction5rc]
+
+
+def dispatchByMatch(_instructions: list[Instruction]) -> int:
+    """
+    Former dispatch: test the class of the instruction against each format, then compare its name
+    :param _instructions: The instructions to dispatch
+    :return: The number of wide instructions, so the work isn't optimised away
+    """
+    wide: int = 0
+    for instruction in _instructions:
+        for instructionType in FORMATS:
+            if isinstance(instruction, instructionType):
+                break
+        name: str = instruction.get_name()
+        if name[1:4] == 'get' and name.endswith('-wide'):
+            wide += 1
+    return wide
+
+
+def dispatchByTable(_instructions: list[Instruction]) -> int:
+    """
+    Opcode-indexed dispatch: one lookup for the handler, one for the traits
+    :param _instructions: The instructions to dispatch
+    :return: The number of wide instructions, so the work isn't optimised away
+    """
+    wide: int = 0
+    dispatch: list = Analyse1._dispatch
+    for instruction in _instructions:
+        op: int = instruction.get_op_value()
+        if op < OPCODE_COUNT:
+            _ = dispatch[op]
+            traits: int = OPCODE_TRAITS[op]
+            if traits & TRAIT_GET and traits & TRAIT_WIDE:
+                wide += 1
+    return wide
+
+
+def bench(_dispatch, _instructions: list[Instruction], _repeat: int) -> float:
+    """
+    :return: The best time per instruction, in nanoseconds
+    """
+    best: float = float('inf')
+    for _ in range(_repeat):
+        start: float = time.perf_counter()
+        _dispatch(_instructions)
+        best = min(best, time.perf_counter() - start)
+    return best / len(_instructions) * 1e9
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    repeat: int = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    instructions: list[Instruction] = []
+    for dalvikFormat in extractInfosFromAPK(sys.argv[1]).dalvikFormats:
+        for method in dalvikFormat.get_methods():
+            if method.get_code() is not None:
+                instructions.extend(method.get_instructions())
+    print(f'{len(instructions)} instructions')
+    print(f'match cascade: {bench(dispatchByMatch, instructions, repeat):.1f} ns/instruction')
+    print(f'opcode table:  {bench(dispatchByTable, instructions, repeat):.1f} ns/instruction')
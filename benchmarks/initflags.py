@@ -0,0 +1,119 @@
+"""
+Microbenchmark of the merge of the memories of analysis 2 at the entry of the basic blocks, on the classes of an APK
+calling the most constructors: registers packed as `type << 1 | initialised` and joined one by one by the lattice, and
+initialisation flags kept apart in one bitset per memory, merged with a single AND.
+
+Usage: python benchmarks/initflags.py <APK> [classes] [repeat]
+"""
+import gc
+import os
+import sys
+import time
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from androguard.core.bytecodes.dvm import ClassDefItem
+from analyser.analyse2 import Analyse2
+from analyser.analyser import Analyser
+from analyser.engine import _analyseMethodFlow
+from analyser.hierarchy import ClassHierarchy, buildClassHierarchy
+from analyser.ir import decodeInstructions
+from tools import extractInfosFromAPK, extractInfosFromMethod, APKInfos
+
+
+class TimedAnalyse2(Analyse2):
+    """
+    Analysis 2 with bitset initialisation flags, timing the merges of the predecessors
+    """
+    mergeTime: float = 0.0
+    merges: int = 0
+
+    def _mergePredecessor(self, *args, **kwargs) -> bool:
+        start: float = time.perf_counter()
+        try:
+            return super()._mergePredecessor(*args, **kwargs)
+        finally:
+            type(self).mergeTime += time.perf_counter() - start
+            type(self).merges += 1
+
+
+class PackedAnalyse2(TimedAnalyse2):
+    """
+    Analysis 2 with the initialisation flag packed in each register, joined register by register
+    """
+    mergeTime: float = 0.0
+    merges: int = 0
+    _newMemory = Analyser._newMemory
+    _mergeRegisters = Analyser._mergeRegisters
+
+
+def countConstructorCalls(_classDefItem: ClassDefItem) -> int:
+    """
+    :param _classDefItem: The class
+    :return: The number of constructors called by the methods of the class
+    """
+    calls: int = 0
+    for method in _classDefItem.get_methods():
+        if method.get_code() is not None:
+            calls += sum(1 for instruction in decodeInstructions(method.get_instructions())
+                         if instruction.method is not None and instruction.method[1] == '<init>')
+    return calls
+
+
+def analyseClasses(_analyserType: type[TimedAnalyse2], _classes: list[ClassDefItem], _apkInfos: APKInfos, _hierarchy: ClassHierarchy) -> float:
+    """
+    Analyse every method of the classes on its control flow graph, the methods stopped by an error being skipped
+    :return: The total time of the analyses, in seconds
+    """
+    gc.collect()
+    # The errors of the analyses are written on the standard error, silenced during the run
+    sys.stderr.flush()
+    standardError: int = os.dup(2)
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 2)
+    start: float = time.perf_counter()
+    try:
+        for classDefItem in _classes:
+            for method in classDefItem.get_methods():
+                if method.get_code() is None:
+                    continue
+                method.load()
+                analyser: TimedAnalyse2 = _analyserType(_apkInfos, extractInfosFromMethod(method), _hierarchy, False)
+                try:
+                    _analyseMethodFlow(analyser, method, False, False, None)
+                except (SystemExit, Exception):
+                    pass
+        return time.perf_counter() - start
+    finally:
+        sys.stderr.flush()
+        os.dup2(standardError, 2)
+        os.close(standardError)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    classCount: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    repeat: int = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    apkInfos: APKInfos = extractInfosFromAPK(sys.argv[1])
+    hierarchy: ClassHierarchy = buildClassHierarchy(apkInfos.dalvikFormats)
+    candidates: list[tuple[int, ClassDefItem]] = [(countConstructorCalls(classDefItem), classDefItem)
+                                                  for dalvikFormat in apkInfos.dalvikFormats
+                                                  for classDefItem in dalvikFormat.get_classes()]
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    classes: list[ClassDefItem] = [classDefItem for _, classDefItem in candidates[:classCount]]
+    print(f'{len(classes)} classes, {sum(calls for calls, _ in candidates[:classCount])} constructor calls')
+    variants: dict[type[TimedAnalyse2], str] = {PackedAnalyse2: 'packed registers', TimedAnalyse2: 'bitset flags    '}
+    # Best merge time and total time of each variant, the variants being run in turn so they run in the same conditions
+    best: dict[type[TimedAnalyse2], tuple[float, float]] = dict.fromkeys(variants, (float('inf'), float('inf')))
+    for _ in range(repeat):
+        for analyserType in variants:
+            analyserType.mergeTime = 0.0
+            analyserType.merges = 0
+            total: float = analyseClasses(analyserType, classes, apkInfos, hierarchy)
+            best[analyserType] = (min(best[analyserType][0], analyserType.mergeTime), min(best[analyserType][1], total))
+    for analyserType, name in variants.items():
+        mergeTime, total = best[analyserType]
+        print(f'{name}: {analyserType.merges} merges, {mergeTime * 1e6 / max(analyserType.merges, 1):.2f} µs/merge, '
+              f'{mergeTime * 1e3:.1f} ms merging, {total * 1e3:.1f} ms in total')
@@ -1,19 +1,16 @@
-from androguard.core.analysis.analysis import Analysis
 from androguard.core.bytecodes.dvm import ClassDefItem, DalvikVMFormat
+from analyser.budget import Budget
 from analyser.engine import analyse
-from tools import parse, extractInfosFromAPK, APKKeys, ClassDefItemNotFoundException, ExitCode, APKInfos
+from analyser.framework import FrameworkSnapshot, loadFrameworkSnapshot
+from analyser.hierarchy import ClassHierarchy, buildClassHierarchy
+from analyser.pool import getConstantPool
+from tools import parse, extractInfosFromAPK, ClassDefItemNotFoundException, ExitCode, APKInfos
 from tools.exceptions import exitException
 
-_analysis: Analysis = Analysis()
-
 
 def findCorrespondingClass(_ClassName: str, _dalvikFormats: list[DalvikVMFormat]) -> list[ClassDefItem]:
-    global _analysis
     foundItems: list[ClassDefItem] = []
     for dalvikFormat in _dalvikFormats:
-        # While searching for the class, create the analysis object
-        _analysis.add(dalvikFormat)
-
         for currentClass in dalvikFormat.get_classes():
             cleanedName: str = currentClass.get_name().split('/')[-1][:-1]
             if cleanedName == _ClassName:
@@ -24,11 +21,24 @@ def findCorrespondingClass(_ClassName: str, _dalvikFormats: list[DalvikVMFormat]
 
 
 if __name__ == '__main__':
-    pathToTheAPK, ClassNameToAnalyse, analyseTypeFlag, inputFile, verbose = parse()
+    pathToTheAPK, ClassNameToAnalyse, analyseTypeFlag, inputFile, verbose, fixpoint, liveness, sparse, preload, maxBlockVisits, maxVisits, deadline, widenAfter, reportMode, keepGoing = parse()
+    budget: Budget | None = None
+    if any(limit is not None for limit in (maxBlockVisits, maxVisits, deadline, widenAfter)):
+        budget = Budget(maxBlockVisits, maxVisits, deadline, widenAfter)
     infosOfTheAPK: APKInfos = extractInfosFromAPK(pathToTheAPK)
+    if preload:
+        for dalvikFormat in infosOfTheAPK.dalvikFormats:
+            getConstantPool(dalvikFormat.CM).preload()
+
+    # Target SDK of the manifest, None if it is missing or a codename
+    targetSdk: str | None = infosOfTheAPK.version
+    framework: FrameworkSnapshot | None = loadFrameworkSnapshot(int(targetSdk) if targetSdk is not None and str(targetSdk).isdigit() else None)
+    if verbose:
+        print(f'Framework snapshot: API {framework.apiLevel}' if framework is not None else 'No framework snapshot')
+    hierarchy: ClassHierarchy = buildClassHierarchy(infosOfTheAPK.dalvikFormats, framework)
 
     try:
-        classDefItems: list[ClassDefItem] = findCorrespondingClass(ClassNameToAnalyse, infosOfTheAPK[APKKeys.DALVIKVMFORMAT])
+        classDefItems: list[ClassDefItem] = findCorrespondingClass(ClassNameToAnalyse, infosOfTheAPK.dalvikFormats)
 
         if len(classDefItems) > 1:
             print('Multiple classes found')
@@ -36,6 +46,6 @@ if __name__ == '__main__':
                 print(f'\t{x}')
             exit(ExitCode.MULTIPLE_CLASSES_FOUND)
 
-        analyse(classDefItems[0], ClassNameToAnalyse, analyseTypeFlag, infosOfTheAPK, _analysis, inputFile, _verbose=verbose)
+        analyse(classDefItems[0], ClassNameToAnalyse, analyseTypeFlag, infosOfTheAPK, hierarchy, inputFile, _verbose=verbose, _straightLine=not fixpoint, _liveness=liveness, _sparse=sparse, _budget=budget, _reportMode=reportMode, _keepGoing=keepGoing)
     except ClassDefItemNotFoundException as e:
         exitException(e, ExitCode.CLASS_NOT_FOUND)
@@ -0,0 +1,106 @@
+"""
+Generate the snapshots of the framework class hierarchy read by the analyses (analyser/framework.py), from the
+android.jar of the Android SDK platforms. Only the superclass and the interfaces of each class are kept.
+
+Usage: python snapshots/generate.py <SDK platforms folder>
+       python snapshots/generate.py <android.jar> <API level>
+The first form writes a snapshot for each `android-<API level>/android.jar` of the folder.
+"""
+import struct
+import sys
+from os import listdir
+from os.path import dirname, abspath, join, isdir, isfile
+from zipfile import ZipFile
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from analyser.framework import SNAPSHOT_FOLDER, SNAPSHOT_NAME, writeSnapshot
+
+CLASS_MAGIC: int = 0xCAFEBABE
+# Size of the constant pool entries of each tag, without the tag, for the entries that aren't read (Utf8 entries have a
+# variable size)
+_CONSTANT_SIZES: dict[int, int] = {3: 4, 4: 4, 5: 8, 6: 8, 7: 2, 8: 2, 9: 4, 10: 4, 11: 4, 12: 4, 15: 3, 16: 2, 17: 4,
+                                   18: 4, 19: 2, 20: 2}
+_CONSTANT_UTF8: int = 1
+_CONSTANT_CLASS: int = 7
+# Long and double entries take two indexes of the constant pool
+_CONSTANT_WIDE: tuple[int, ...] = (5, 6)
+
+
+def readClassParents(_data: bytes) -> tuple[str, list[str]]:
+    """
+    Read the name, the superclass and the interfaces of a class from its class file.
+    :param _data: The content of the class file
+    :return: The descriptor of the class, and the descriptors of its superclass and interfaces
+    """
+    magic, _, _, constantCount = struct.unpack_from('>IHHH', _data, 0)
+    if magic != CLASS_MAGIC:
+        raise ValueError('Not a class file')
+    strings: dict[int, bytes] = {}
+    classes: dict[int, int] = {}
+    offset: int = 10
+    index: int = 1
+    while index < constantCount:
+        tag: int = _data[offset]
+        offset += 1
+        if tag == _CONSTANT_UTF8:
+            (length,) = struct.unpack_from('>H', _data, offset)
+            strings[index] = _data[offset + 2:offset + 2 + length]
+            offset += 2 + length
+        elif tag in _CONSTANT_SIZES:
+            if tag == _CONSTANT_CLASS:
+                (classes[index],) = struct.unpack_from('>H', _data, offset)
+            offset += _CONSTANT_SIZES[tag]
+        else:
+            raise ValueError(f'Unknown constant pool tag {tag}')
+        index += 2 if tag in _CONSTANT_WIDE else 1
+
+    def descriptor(_classIndex: int) -> str:
+        return 'L' + strings[classes[_classIndex]].decode('utf-8', 'replace') + ';'
+
+    _, thisClass, superClass, interfaceCount = struct.unpack_from('>HHHH', _data, offset)
+    interfaces: tuple[int, ...] = struct.unpack_from(f'>{interfaceCount}H', _data, offset + 8)
+    # Only java/lang/Object has no superclass
+    parents: list[str] = [descriptor(superClass)] if superClass != 0 else []
+    return descriptor(thisClass), parents + [descriptor(interface) for interface in interfaces]
+
+
+def readJarHierarchy(_jarPath: str) -> dict[str, list[str]]:
+    """
+    :param _jarPath: The path of the jar
+    :return: The superclass and the interfaces of each class of the jar
+    """
+    parents: dict[str, list[str]] = {}
+    with ZipFile(_jarPath) as jar:
+        for name in jar.namelist():
+            if name.endswith('.class') and not name.endswith('module-info.class'):
+                className, classParents = readClassParents(jar.read(name))
+                parents[className] = classParents
+    return parents
+
+
+def generate(_jarPath: str, _apiLevel: int) -> str:
+    """
+    :param _jarPath: The path of the android.jar of the API level
+    :param _apiLevel: The API level
+    :return: The path of the snapshot written
+    """
+    path: str = join(SNAPSHOT_FOLDER, SNAPSHOT_NAME.format(_apiLevel))
+    parents: dict[str, list[str]] = readJarHierarchy(_jarPath)
+    writeSnapshot(path, _apiLevel, parents)
+    print(f'API {_apiLevel}: {len(parents)} classes -> {path}')
+    return path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        generate(sys.argv[1], int(sys.argv[2]))
+    elif len(sys.argv) == 2 and isdir(sys.argv[1]):
+        for platform in sorted(listdir(sys.argv[1])):
+            jarPath: str = join(sys.argv[1], platform, 'android.jar')
+            level: str = platform.removeprefix('android-')
+            if level.isdigit() and isfile(jarPath):
+                generate(jarPath, int(level))
+    else:
+        print(__doc__, file=sys.stderr)
+        exit(1)
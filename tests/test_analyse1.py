@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from os.path import dirname, abspath, join
+
+from analyser.budget import Budget
+from analyser.engine import analyse
+from analyser.hierarchy import buildClassHierarchy
+from tools import extractInfosFromAPK, AnalysisErrorException, ExitCode
+
+APK_FOLDER: str = join(dirname(dirname(abspath(__file__))), 'APKs')
+
+
+class _MainActivityTest(unittest.TestCase):
+    """
+    Analysis of the `MainActivity` class of a sample APK, the report being written in a temporary directory.
+    """
+    apkName: str = 'Analyse1PredecessorsMergeConflict.apk'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.apkInfos = extractInfosFromAPK(join(APK_FOLDER, 'Analyse1', cls.apkName))
+        cls.hierarchy = buildClassHierarchy(cls.apkInfos.dalvikFormats)
+        cls.classDefItem = next(item for dalvikFormat in cls.apkInfos.dalvikFormats for item in dalvikFormat.get_classes()
+                                if item.get_name() == 'Lcom/example/testappsan/MainActivity;')
+
+    def setUp(self):
+        # The report is written in the working directory
+        self.previousDirectory = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
+
+    def tearDown(self):
+        os.chdir(self.previousDirectory)
+        self.directory.cleanup()
+
+
+class PredecessorsMergeErrorTest(_MainActivityTest):
+    """
+    The `if-ge` of `MainActivity.testIF` jumps over the call to `Boolean.toString`, so `v2` holds an int on one branch
+    and a String on the other when they merge.
+    """
+
+    def _analyse(self, **kwargs) -> AnalysisErrorException:
+        with self.assertRaises(AnalysisErrorException) as context:
+            analyse(self.classDefItem, 'MainActivity', 1, self.apkInfos, self.hierarchy, None, _verbose=False, **kwargs)
+        return context.exception
+
+    def test_merge_error(self):
+        error: AnalysisErrorException = self._analyse()
+        self.assertEqual(error.code, ExitCode.MEMORY_ERROR)
+        self.assertIn('Memory type mismatch', error.message)
+
+    def test_merge_error_fixpoint(self):
+        self.assertEqual(self._analyse(_straightLine=False).code, ExitCode.MEMORY_ERROR)
+
+    def test_merge_error_sparse(self):
+        self.assertEqual(self._analyse(_sparse=True).code, ExitCode.MEMORY_ERROR)
+
+    def test_merge_error_liveness(self):
+        self.assertEqual(self._analyse(_liveness=True).code, ExitCode.MEMORY_ERROR)
+
+
+class BudgetTest(_MainActivityTest):
+    """
+    Without any block visit allowed, the analysis of every method stops before its first instruction.
+    """
+
+    def _analyse(self, **kwargs) -> str:
+        analyse(self.classDefItem, 'MainActivity', 1, self.apkInfos, self.hierarchy, None, _verbose=False,
+                _budget=Budget(maxTotalVisits=0), **kwargs)
+        with open('MainActivity.report') as report:
+            return report.read()
+
+    def test_straight_line(self):
+        report: str = self._analyse()
+        self.assertEqual(report.count('Budget exceeded: more than 0 block visits'), len(self.classDefItem.get_methods()))
+
+    def test_fixpoint(self):
+        report: str = self._analyse(_straightLine=False)
+        self.assertEqual(report.count('Budget exceeded: more than 0 block visits'), len(self.classDefItem.get_methods()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from array import array
+
+from analyser.flow import FlowGraph, TryIndex, INDEX_TYPECODE, _addHandlerEdges
+
+
+class _Instruction:
+    # Only the opcode is read when adding the exception edges
+    def __init__(self, _op: int):
+        self._op = _op
+
+    def get_op_value(self) -> int:
+        return self._op
+
+
+def _buildFlow(_ops: list[int], _successors: list[list[int]], _tryEnd: int, _handler: int) -> FlowGraph:
+    """
+    Build the flow of instructions of 2 code units each, the instructions before `_tryEnd` being in a try range caught
+    by the instruction `_handler`
+    """
+    instructions: list[_Instruction] = [_Instruction(op) for op in _ops]
+    offsets: list[int] = [index * 4 for index in range(len(_ops))]
+    tryIndex: TryIndex = TryIndex(array(INDEX_TYPECODE, [0]), array(INDEX_TYPECODE, [_tryEnd * 4]), [[(offsets[_handler], None)]])
+    handlerTypes, entryHandlers = _addHandlerEdges(instructions, offsets, {offset: index for index, offset in enumerate(offsets)}, tryIndex, _successors)
+    return FlowGraph([None] * len(_ops), _successors, handlerTypes, entryHandlers)
+
+
+class EntryHandlerTest(unittest.TestCase):
+
+    def test_first_instruction_throws(self):
+        # new-instance, return-void, handler: move-exception, return-void
+        flow: FlowGraph = _buildFlow([0x22, 0x0e, 0x0d, 0x0e], [[1], [], [3], []], 1, 2)
+        self.assertEqual(flow.entryHandlers, {2: True})
+        handler: int = flow.blockCount() - 1
+        self.assertTrue(flow.isEntryHandler(handler))
+        # The edge only keeps the handler reachable, the handler receives the memory at the entry of the method
+        self.assertIn(handler, flow.blockSuccessors.get(0))
+        self.assertTrue(flow.isEntryOnlyEdge(0, handler))
+
+    def test_first_and_second_instructions_throw(self):
+        # new-instance, new-instance, return-void, handler: move-exception, return-void
+        flow: FlowGraph = _buildFlow([0x22, 0x22, 0x0e, 0x0d, 0x0e], [[1], [2], [], [4], []], 2, 3)
+        self.assertEqual(flow.entryHandlers, {3: False})
+        handler: int = flow.blockCount() - 1
+        self.assertTrue(flow.isEntryHandler(handler))
+        # The second instruction throws after the first one: the exit memory of the first instruction reaches the handler
+        self.assertFalse(flow.isEntryOnlyEdge(0, handler))
+
+
+if __name__ == '__main__':
+    unittest.main()
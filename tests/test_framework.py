@@ -0,0 +1,114 @@
+import importlib.util
+import struct
+import tempfile
+import unittest
+from os.path import dirname, abspath, exists, join
+from zipfile import ZipFile
+
+from analyser.framework import FrameworkSnapshot, SNAPSHOT_NAME, loadFrameworkSnapshot, writeSnapshot
+from analyser.hierarchy import ClassHierarchy
+
+SNAPSHOTS_FOLDER: str = join(dirname(dirname(abspath(__file__))), 'snapshots')
+
+# Framework classes of the jar, by their internal name: superclass and interfaces
+FRAMEWORK_CLASSES: dict[str, list[str]] = {
+    'android/content/Context': ['java/lang/Object'],
+    'android/content/ContextWrapper': ['android/content/Context'],
+    'android/view/ContextThemeWrapper': ['android/content/ContextWrapper'],
+    'android/app/Activity': ['android/view/ContextThemeWrapper', 'android/content/ComponentCallbacks2'],
+    'android/app/Application': ['android/content/ContextWrapper', 'android/content/ComponentCallbacks2'],
+    'android/content/ComponentCallbacks2': ['java/lang/Object', 'android/content/ComponentCallbacks'],
+}
+
+
+def _loadGenerator():
+    specification = importlib.util.spec_from_file_location('generate', join(SNAPSHOTS_FOLDER, 'generate.py'))
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+    return module
+
+
+def _buildClassFile(_name: str, _superclass: str, _interfaces: list[str]) -> bytes:
+    """
+    :return: A class file without fields, methods nor attributes
+    """
+    pool: list[bytes] = []
+    classIndexes: list[int] = []
+    for name in [_name, _superclass] + _interfaces:
+        encoded: bytes = name.encode()
+        pool.append(struct.pack('>BH', 1, len(encoded)) + encoded)
+        pool.append(struct.pack('>BH', 7, len(pool)))
+        classIndexes.append(len(pool))
+    return struct.pack('>IHHH', 0xCAFEBABE, 0, 52, len(pool) + 1) + b''.join(pool) \
+        + struct.pack('>HHHH', 0x0021, classIndexes[0], classIndexes[1], len(_interfaces)) \
+        + struct.pack(f'>{len(_interfaces)}H', *classIndexes[2:]) + struct.pack('>HHH', 0, 0, 0)
+
+
+class FrameworkSnapshotTest(unittest.TestCase):
+    """
+    A snapshot generated by `snapshots/generate.py` from a jar holding a part of the hierarchy of `Activity`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        jarPath: str = join(cls.directory.name, 'android.jar')
+        with ZipFile(jarPath, 'w') as jar:
+            for name, parents in FRAMEWORK_CLASSES.items():
+                jar.writestr(f'{name}.class', _buildClassFile(name, parents[0], parents[1:]))
+        writeSnapshot(join(cls.directory.name, SNAPSHOT_NAME.format(28)), 28, _loadGenerator().readJarHierarchy(jarPath))
+        cls.framework = loadFrameworkSnapshot(32, cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.framework.close()
+        cls.directory.cleanup()
+
+    def test_snapshot(self):
+        self.assertIsInstance(self.framework, FrameworkSnapshot)
+        self.assertEqual(self.framework.apiLevel, 28)
+        self.assertEqual(len(self.framework), len(FRAMEWORK_CLASSES))
+        self.assertEqual(self.framework.getParents('Landroid/app/Activity;'),
+                         ['Landroid/view/ContextThemeWrapper;', 'Landroid/content/ComponentCallbacks2;'])
+        self.assertIsNone(self.framework.getParents('Lcom/example/MainActivity;'))
+
+    def test_framework_subtype(self):
+        hierarchy: ClassHierarchy = ClassHierarchy({'Lcom/example/MainActivity;': ['Landroid/app/Activity;']}, self.framework)
+        ancestors: frozenset[str] = hierarchy.getAncestors('Lcom/example/MainActivity;')
+        self.assertIn('Landroid/content/Context;', ancestors)
+        self.assertIn('Landroid/content/ComponentCallbacks2;', ancestors)
+        # ComponentCallbacks is a parent of the framework which isn't one of its classes
+        self.assertEqual(hierarchy.getMissingAncestor('Lcom/example/MainActivity;'), 'Landroid/content/ComponentCallbacks;')
+        self.assertEqual(hierarchy.getClosestParent('Landroid/app/Application;', 'Lcom/example/MainActivity;'),
+                         'Landroid/content/ComponentCallbacks2;')
+
+
+@unittest.skipUnless(exists(join(SNAPSHOTS_FOLDER, SNAPSHOT_NAME.format(28))),
+                     'snapshots/android-28.hierarchy is generated from the android.jar of the Android SDK')
+class AndroidSnapshotTest(unittest.TestCase):
+    """
+    The snapshot of the sample APKs, generated by `snapshots/generate.py` from `<SDK>/platforms/android-28/android.jar`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # The sample APKs target the API level 31
+        cls.framework = loadFrameworkSnapshot(31, SNAPSHOTS_FOLDER)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.framework.close()
+
+    def test_snapshot(self):
+        self.assertEqual(self.framework.apiLevel, 28)
+        self.assertEqual(self.framework.getParents('Ljava/lang/Object;'), [])
+
+    def test_framework_subtype(self):
+        hierarchy: ClassHierarchy = ClassHierarchy({'Lcom/example/testappsan/MainActivity;': ['Landroid/app/Activity;']}, self.framework)
+        self.assertIn('Landroid/content/Context;', hierarchy.getAncestors('Lcom/example/testappsan/MainActivity;'))
+        self.assertIsNone(hierarchy.getMissingAncestor('Lcom/example/testappsan/MainActivity;'))
+        self.assertIn('Ljava/util/List;', hierarchy.getAncestors('Ljava/util/ArrayList;'))
+
+
+if __name__ == '__main__':
+    unittest.main()
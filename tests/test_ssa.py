@@ -0,0 +1,37 @@
+import unittest
+
+from analyser.flow import FlowGraph
+from analyser.ir import DecodedInstruction
+from analyser.ssa import SSAForm
+
+
+def _instruction(_op: int, _registers: list[int], _method: tuple | None = None) -> DecodedInstruction:
+    # Only the fields read by the phi placement are set
+    instruction: DecodedInstruction = DecodedInstruction.__new__(DecodedInstruction)
+    instruction.op = _op
+    instruction.method = _method
+    instruction._registers = _registers
+    return instruction
+
+
+class PhiPlacementTest(unittest.TestCase):
+
+    def test_constructor_receiver_gets_a_phi(self):
+        constructor: tuple = ('Ljava/lang/Object;', '<init>', [], 'V')
+        instructions: list[DecodedInstruction] = [
+            _instruction(0x22, [0]),                # new-instance v0
+            _instruction(0x38, [1]),                # if-eqz v1
+            _instruction(0x70, [0], constructor),   # invoke-direct {v0}, <init>
+            _instruction(0x28, []),                 # goto
+            _instruction(0x70, [0], constructor),   # invoke-direct {v0}, <init>
+            _instruction(0x0e, []),                 # return-void
+        ]
+        flow: FlowGraph = FlowGraph(instructions, [[1], [2, 4], [3], [5], [5], []])
+        ssa: SSAForm = SSAForm(flow, 2)
+        join: int = flow.blockCount() - 1
+        self.assertEqual(flow.getBlockLeader(join), instructions[5])
+        self.assertIn(0, ssa.phis[join])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 from .parser import parse
-from .extractor import extractInfosFromAPK, extractInfosFromMethod, APKKeys, APKInfos, printAPKInfos, MethodKeys, printMethodInfos, MethodInfos, humanTypeToSmaliType
-from .exceptions import ClassDefItemNotFoundException, ExitCode, exitError, Colors
+from .extractor import extractInfosFromAPK, extractInfosFromMethod, APKInfos, printAPKInfos, printMethodInfos, MethodInfos, humanTypeToSmaliType
+from .exceptions import ClassDefItemNotFoundException, BudgetExceededException, AnalysisErrorException, ExitCode, exitError, Colors
 from .utils import getOffsetFromGoto, getOffsetFromIf
 from .constants import *
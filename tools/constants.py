@@ -19,6 +19,7 @@ HUMAN_DOUBLE_TYPE: str = 'double'
 PRIMITIVE_TYPES: list[str] = [SMALI_VOID_TYPE, SMALI_BOOLEAN_TYPE, SMALI_BYTE_TYPE, SMALI_SHORT_TYPE, SMALI_CHAR_TYPE, SMALI_INT_TYPE, SMALI_LONG_TYPE, SMALI_FLOAT_TYPE, SMALI_DOUBLE_TYPE]
 SMALI_STRING_TYPE: str = 'Ljava/lang/String;'
 SMALI_OBJECT_TYPE: str = 'Ljava/lang/Object;'
+SMALI_THROWABLE_TYPE: str = 'Ljava/lang/Throwable;'
 SMALI_INTENT_TYPE: str = 'Landroid/content/Intent;'
 SMALI_TARGETED_INTENT_CONSTRUCTOR: str = 'Landroid/content/Intent;-><init>(Ljava/lang/String;)V'
 SMALI_ARRAY_MARKER: str = '['
@@ -31,4 +32,8 @@ ACCESS_PROTECTED: str = 'protected'
 ACCESS_PUBLIC: str = 'public'
 ACCESS_SYNCHRONIZED: str = 'synchronized'
 REPORT_DELIMITER: str = '********************************************************************************'
+REPORT_FULL: str = 'full'
+REPORT_FINAL: str = 'final'
+REPORT_VERDICT: str = 'verdict'
+REPORT_MODES: list[str] = [REPORT_FULL, REPORT_FINAL, REPORT_VERDICT]
 
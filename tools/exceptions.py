@@ -6,6 +6,10 @@ class ClassDefItemNotFoundException(Exception):
     pass
 
 
+class BudgetExceededException(Exception):
+    pass
+
+
 class ExitCode(Enum):
     EXIT_SUCCESS = 0
     FILE_NOT_FOUND = auto()
@@ -41,6 +45,17 @@ class ExitCode(Enum):
     NO_MEMORY = auto()
     MEMORY_ERROR = auto()
     UNINITIALISED_OBJECT = auto()
+    MULTIPLE_ERRORS = auto()
+
+
+class AnalysisErrorException(SystemExit):
+    """
+    Error found by an analysis: it exits the program with its code, unless it is caught to go on with the other methods
+    """
+
+    def __init__(self, _msg: str, _code: ExitCode):
+        super().__init__(_code)
+        self.message = _msg
 
 
 class Colors:
@@ -51,7 +66,7 @@ class Colors:
 
 def exitError(_msg: str, _code: ExitCode):
     print(_msg, file=stderr)
-    exit(_code)
+    raise AnalysisErrorException(_msg, _code)
 
 
 def exitException(_ex: Exception, _code: ExitCode):
@@ -1,98 +1,131 @@
 from sys import stdout
-from typing import Any
+from typing import Any, TextIO
 from androguard.core.bytecodes.apk import APK
 from androguard.core.bytecodes.dvm import DalvikVMFormat, EncodedMethod
-from enum import Enum, auto
 from .exceptions import ExitCode, exitException
 from .constants import *
 
 
-class APKKeys(Enum):
-    APK = auto()
-    PATH = auto()
-    NAME = auto()
-    VERSION = auto()
-    PERMISSIONS = auto()
-    PERMISSIONSDETAILS = auto()
-    DECLAREDPERMISSIONS = auto()
-    DETAILEDDECLAREDPERMISSIONS = auto()
-    ACTIVITIES = auto()
-    DALVIKVMFORMAT = auto()
-
-
-APKInfos: type = dict[APKKeys, Any]
-
-
-def printAPKInfos(_infos: APKInfos):
+class APKInfos:
+    """
+    Informations extracted from an APK
+    """
+    __slots__ = ('apk', 'path', 'name', 'version', 'permissions', 'permissionsDetails', 'declaredPermissions',
+                 'detailedDeclaredPermissions', 'activities', 'dalvikFormats')
+    apk: APK
+    path: str
+    name: str
+    # Target SDK of the manifest, None if it is missing
+    version: str | None
+    permissions: list[str]
+    permissionsDetails: dict[str, list[str]]
+    declaredPermissions: list[str]
+    detailedDeclaredPermissions: dict[str, dict[str, Any]]
+    activities: list[str]
+    dalvikFormats: list[DalvikVMFormat]
+
+    def __init__(self, apk: APK, path: str):
+        self.apk = apk
+        self.path = path
+        self.name = apk.get_app_name()
+        self.version = apk.get_target_sdk_version()
+        self.permissions = apk.get_permissions()
+        self.permissionsDetails = apk.get_details_permissions()
+        self.declaredPermissions = apk.get_declared_permissions()
+        self.detailedDeclaredPermissions = apk.get_declared_permissions_details()
+        self.activities = apk.get_activities()
+        self.dalvikFormats = [DalvikVMFormat(dex, using_api=self.version) for dex in apk.get_all_dex()]
+
+
+def printAPKInfos(_infos: APKInfos, _file: TextIO | None = None):
+    """
+    :param _infos: The infos of the APK
+    :param _file: The file to print the infos to, None for the standard output
+    """
     print(
         f'APK Infos:',
-        f'\n\tName: {_infos[APKKeys.NAME]}',
-        f'\n\tPath: {_infos[APKKeys.PATH]}',
-        f'\n\tVersion: {_infos[APKKeys.VERSION]}',
-        f'\n\tPermissions: {_infos[APKKeys.PERMISSIONS]}',
-        f'\n\tDetailed Permissions: {_infos[APKKeys.PERMISSIONSDETAILS]}',
-        f'\n\tDeclared Permissions: {_infos[APKKeys.DECLAREDPERMISSIONS]}',
-        f'\n\tDetailed Declared Permissions: {_infos[APKKeys.DETAILEDDECLAREDPERMISSIONS]}',
-        f'\n\tActivities: {_infos[APKKeys.ACTIVITIES]}',
-        f'\n\tDalvikVMFormat: {_infos[APKKeys.DALVIKVMFORMAT]}'
+        f'\n\tName: {_infos.name}',
+        f'\n\tPath: {_infos.path}',
+        f'\n\tVersion: {_infos.version}',
+        f'\n\tPermissions: {_infos.permissions}',
+        f'\n\tDetailed Permissions: {_infos.permissionsDetails}',
+        f'\n\tDeclared Permissions: {_infos.declaredPermissions}',
+        f'\n\tDetailed Declared Permissions: {_infos.detailedDeclaredPermissions}',
+        f'\n\tActivities: {_infos.activities}',
+        f'\n\tDalvikVMFormat: {_infos.dalvikFormats}',
+        file=_file
     )
 
 
 def extractInfosFromAPK(_APKPath: str) -> APKInfos:
     try:
-        apk = APK(_APKPath)
-        return {
-            APKKeys.APK: apk,
-            APKKeys.PATH: _APKPath,
-            APKKeys.NAME: apk.get_app_name(),
-            APKKeys.VERSION: apk.get_target_sdk_version(),
-            APKKeys.PERMISSIONS: apk.get_permissions(),
-            APKKeys.PERMISSIONSDETAILS: apk.get_details_permissions(),
-            APKKeys.DECLAREDPERMISSIONS: apk.get_declared_permissions(),
-            APKKeys.DETAILEDDECLAREDPERMISSIONS: apk.get_declared_permissions_details(),
-            APKKeys.ACTIVITIES: apk.get_activities(),
-            APKKeys.DALVIKVMFORMAT: [
-                DalvikVMFormat(dex, using_api=apk.get_target_sdk_version()) for dex in apk.get_all_dex()
-            ]
-        }
+        return APKInfos(APK(_APKPath), _APKPath)
 
     except FileNotFoundError as e:
         exitException(e, ExitCode.FILE_NOT_FOUND)
 
 
-class MethodKeys(Enum):
-    CLASSNAME = auto()
-    NAME = auto()
-    CONSTRUCTOR = auto()
-    STATIC = auto()
-    FINAL = auto()
-    SYNCHRONIZED = auto()
-    ACCESS = auto()
-    LOCALREGISTERCOUNT = auto()
-    LOCALREGISTER = auto()
-    PARAMETERCOUNT = auto()
-    PARAMS = auto()
-    RETURNTYPE = auto()
-
-
-MethodInfos: type = dict[MethodKeys, Any]
+class MethodInfos:
+    """
+    Informations extracted from a method, with the register layout the analyses check on every register access
+    already computed
+    """
+    __slots__ = ('className', 'name', 'constructor', 'static', 'final', 'synchronized', 'access', 'localRegisterCount',
+                 'localRegisters', 'parameterCount', 'parameters', 'returnType', 'registerCount', 'thisRegister')
+    # Name of the class, without the trailing ';'
+    className: str
+    name: str
+    constructor: bool
+    static: bool
+    final: bool
+    synchronized: bool
+    access: str
+    localRegisterCount: int
+    # First and last local registers
+    localRegisters: tuple[int, int]
+    parameterCount: int
+    # Register and type of each parameter
+    parameters: list[tuple[int, str]]
+    returnType: str
+    # Number of registers of the method, local registers and parameters
+    registerCount: int
+    # Register holding `this` (last local register), None for a static method
+    thisRegister: int | None
+
+    def __init__(self, className: str, name: str, constructor: bool, static: bool, final: bool, synchronized: bool,
+                 access: str, localRegisterCount: int, localRegisters: tuple[int, int], parameters: list[tuple[int, str]],
+                 returnType: str):
+        self.className = className
+        self.name = name
+        self.constructor = constructor
+        self.static = static
+        self.final = final
+        self.synchronized = synchronized
+        self.access = access
+        self.localRegisterCount = localRegisterCount
+        self.localRegisters = localRegisters
+        self.parameterCount = len(parameters)
+        self.parameters = parameters
+        self.returnType = returnType
+        self.registerCount = localRegisterCount + self.parameterCount
+        self.thisRegister = localRegisterCount - 1 if localRegisterCount > 0 and not static else None
 
 
 def printMethodInfos(_infos: MethodInfos):
     print(
         f'Method Infos:',
-        f'\n\tClass: {_infos[MethodKeys.CLASSNAME]}',
-        f'\n\tName: {_infos[MethodKeys.NAME]}',
-        f'\n\tConstructor: {_infos[MethodKeys.CONSTRUCTOR]}',
-        f'\n\tStatic: {_infos[MethodKeys.STATIC]}',
-        f'\n\tFinal: {_infos[MethodKeys.FINAL]}',
-        f'\n\tSynchronized: {_infos[MethodKeys.SYNCHRONIZED]}',
-        f'\n\tAccess: {_infos[MethodKeys.ACCESS]}',
-        f'\n\tLocal Register Count: {_infos[MethodKeys.LOCALREGISTERCOUNT]}',
-        f'\n\tLocal Register: {_infos[MethodKeys.LOCALREGISTER]}',
-        f'\n\tParameter Count: {_infos[MethodKeys.PARAMETERCOUNT]}',
-        f'\n\tParameters: {_infos[MethodKeys.PARAMS]}',
-        f'\n\tReturn Type: {_infos[MethodKeys.RETURNTYPE]}\n'
+        f'\n\tClass: {_infos.className}',
+        f'\n\tName: {_infos.name}',
+        f'\n\tConstructor: {_infos.constructor}',
+        f'\n\tStatic: {_infos.static}',
+        f'\n\tFinal: {_infos.final}',
+        f'\n\tSynchronized: {_infos.synchronized}',
+        f'\n\tAccess: {_infos.access}',
+        f'\n\tLocal Register Count: {_infos.localRegisterCount}',
+        f'\n\tLocal Register: {_infos.localRegisters}',
+        f'\n\tParameter Count: {_infos.parameterCount}',
+        f'\n\tParameters: {_infos.parameters}',
+        f'\n\tReturn Type: {_infos.returnType}\n'
     )
 
 
@@ -152,17 +185,16 @@ def extractInfosFromMethod(_method: EncodedMethod) -> MethodInfos:
     accessFlags = _method.get_access_flags_string()
     acces = 'Private' if ACCESS_PRIVATE in accessFlags else 'Public' if ACCESS_PUBLIC in accessFlags else 'Protected' if ACCESS_PROTECTED in accessFlags else 'Package'
 
-    return {
-        MethodKeys.CLASSNAME: _method.get_class_name().removesuffix(';'),
-        MethodKeys.NAME: _method.get_name(),
-        MethodKeys.STATIC: ACCESS_STATIC in accessFlags,
-        MethodKeys.CONSTRUCTOR: ACCESS_CONSTRUCTOR in accessFlags,
-        MethodKeys.FINAL: ACCESS_FINAL in accessFlags,
-        MethodKeys.SYNCHRONIZED: ACCESS_SYNCHRONIZED in accessFlags,
-        MethodKeys.ACCESS: acces,
-        MethodKeys.LOCALREGISTERCOUNT: _method.get_locals() + 1,
-        MethodKeys.LOCALREGISTER: registerInformations['registers'],
-        MethodKeys.PARAMETERCOUNT: len(registerInformations['params']) if 'params' in registerInformations.keys() else 0,
-        MethodKeys.PARAMS: _humanParametersTypesToSmaliTypes(registerInformations['params']) if 'params' in registerInformations.keys() else [],
-        MethodKeys.RETURNTYPE: humanTypeToSmaliType(registerInformations['return'])
-    }
+    return MethodInfos(
+        className=_method.get_class_name().removesuffix(';'),
+        name=_method.get_name(),
+        constructor=ACCESS_CONSTRUCTOR in accessFlags,
+        static=ACCESS_STATIC in accessFlags,
+        final=ACCESS_FINAL in accessFlags,
+        synchronized=ACCESS_SYNCHRONIZED in accessFlags,
+        access=acces,
+        localRegisterCount=_method.get_locals() + 1,
+        localRegisters=registerInformations['registers'],
+        parameters=_humanParametersTypesToSmaliTypes(registerInformations['params']) if 'params' in registerInformations.keys() else [],
+        returnType=humanTypeToSmaliType(registerInformations['return'])
+    )
@@ -1,7 +1,9 @@
 from argparse import ArgumentParser
 
+from .constants import REPORT_MODES, REPORT_FULL
 
-def parse() -> (str, str, int, str | None, bool):
+
+def parse() -> (str, str, int, str | None, bool, bool, bool, bool, bool, int | None, int | None, float | None, int | None, str, bool):
     parser: ArgumentParser = ArgumentParser()
 
     parser.add_argument('APKFile', type=str, help='Path to the APK file to analyse')
@@ -9,7 +11,18 @@ def parse() -> (str, str, int, str | None, bool):
     parser.add_argument('Flag', type=int, help='Type of analyse', choices=[1, 2, 3])
     parser.add_argument('-i', '--input', dest='File', type=str, help='Path to the input file (Analyse 3)')
     parser.add_argument('-v', "--verbose", dest='Verbose', action='store_true', help='Verbose mode')
+    parser.add_argument('-f', '--fixpoint', dest='Fixpoint', action='store_true', help='Analyse methods without branches on their control flow graph too')
+    parser.add_argument('-l', '--liveness', dest='Liveness', action='store_true', help='Only merge the live registers at the entry of the basic blocks')
+    parser.add_argument('-s', '--sparse', dest='Sparse', action='store_true', help='Analyse methods on their SSA form (analyses 1 and 2)')
+    parser.add_argument('-p', '--preload', dest='Preload', action='store_true', help='Resolve all the methods, fields and types of the dex files before the analysis')
+    parser.add_argument('--max-block-visits', dest='MaxBlockVisits', type=int, metavar='N', help='Stop the analysis of a method when one of its blocks is visited more than N times')
+    parser.add_argument('--max-visits', dest='MaxVisits', type=int, metavar='N', help='Stop the analysis of a method after N block visits')
+    parser.add_argument('--deadline', dest='Deadline', type=float, metavar='SECONDS', help='Stop the analysis of a method after SECONDS seconds')
+    parser.add_argument('--widen-after', dest='WidenAfter', type=int, metavar='N', help='Widen the loop heads visited more than N times to the top type')
+    parser.add_argument('-r', '--report', dest='Report', choices=REPORT_MODES, default=REPORT_FULL, help='Report the state before each instruction at every visit (full), once the analysis converged (final), or only the verdict of each method (verdict)')
+    parser.add_argument('-k', '--keep-going', dest='KeepGoing', action='store_true', help='Record the errors of the analyses 1 and 2 and go on with the next methods instead of stopping at the first one')
 
     args = parser.parse_args()
 
-    return args.APKFile, args.Class, args.Flag, args.File, args.Verbose
+    return args.APKFile, args.Class, args.Flag, args.File, args.Verbose, args.Fixpoint, args.Liveness, args.Sparse, args.Preload, \
+        args.MaxBlockVisits, args.MaxVisits, args.Deadline, args.WidenAfter, args.Report, args.KeepGoing